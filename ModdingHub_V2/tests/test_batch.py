@@ -0,0 +1,146 @@
+"""Tests for batch runs (tw1_hub_batch)."""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+from tw1_hub_core import Tool
+from tw1_hub_batch import BatchRun, batch_inputs, find_inputs
+
+# Writes <stem>.obj next to the input; "fail" inputs exit 3, "slow" ones sleep past the timeout
+CONVERTER = """import os, sys, time
+path = sys.argv[1]
+text = open(path).read()
+if text == "fail":
+    sys.exit(3)
+if text == "slow":
+    time.sleep(30)
+open(os.path.splitext(path)[0] + ".obj", "w").write(text)
+print("converted", os.path.basename(path))
+"""
+
+TOOL = Tool({"id": "vdf_to_obj", "name": "VDF to OBJ", "type": "python", "formats": [".vdf", ".obj"],
+             "batch": {"inputs": [".vdf"]}})
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="tw1hub_test_")
+        self.addCleanup(shutil.rmtree, self.root)
+        self.folder = os.path.join(self.root, "Models [backup]")
+        os.makedirs(os.path.join(self.folder, "sub"))
+        self.tool_path = os.path.join(self.root, "convert.py")
+        with open(self.tool_path, "w", encoding="utf-8") as f:
+            f.write(CONVERTER)
+        for name in ("a.vdf", "b.vdf", "sub/c.vdf"):
+            self.write(name, name)
+        self.write("readme.txt", "not an input")
+
+    def write(self, name, text):
+        with open(os.path.join(self.folder, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def batch(self, **kwargs):
+        kwargs.setdefault("workers", 2)
+        return BatchRun(TOOL, self.tool_path, self.folder, **kwargs)
+
+    def manifest(self, run):
+        with open(run.manifest_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_batch_inputs(self):
+        self.assertEqual(batch_inputs(TOOL), [".vdf"])
+        self.assertEqual(batch_inputs(Tool({"id": "x", "formats": [".lnd"]})), [])
+        self.assertEqual(batch_inputs({"batch": {"args": ["{input}"]}, "formats": ["LND"]}), [".lnd"])
+
+    def test_finds_inputs_in_a_folder_with_glob_characters(self):
+        names = [os.path.relpath(p, self.folder) for p in find_inputs(TOOL, self.folder)]
+        self.assertEqual(names, ["a.vdf", "b.vdf", os.path.join("sub", "c.vdf")])
+        self.assertEqual(len(find_inputs(TOOL, self.folder, "*.vdf")), 2)
+
+    def test_converts_every_file_and_records_it(self):
+        run = self.batch()
+        progress = []
+        run.on_progress = lambda job, counts: progress.append(counts)
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts, {"done": 3, "skipped": 0, "failed": 0, "total": 3})
+        self.assertEqual(len(progress), 3)
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "sub", "c.obj")))
+        header, *entries = self.manifest(run)
+        self.assertEqual(header["tool"], "vdf_to_obj")
+        self.assertEqual(sorted(e["input"] for e in entries), ["a.vdf", "b.vdf", os.path.join("sub", "c.vdf")])
+        with open(run.log_path, encoding="utf-8") as f:
+            self.assertIn("converted c.vdf", f.read())
+
+    def test_resume_skips_finished_unchanged_files(self):
+        self.write("b.vdf", "fail")
+        self.assertFalse(self.batch(retries=0).run())
+
+        self.write("b.vdf", "fixed")
+        run = self.batch()
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts, {"done": 1, "skipped": 2, "failed": 0, "total": 3})
+
+        self.write("a.vdf", "edited")
+        run = self.batch()
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts["done"], 1)
+
+        run = self.batch(fresh=True)
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts["done"], 3)
+
+    def test_changed_command_line_starts_over(self):
+        self.batch().run()
+        tool = Tool(dict(TOOL.as_dict(), batch={"inputs": [".vdf"], "args": ["{input}", "--fast"]}))
+        run = BatchRun(tool, self.tool_path, self.folder)
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts["done"], 3)
+
+    def test_torn_manifest_line_is_ignored(self):
+        run = self.batch()
+        run.run()
+        with open(run.manifest_path, "a", encoding="utf-8") as f:
+            f.write('{"input": "a.vd')
+        run = self.batch()
+        run.run()
+        self.assertEqual(run.counts["skipped"], 3)
+
+    def test_retries_and_timeouts(self):
+        self.write("a.vdf", "fail")
+        self.write("b.vdf", "slow")
+        run = self.batch(workers=3, retries=1, timeout=0.5)
+        self.assertFalse(run.run())
+        states = {os.path.basename(job.input): (job.state, job.attempts) for job in run.jobs}
+        self.assertEqual(states, {"a.vdf": ("failed", 2), "b.vdf": ("timeout", 2), "c.vdf": ("done", 1)})
+        self.assertEqual(run.jobs[0].exit, 3)
+
+    def test_vanished_input_fails_only_that_file(self):
+        run = self.batch()
+        os.remove(os.path.join(self.folder, "a.vdf"))
+        self.assertFalse(run.run())
+        self.assertEqual(run.counts, {"done": 2, "skipped": 0, "failed": 1, "total": 3})
+        failed = [e for e in self.manifest(run)[1:] if e["state"] == "failed"]
+        self.assertEqual([e["input"] for e in failed], ["a.vdf"])
+
+    def test_cancel_leaves_unfinished_files_for_the_next_run(self):
+        self.write("a.vdf", "slow")
+        run = self.batch(workers=1, timeout=60)
+        timer = threading.Timer(0.5, run.cancel)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertFalse(run.run())
+        self.assertEqual(run.counts["done"], 0)
+        self.assertEqual(len(self.manifest(run)), 1)       # just the header
+
+        self.write("a.vdf", "a.vdf")
+        run = self.batch()
+        self.assertTrue(run.run())
+        self.assertEqual(run.counts["done"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
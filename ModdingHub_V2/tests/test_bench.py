@@ -0,0 +1,95 @@
+"""Tests for the benchmark's baseline regression check (tw1_hub_bench)."""
+
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import contextlib
+
+from tw1_hub_core import PROFILER
+from tw1_hub_bench import regressions, measure, main
+
+# A tiny workspace: the tests check the plumbing, not the numbers
+SMALL = ["--tools", "8", "--guides", "2", "--guide-kb", "1", "--depth", "1", "--fanout", "2",
+         "--repeat", "1", "--only", "config.load", "all_tools"]
+
+
+def _report(**p50s):
+    return {"results": {name.replace("_", "."): {"p50_ms": ms} for name, ms in p50s.items()}}
+
+
+class RegressionsTest(unittest.TestCase):
+    def test_only_slowdowns_beyond_the_tolerance(self):
+        baseline = _report(config_load=1.0, all_tools=2.0, search_tools=0.5)
+        report = _report(config_load=1.2, all_tools=3.0, search_tools=0.4)
+        self.assertEqual(regressions(report, baseline, 0.25), [("all.tools", 2.0, 3.0)])
+        self.assertEqual(regressions(report, baseline, 0.1), [("config.load", 1.0, 1.2), ("all.tools", 2.0, 3.0)])
+
+    def test_new_and_zero_baseline_paths_are_ignored(self):
+        self.assertEqual(regressions(_report(config_load=5.0, new_path=9.0), _report(config_load=0.0), 0.0), [])
+
+
+class MeasureTest(unittest.TestCase):
+    def tearDown(self):
+        PROFILER.disable()
+        PROFILER.reset()
+
+    def test_counts_stats_in_the_profiled_run(self):
+        times, counters = measure(lambda: None, lambda _: os.stat(__file__), 3)
+        self.assertEqual(len(times), 3)
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(counters.get("os.stat"), 1)
+        self.assertFalse(PROFILER.enabled)
+
+    def test_leaves_an_enabled_profiler_enabled(self):
+        PROFILER.enable()
+        measure(lambda: None, lambda _: None, 1)
+        self.assertTrue(PROFILER.enabled)
+
+
+class BaselineTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.mkdtemp(prefix="tw1hub_test_")
+        self.addCleanup(shutil.rmtree, folder)
+        self.baseline = os.path.join(folder, "baseline.json")
+
+    def run_main(self, *args):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            code = main(SMALL + list(args))
+        return code, out.getvalue()
+
+    def test_save_then_compare(self):
+        code, _ = self.run_main("--save", self.baseline)
+        self.assertEqual(code, 0)
+        with open(self.baseline, encoding="utf-8") as f:
+            saved = json.load(f)
+        names = set(saved["results"])
+        self.assertLessEqual({"config.load", "all_tools"}, names)     # --only matches name prefixes
+
+        # Everything "was" much faster: every path is reported and the exit code is 1
+        for result in saved["results"].values():
+            result["p50_ms"] = 1e-6
+        with open(self.baseline, "w", encoding="utf-8") as f:
+            json.dump(saved, f)
+        code, out = self.run_main("--baseline", self.baseline, "--json")
+        self.assertEqual(code, 1)
+        self.assertEqual({r["name"] for r in json.loads(out)["regressions"]}, names)
+
+        # ...and much slower: nothing to report
+        for result in saved["results"].values():
+            result["p50_ms"] = 1e6
+        with open(self.baseline, "w", encoding="utf-8") as f:
+            json.dump(saved, f)
+        self.assertEqual(self.run_main("--baseline", self.baseline)[0], 0)
+
+    def test_unreadable_baseline(self):
+        with open(self.baseline, "w", encoding="utf-8") as f:
+            f.write("not json")
+        self.assertEqual(self.run_main("--baseline", self.baseline)[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
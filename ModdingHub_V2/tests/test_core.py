@@ -0,0 +1,246 @@
+"""Tests for the headless parts of tw1_hub_core.
+
+Run from ModdingHub_V2 with `python -m unittest discover tests` (or pytest).
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from tw1_hub_core import (
+    Tool, SearchEngine, Catalog, ConfigStore, TOOL_FIELDS, CONFIG_BACKUP_SUFFIX,
+    load_config, save_config, _merge_config,
+)
+
+
+def _tool(tool_id, name, desc="", formats=()):
+    return Tool({"id": tool_id, "name": name, "desc_en": desc, "formats": list(formats)})
+
+
+class SearchEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.tools = [
+            _tool("wd_repacker", "WD Repacker", "pack and unpack wd archives", [".wd"]),
+            _tool("par_tool", "PAR Editor", "edit parameter tables", [".par"]),
+            _tool("lnd_export", "LND Objects Exporter", "export objects of a map", [".lnd"]),
+            _tool("notes", "Notes", "mentions a wd archive once in passing"),
+        ]
+        self.engine = SearchEngine(TOOL_FIELDS)
+        self.engine.build(self.tools)
+
+    def ids(self, query, **kwargs):
+        return [tool.id for tool in self.engine.search(query, **kwargs)]
+
+    def test_name_hit_ranks_above_description_hit(self):
+        self.assertEqual(self.ids("wd")[:2], ["wd_repacker", "notes"])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.ids("pack wd"), ["wd_repacker"])
+        self.assertEqual(self.ids("pack par"), [])
+
+    def test_prefix_matches(self):
+        self.assertEqual(self.ids("repack"), ["wd_repacker"])
+        self.assertEqual(self.ids("export"), ["lnd_export"])
+
+    def test_typo_within_edit_distance(self):
+        self.assertEqual(self.ids("parameterr"), ["par_tool"])
+        self.assertEqual(self.ids("exproter"), ["lnd_export"])
+
+    def test_short_words_are_not_fuzzy(self):
+        self.assertEqual(self.ids("pxr"), [])
+
+    def test_empty_query_and_limit(self):
+        self.assertEqual(self.ids("  "), [])
+        self.assertEqual(len(self.ids("wd", limit=1)), 1)
+
+    def test_rebuild_replaces_the_index(self):
+        self.engine.build(self.tools[:1])
+        self.assertEqual(self.ids("par"), [])
+        self.assertEqual(self.ids("wd"), ["wd_repacker"])
+
+    def test_plain_dicts_are_searchable(self):
+        engine = SearchEngine(TOOL_FIELDS)
+        engine.build([{"id": "x", "name": "Texture Converter", "formats": [".dds"]}])
+        self.assertEqual([item["id"] for item in engine.search("textur")], ["x"])
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.guides_dir = tempfile.mkdtemp(prefix="tw1hub_test_")
+        self.addCleanup(shutil.rmtree, self.guides_dir)
+        self.write_guide("my_notes_en.txt")
+        self.write_guide("my_notes_de.txt")
+        self.cfg = {
+            "user_tools": [{"id": "test_tool", "name": "Test Tool", "filename": "test_tool.py",
+                            "formats": ["TST", ".tex"], "tags": ["Mesh"], "guide_ids": ["test_guide"]}],
+            "user_guides": [{"id": "test_guide", "title_en": "Test Guide", "tags": ["mesh"],
+                             "tool_ids": ["test_tool"], "content_en": "text"}],
+        }
+        self.catalog = Catalog(self.cfg, self.guides_dir)
+        self.catalog.refresh()
+
+    def write_guide(self, name):
+        path = os.path.join(self.guides_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("guide text\n")
+        # The catalog re-scans on a changed folder mtime; don't depend on timestamp granularity
+        stamp = os.stat(self.guides_dir).st_mtime_ns + 1_000_000_000
+        os.utime(self.guides_dir, ns=(stamp, stamp))
+
+    def test_indexes(self):
+        tool = self.catalog.tool_by_id["test_tool"]
+        self.assertTrue(tool.custom)
+        self.assertIs(self.catalog.tool("TEST_TOOL.PY"), tool)
+        self.assertIs(self.catalog.tool("test tool"), tool)
+        self.assertIn(tool, self.catalog.tools_for_format("tst"))
+        self.assertIn(tool, self.catalog.tools_by_tag["mesh"])
+        guide = self.catalog.get("test_guide")
+        self.assertIn(guide, self.catalog.guides_by_tag["mesh"])
+        self.assertEqual(self.catalog.related(tool), [guide])
+        self.assertEqual(self.catalog.related_tools(guide), [tool])
+
+    def test_discovers_guides_in_the_folder(self):
+        guide = self.catalog.get("auto_my_notes")
+        self.assertEqual((guide.file_en, guide.file_de), ("my_notes_en.txt", "my_notes_de.txt"))
+        self.assertEqual(guide.title_en, "My Notes")
+        self.assertTrue(guide.auto_discovered)
+
+    def test_refresh_rescans_only_when_the_folder_changed(self):
+        version = self.catalog.guides_version
+        self.assertFalse(self.catalog.refresh())
+        self.assertEqual(self.catalog.guides_version, version)
+        self.write_guide("more.md")
+        self.assertTrue(self.catalog.refresh())
+        self.assertGreater(self.catalog.guides_version, version)
+        self.assertEqual(self.catalog.get("auto_more").file_de, "more.md")
+
+    def test_add_tool_and_guide_update_config_and_indexes(self):
+        tools_version = self.catalog.tools_version
+        tool = self.catalog.add_tool({"id": "added", "name": "Added", "formats": [".add"]})
+        self.assertEqual(self.cfg["user_tools"][-1]["id"], "added")
+        self.assertIs(self.catalog.tool("added"), tool)
+        self.assertEqual(self.catalog.tools_for_format(".add"), [tool])
+        self.assertGreater(self.catalog.tools_version, tools_version)
+
+        guide = self.catalog.add_guide({"id": "added_guide", "title_en": "Added", "tool_ids": ["added"]})
+        self.assertEqual(self.cfg["user_guides"][-1]["id"], "added_guide")
+        self.assertEqual(self.catalog.related(tool), [guide])
+        # User guides stay ahead of the ones discovered in the folder
+        order = [g.id for g in self.catalog.guides]
+        self.assertLess(order.index("added_guide"), order.index("auto_my_notes"))
+
+
+def _temp_dir(test):
+    path = tempfile.mkdtemp(prefix="tw1hub_test_")
+    test.addCleanup(shutil.rmtree, path)
+    return path
+
+
+class SaveConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(_temp_dir(self), "tw1_modding_hub.json")
+
+    def test_keeps_the_previous_version_as_backup(self):
+        self.assertTrue(save_config({"lang": "en"}, self.path))
+        self.assertFalse(os.path.exists(self.path + CONFIG_BACKUP_SUFFIX))
+        self.assertTrue(save_config({"lang": "de"}, self.path))
+        self.assertEqual(load_config(self.path), {"lang": "de"})
+        with open(self.path + CONFIG_BACKUP_SUFFIX, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"lang": "en"})
+        self.assertEqual([name for name in os.listdir(os.path.dirname(self.path)) if name.endswith(".tmp")], [])
+
+    def test_load_falls_back_to_the_backup(self):
+        save_config({"lang": "en"}, self.path)
+        save_config({"lang": "de"}, self.path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"lang": ')     # torn by a crash
+        self.assertEqual(load_config(self.path), {"lang": "en"})
+
+    def test_defaults_without_any_file(self):
+        cfg = load_config(self.path)
+        self.assertEqual(cfg["user_tools"], [])
+        self.assertEqual(cfg["lang"], "en")
+
+
+class MergeConfigTest(unittest.TestCase):
+    def test_takes_changes_from_both_sides(self):
+        base = {"lang": "en", "font_size": 10, "tool_paths": {"a": "1"}}
+        ours = {"lang": "de", "font_size": 10, "tool_paths": {"a": "1", "b": "2"}}
+        theirs = {"lang": "en", "font_size": 12, "tool_paths": {"a": "3"}}
+        self.assertEqual(_merge_config(base, ours, theirs),
+                         {"lang": "de", "font_size": 12, "tool_paths": {"a": "3", "b": "2"}})
+
+    def test_ours_wins_a_conflict(self):
+        self.assertEqual(_merge_config({"lang": "en"}, {"lang": "de"}, {"lang": "fr"}), {"lang": "de"})
+
+    def test_key_removed_by_the_other_side(self):
+        self.assertEqual(_merge_config({"a": 1, "b": 2}, {"a": 1, "b": 2, "c": 3}, {"a": 1}), {"a": 1, "c": 3})
+
+    def test_user_items_merge_by_id(self):
+        one, two, three = {"id": "one"}, {"id": "two"}, {"id": "three"}
+        base = {"user_tools": [one, two]}
+        ours = {"user_tools": [one, two, three]}            # added three
+        theirs = {"user_tools": [{"id": "one", "name": "renamed"}]}   # edited one, deleted two
+        self.assertEqual(_merge_config(base, ours, theirs)["user_tools"],
+                         [{"id": "one", "name": "renamed"}, three])
+
+
+class ConfigStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(_temp_dir(self), "tw1_modding_hub.json")
+        save_config({"lang": "en", "user_tools": [], "tool_paths": {}}, self.path)
+        self.timers = []
+
+    def store(self, **kwargs):
+        # Timers are recorded, never fired: the tests flush explicitly
+        store = ConfigStore(self.path, schedule=lambda ms, callback: self.timers.append(callback) or callback,
+                            cancel=lambda handle: None, **kwargs)
+        self.addCleanup(store.backend.close)
+        return store
+
+    def test_a_burst_of_saves_is_one_timer_and_one_write(self):
+        store = self.store()
+        for size in range(10, 20):
+            store.cfg["font_size"] = size
+            store.save()
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(load_config(self.path).get("font_size"), None)
+        self.assertTrue(store.flush())
+        self.assertFalse(store.dirty)
+        self.assertEqual(load_config(self.path)["font_size"], 19)
+
+    def test_merges_an_edit_made_by_another_instance(self):
+        reloads = []
+        ours = self.store(on_reload=lambda: reloads.append(True))
+        theirs = self.store()
+        theirs.cfg["user_tools"].append({"id": "theirs", "name": "Theirs"})
+        theirs.cfg["lang"] = "de"
+        theirs.save()
+        self.assertTrue(theirs.flush())
+
+        ours.cfg["tool_paths"]["mine"] = "/tools/mine.exe"
+        ours.save()
+        self.assertTrue(ours.flush())
+        self.assertEqual(reloads, [True])
+        saved = load_config(self.path)
+        self.assertEqual(saved["lang"], "de")
+        self.assertEqual([t["id"] for t in saved["user_tools"]], ["theirs"])
+        self.assertEqual(saved["tool_paths"], {"mine": "/tools/mine.exe"})
+        self.assertEqual(ours.cfg, saved)
+
+    def test_sync_without_local_changes_just_reloads(self):
+        ours = self.store()
+        theirs = self.store()
+        theirs.cfg["font_size"] = 12      # also changes the size: the stamp differs even on coarse mtimes
+        theirs.save()
+        theirs.flush()
+        self.assertTrue(ours.sync())
+        self.assertEqual(ours.cfg["font_size"], 12)
+        self.assertFalse(ours.dirty)
+        self.assertFalse(ours.sync())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for the optional SQLite storage backend (tw1_hub_sqlite)."""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from tw1_hub_core import ConfigStore, load_config, save_config
+from tw1_hub_sqlite import SqliteConfigBackend, default_db_path, guide_body, guide_digest, _digest
+
+CONFIG = {
+    "lang": "de",
+    "font_size": 11,
+    "user_tools": [
+        {"id": "conv", "name": "Converter", "filename": "conv.exe", "formats": [".vdf"]},
+        {"id": "dup", "name": "First"},
+        {"id": "dup", "name": "Second"},
+    ],
+    "user_guides": [
+        {"id": "notes", "title_en": "Notes", "tags": ["map"], "content_en": "Hello", "content_de": "Hallo"},
+        {"id": "links", "title_en": "Links", "tool_ids": ["conv"]},
+    ],
+    "tool_paths": {"conv": "C:/Tools/conv.exe"},
+}
+
+
+class SqliteStorageTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.mkdtemp(prefix="tw1hub_test_")
+        self.addCleanup(shutil.rmtree, folder)
+        self.path = os.path.join(folder, "tw1_modding_hub.json")
+        save_config(json.loads(json.dumps(CONFIG)), self.path)
+
+    def store(self):
+        store = ConfigStore(self.path, schedule=lambda ms, callback: callback, cancel=lambda handle: None)
+        self.addCleanup(store.backend.close)
+        return store
+
+    def migrate(self):
+        self.assertTrue(self.store().set_storage("sqlite"))
+        return self.store()
+
+    def test_json_keeps_only_the_settings(self):
+        self.migrate()
+        settings = load_config(self.path)
+        self.assertEqual(settings, {"lang": "de", "font_size": 11, "storage": "sqlite"})
+        self.assertTrue(os.path.exists(default_db_path(self.path)))
+
+    def test_registries_load_from_the_database(self):
+        store = self.migrate()
+        self.assertIsInstance(store.backend, SqliteConfigBackend)
+        cfg = store.cfg
+        self.assertEqual([t["name"] for t in cfg["user_tools"]], ["Converter", "First", "Second"])
+        self.assertEqual(cfg["tool_paths"], CONFIG["tool_paths"])
+        notes, links = cfg["user_guides"]
+        # Bodies stay in the database until a guide is opened
+        self.assertNotIn("content_en", notes)
+        self.assertEqual(notes["stored"], store.backend.db_path)
+        self.assertNotIn("stored", links)
+        self.assertEqual(guide_body(notes["stored"], "notes", "de"), "Hallo")
+        self.assertEqual(guide_digest(notes["stored"], "notes", "en"), _digest("Hello"))
+        self.assertIsNone(guide_body(notes["stored"], "links", "en"))
+
+    def test_migrate_round_trip(self):
+        self.migrate()
+        store = self.store()
+        self.assertEqual(store.export(), CONFIG)
+        self.assertTrue(store.set_storage("json"))
+        self.assertEqual(load_config(self.path), CONFIG)
+        self.assertEqual(self.store().cfg, CONFIG)
+
+    def test_save_writes_only_changed_rows(self):
+        store = self.migrate()
+        conn = store.backend.conn
+        stamp = store.backend.stamp()
+        before = conn.total_changes
+        store.cfg["user_tools"][0]["name"] = "Converter 2"
+        store.save()
+        self.assertTrue(store.flush())
+        # one tool row plus the generation counter
+        self.assertEqual(conn.total_changes - before, 2)
+        self.assertNotEqual(store.backend.stamp(), stamp)
+        self.assertEqual(self.store().cfg["user_tools"][0]["name"], "Converter 2")
+
+    def test_edited_body_and_removed_rows(self):
+        store = self.migrate()
+        notes = store.cfg["user_guides"][0]
+        notes["content_en"] = "Hello again"
+        del store.cfg["user_guides"][1]
+        del store.cfg["tool_paths"]["conv"]
+        store.save()
+        self.assertTrue(store.flush())
+        reloaded = self.store()
+        self.assertEqual([g["id"] for g in reloaded.cfg["user_guides"]], ["notes"])
+        self.assertEqual(reloaded.cfg["tool_paths"], {})
+        self.assertEqual(reloaded.backend.bodies("notes"), {"en": "Hello again", "de": "Hallo"})
+
+
+if __name__ == "__main__":
+    unittest.main()
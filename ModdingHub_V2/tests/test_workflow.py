@@ -0,0 +1,154 @@
+"""Tests for the workflow runner (tw1_hub_workflow)."""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+
+from tw1_hub_workflow import Workflow, WorkflowRunner, WorkflowError
+
+# Appends the input file's text to the output file: stands in for a cook/pack tool
+CONCAT = "import sys; open(sys.argv[2], 'a').write(open(sys.argv[1]).read())"
+
+
+def _pipeline():
+    return Workflow({"id": "test", "steps": [
+        {"id": "copy", "kind": "copy", "inputs": ["{src}/*.lnd"], "dest": "{out}/maps",
+         "rename": ["^Map_(\\w+)s\\.lnd$", "Map_\\1.lnd"]},
+        {"id": "pack", "kind": "command", "deps": ["copy"], "inputs": ["{out}/maps/*.lnd"],
+         "outputs": ["{out}/mod.wd"],
+         "command": ["{python}", "-c", CONCAT, "{out}/maps/Map_F01.lnd", "{out}/mod.wd"]},
+        {"id": "notes", "kind": "copy", "inputs": ["{src}/*.txt"], "dest": "{out}/notes"},
+    ]})
+
+
+class WorkflowTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="tw1hub_test_")
+        self.addCleanup(shutil.rmtree, self.root)
+        self.values = {"src": os.path.join(self.root, "src"), "out": os.path.join(self.root, "out"),
+                       "python": sys.executable}
+        os.makedirs(self.values["src"])
+        self.write("Map_F01s.lnd", "land")
+        self.write("readme.txt", "notes")
+
+    def write(self, name, text):
+        with open(os.path.join(self.values["src"], name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def run_workflow(self, workflow=None, **kwargs):
+        events = []
+        runner = WorkflowRunner(workflow or _pipeline(), self.values,
+                                cache_path=os.path.join(self.root, "cache.json"),
+                                on_event=lambda step, state, seconds, message: events.append((step, state)),
+                                **kwargs)
+        ok = runner.run()
+        return ok, {step: state for step, state in events if state != "running"}, runner
+
+    def test_runs_in_dependency_order_and_renames(self):
+        ok, states, _ = self.run_workflow()
+        self.assertTrue(ok)
+        self.assertEqual(states, {"copy": "done", "pack": "done", "notes": "done"})
+        self.assertTrue(os.path.exists(os.path.join(self.values["out"], "maps", "Map_F01.lnd")))
+        with open(os.path.join(self.values["out"], "mod.wd"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "land")
+
+    def test_unchanged_steps_are_skipped(self):
+        self.run_workflow()
+        ok, states, _ = self.run_workflow()
+        self.assertTrue(ok)
+        self.assertEqual(set(states.values()), {"skipped"})
+
+    def test_only_steps_downstream_of_a_change_run_again(self):
+        self.run_workflow()
+        self.write("readme.txt", "edited notes")
+        _, states, _ = self.run_workflow()
+        self.assertEqual(states, {"copy": "skipped", "pack": "skipped", "notes": "done"})
+
+        self.write("Map_F01s.lnd", "edited land")
+        _, states, _ = self.run_workflow()
+        self.assertEqual(states, {"copy": "done", "pack": "done", "notes": "skipped"})
+
+    def test_changed_output_runs_the_step_again(self):
+        self.run_workflow()
+        with open(os.path.join(self.values["out"], "mod.wd"), "w", encoding="utf-8") as f:
+            f.write("tampered")
+        _, states, _ = self.run_workflow()
+        self.assertEqual(states["pack"], "done")
+
+    def test_failed_step_blocks_its_dependents(self):
+        os.remove(os.path.join(self.values["src"], "Map_F01s.lnd"))
+        ok, states, runner = self.run_workflow()
+        self.assertFalse(ok)
+        self.assertEqual(states, {"copy": "failed", "pack": "blocked", "notes": "done"})
+        # The cache is still written for the steps that did run
+        self.assertTrue(os.path.exists(runner.cache_path))
+
+    def test_unexpected_errors_fail_only_the_step(self):
+        workflow = Workflow({"id": "bad", "steps": [
+            {"id": "copy", "kind": "copy", "inputs": ["{src}/*.lnd"], "dest": "{out}", "rename": ["(", "x"]}]})
+        ok, states, _ = self.run_workflow(workflow)
+        self.assertFalse(ok)
+        self.assertEqual(states, {"copy": "failed"})
+
+    def test_manual_step_waits_for_confirmation(self):
+        workflow = Workflow({"id": "manual", "steps": [
+            {"id": "edit", "kind": "manual", "instructions": ["Cook the map"]}]})
+        events = []
+
+        def on_event(step, state, seconds, message):
+            events.append(state)
+            if state == "waiting":
+                threading.Thread(target=runner.confirm, args=(step,)).start()
+
+        runner = WorkflowRunner(workflow, self.values, cache_path=os.path.join(self.root, "cache.json"),
+                                on_event=on_event)
+        self.assertTrue(runner.run())
+        self.assertEqual(events, ["running", "waiting", "done"])
+
+        ok, states, _ = self.run_workflow(workflow, interactive=False)
+        self.assertTrue(ok)
+        self.assertEqual(states, {"edit": "skipped"})
+
+    def test_manual_step_fails_without_a_user(self):
+        workflow = Workflow({"id": "manual", "steps": [
+            {"id": "edit", "kind": "manual", "instructions": ["Cook the map"]}]})
+        ok, states, _ = self.run_workflow(workflow, interactive=False)
+        self.assertFalse(ok)
+        self.assertEqual(states, {"edit": "failed"})
+
+    def test_cancel_kills_a_running_command(self):
+        workflow = Workflow({"id": "slow", "steps": [
+            {"id": "sleep", "kind": "command", "command": ["{python}", "-c", "import time; time.sleep(60)"]},
+            {"id": "after", "kind": "command", "deps": ["sleep"], "command": ["{python}", "-c", "pass"]}]})
+        runner = WorkflowRunner(workflow, self.values, cache_path=os.path.join(self.root, "cache.json"))
+        timer = threading.Timer(0.3, runner.cancel)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertFalse(runner.run())
+        self.assertEqual(runner.states, {"sleep": "failed", "after": "blocked"})
+
+
+class DefinitionTest(unittest.TestCase):
+    def test_cycle_is_rejected(self):
+        with self.assertRaises(WorkflowError):
+            Workflow({"id": "loop", "steps": [
+                {"id": "a", "kind": "copy", "deps": ["b"]}, {"id": "b", "kind": "copy", "deps": ["a"]}]})
+
+    def test_unknown_dependency_and_kind(self):
+        with self.assertRaises(WorkflowError):
+            Workflow({"id": "x", "steps": [{"id": "a", "kind": "copy", "deps": ["missing"]}]})
+        with self.assertRaises(WorkflowError):
+            Workflow({"id": "x", "steps": [{"id": "a", "kind": "bake"}]})
+
+    def test_order_puts_dependencies_first(self):
+        workflow = Workflow({"id": "x", "steps": [
+            {"id": "c", "kind": "copy", "deps": ["b"]}, {"id": "a", "kind": "copy"},
+            {"id": "b", "kind": "copy", "deps": ["a"]}]})
+        self.assertEqual([step.id for step in workflow.order()], ["a", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — batch runs
+Runs a one-file-per-run tool (VDF/OBJ converters, LND objects exporter)
+over every matching file of a folder with a bounded number of processes
+at a time, per-file timeouts and retries.
+
+Inputs are the files under the folder that match the glob and one of the
+tool's input formats (`batch.inputs`, else its `formats`). The command
+line comes from the tool's `batch.args` (default: just the input file),
+with {input}, {stem} and {dir} filled in per file.
+
+Progress is appended to a manifest next to the inputs
+(`.tw1hub_batch_<tool>.jsonl`, one line per finished file), so a run
+that crashed or was cancelled resumes where it stopped: files already
+converted and unchanged since are skipped. Every file's output goes to
+one combined log (`.tw1hub_batch_<tool>.log`).
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import threading
+
+# subprocess and concurrent.futures are imported where they are used, so
+# the command line's queries don't pay for them
+from tw1_hub_core import _ext, _is_python_tool, PROFILER
+
+BATCH_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+BATCH_TIMEOUT_S = 300.0                # per file
+BATCH_RETRIES = 1                      # extra attempts after a failure or timeout
+MANIFEST_FORMAT = 1
+
+
+def batch_inputs(tool):
+    """Input extensions a tool takes in a batch run ([] if it can't be batched)."""
+    batch = tool.get("batch")
+    if not batch:
+        return []
+    return [_ext(fmt) for fmt in batch.get("inputs") or tool.get("formats") or ()]
+
+
+def find_inputs(tool, folder, pattern="**/*"):
+    exts = set(batch_inputs(tool))
+    # The folder is a literal path: "Maps [backup]" must not be read as a character class
+    paths = glob.glob(os.path.join(glob.escape(folder), pattern), recursive=True)
+    return sorted(p for p in paths if os.path.splitext(p)[1].lower() in exts and os.path.isfile(p))
+
+
+class BatchJob:
+    __slots__ = ("input", "state", "attempts", "seconds", "exit", "output")
+
+    def __init__(self, path):
+        self.input = path
+        self.state = "pending"         # pending, skipped, done, failed, timeout
+        self.attempts = 0
+        self.seconds = None
+        self.exit = None
+        self.output = ""
+
+
+class BatchRun:
+    """One batch run of a tool over a folder.
+
+    `on_progress(job, counts)` is called from worker threads after each
+    file with counts of done/skipped/failed/total. `cancel()` kills the
+    running processes; those files stay unrecorded and run again on the
+    next start.
+    """
+
+    def __init__(self, tool, tool_path, folder, pattern="**/*", workers=BATCH_WORKERS,
+                 timeout=BATCH_TIMEOUT_S, retries=BATCH_RETRIES, fresh=False, on_progress=None):
+        self.tool = tool
+        self.tool_path = tool_path
+        self.folder = os.path.abspath(folder)
+        self.pattern = pattern
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.on_progress = on_progress or (lambda job, counts: None)
+        tool_id = tool.get("id") or tool.get("name")
+        self.manifest_path = os.path.join(self.folder, f".tw1hub_batch_{tool_id}.jsonl")
+        self.log_path = os.path.join(self.folder, f".tw1hub_batch_{tool_id}.log")
+        self.args = list((tool.get("batch") or {}).get("args") or ["{input}"])
+        self.jobs = [BatchJob(p) for p in find_inputs(tool, self.folder, pattern)]
+        self.counts = {"done": 0, "skipped": 0, "failed": 0, "total": len(self.jobs)}
+        self._header = {"format": MANIFEST_FORMAT, "tool": tool_id, "args": self.args}
+        self._cancelled = False
+        self._procs = set()
+        self._lock = threading.Lock()
+        if fresh:
+            self._reset_files()
+
+    # ── manifest ────────────────────────────────────────────
+    def _reset_files(self):
+        for path in (self.manifest_path, self.log_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _finished(self):
+        """{relative input: (size, mtime_ns)} of files the manifest records as done."""
+        done = {}
+        try:
+            with open(self.manifest_path, "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return done
+        try:
+            if json.loads(lines[0]) != self._header:
+                return None            # another tool version or command line: start over
+        except (ValueError, IndexError):
+            return None
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue               # torn last line from a crash
+            if entry.get("state") == "done":
+                done[entry["input"]] = (entry.get("size"), entry.get("mtime_ns"))
+            else:
+                done.pop(entry.get("input"), None)
+        return done
+
+    def _record(self, job):
+        try:
+            st = os.stat(job.input)
+            size, mtime_ns = st.st_size, st.st_mtime_ns
+        except OSError as e:
+            # Deleted or renamed while running: a failure of this file only, retried next time
+            job.state = "failed"
+            job.output = f"{job.output.rstrip()}\n{e}".lstrip()
+            size = mtime_ns = None
+        entry = {"input": os.path.relpath(job.input, self.folder), "state": job.state,
+                 "size": size, "mtime_ns": mtime_ns, "seconds": job.seconds,
+                 "exit": job.exit, "attempts": job.attempts}
+        with self._lock:
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(f"=== {entry['input']} — {job.state}, exit {job.exit}, "
+                        f"{job.seconds:.2f} s, attempt {job.attempts}\n")
+                if job.output:
+                    f.write(job.output.rstrip() + "\n")
+        job.output = ""                # it's in the log now; thousands of jobs stay small
+
+    # ── running ─────────────────────────────────────────────
+    def _command(self, job):
+        values = {"input": job.input, "stem": os.path.splitext(os.path.basename(job.input))[0],
+                  "dir": os.path.dirname(job.input)}
+        args = [arg.format_map(values) for arg in self.args]
+        if _is_python_tool(self.tool, self.tool_path):
+            return [sys.executable, self.tool_path, *args]
+        return [self.tool_path, *args]
+
+    def _attempt(self, job):
+        import subprocess
+        proc = subprocess.Popen(self._command(job), cwd=os.path.dirname(self.tool_path),
+                                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        with self._lock:
+            self._procs.add(proc)
+            if self._cancelled:
+                proc.kill()            # spawned after cancel() took its copy of _procs
+        try:
+            output, _ = proc.communicate(timeout=self.timeout)
+            job.state = "done" if proc.returncode == 0 else "failed"
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            output, _ = proc.communicate()
+            job.state = "timeout"
+        finally:
+            with self._lock:
+                self._procs.discard(proc)
+        job.exit = proc.returncode
+        job.output = output.decode("utf-8", "replace")
+
+    def _run_job(self, job):
+        if self._cancelled:
+            return
+        started = time.perf_counter()
+        with PROFILER.span("batch.job"):
+            while job.attempts <= self.retries and not self._cancelled:
+                job.attempts += 1
+                self._attempt(job)
+                if job.state == "done":
+                    break
+        if self._cancelled and job.state != "done":
+            job.state = "pending"
+            return
+        job.seconds = time.perf_counter() - started
+        self._record(job)
+        with self._lock:
+            self.counts["done" if job.state == "done" else "failed"] += 1
+            counts = dict(self.counts)
+        self.on_progress(job, counts)
+
+    def run(self):
+        """Run all files not finished before; returns True if none failed."""
+        finished = self._finished()
+        if finished is None:
+            self._reset_files()
+            finished = {}
+        if not finished:
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(self._header, separators=(",", ":")) + "\n")
+        todo = []
+        for job in self.jobs:
+            try:
+                st = os.stat(job.input)
+            except OSError as e:
+                job.state, job.seconds, job.output = "failed", 0.0, str(e)
+                self._record(job)
+                self.counts["failed"] += 1
+                continue
+            if finished.get(os.path.relpath(job.input, self.folder)) == (st.st_size, st.st_mtime_ns):
+                job.state = "skipped"
+                self.counts["skipped"] += 1
+            else:
+                todo.append(job)
+        if self.counts["skipped"] or self.counts["failed"]:
+            self.on_progress(None, dict(self.counts))
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tw1hub-batch") as pool:
+            try:
+                for future in [pool.submit(self._run_job, job) for job in todo]:
+                    future.result()
+            except BaseException:
+                # Ctrl-C or a failing job: kill what runs and drop what is queued
+                # instead of letting the pool's shutdown work through every file
+                self.cancel()
+                pool.shutdown(cancel_futures=True)
+                raise
+        return self.counts["failed"] == 0 and not self._cancelled
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            procs = list(self._procs)
+        for proc in procs:
+            proc.kill()
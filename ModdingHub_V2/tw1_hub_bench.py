@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — hot path benchmark
+Builds a synthetic workspace (user tools, guide files, deep search_paths
+trees, a large config) in a temporary folder and times the hub's catalog,
+tool lookup, search, guide loading and discovery code without a display.
+
+    python tw1_hub_bench.py                               # default workspace
+    python tw1_hub_bench.py --tools 5000 --guides 1000 --guide-kb 256
+    python tw1_hub_bench.py --save baseline.json          # record a baseline
+    python tw1_hub_bench.py --baseline baseline.json      # exit 1 on regressions
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+
+from tw1_hub_core import (
+    VERSION, TOOL_FIELDS, GUIDE_FIELDS, PROFILER,
+    load_config, save_config, all_tools, load_guide_content, search_guides, ConfigStore,
+    GuideIndex, SearchEngine, ToolLocator, WorkspaceScanner, Catalog,
+)
+
+DEFAULT_TOOLS = 500
+DEFAULT_GUIDES = 200
+DEFAULT_GUIDE_KB = 32
+DEFAULT_DEPTH = 6
+DEFAULT_FANOUT = 3
+DEFAULT_REPEAT = 15
+DEFAULT_TOLERANCE = 0.25    # allowed p50 slowdown against a baseline
+
+WORDS = ("terrain", "editor", "dungeon", "quest", "texture", "model", "sound", "script",
+         "weapon", "armor", "shader", "lighting", "portal", "trigger", "spawn", "loot",
+         "dialog", "pack", "unpack", "archive", "mesh", "skeleton", "animation", "export",
+         "import", "heightmap", "navmesh", "object", "marker", "waypoint", "village", "cave")
+QUERIES = ("editor", "dungeon quest", "tex", "skeleton animation", "heigthmap", "wd", "lo")
+
+
+# ============================================================
+# SYNTHETIC WORKSPACE
+# ============================================================
+def _phrase(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _tree(root, depth, fanout):
+    """Folders root/d0_i/d1_j/... down to `depth`; returns the leaf folders."""
+    level = [root]
+    for d in range(depth):
+        level = [os.path.join(parent, f"d{d}_{i}") for parent in level for i in range(fanout)]
+    for leaf in level:
+        os.makedirs(leaf, exist_ok=True)
+    return level
+
+
+def build_workspace(root, tools, guides, guide_kb, depth, fanout, seed=1):
+    """Write the synthetic workspace under `root` and return its config."""
+    rng = random.Random(seed)
+    guides_dir = os.path.join(root, "guides")
+    os.makedirs(guides_dir)
+
+    # Guide files, one language each for half of them so both auto-discovery paths run
+    size = guide_kb * 1024
+    for i in range(guides):
+        head = f"# Guide {i}: {_phrase(rng, 3)}\n\n"
+        body = []
+        length = len(head)
+        while length < size:
+            line = (f"## {_phrase(rng, 2)}\n" if rng.random() < 0.05 else _phrase(rng, 12) + "\n")
+            body.append(line)
+            length += len(line)
+        for lang in (("en", "de") if i % 2 else ("en",)):
+            with open(os.path.join(guides_dir, f"synthetic_{i}_{lang}.txt"), "w", encoding="utf-8") as f:
+                f.write(head + "".join(body))
+
+    # Deep search_paths tree: each tool probes a few misses before its hit (or none)
+    leaves = [os.path.relpath(p, root) for p in _tree(os.path.join(root, "tools"), depth, fanout)]
+    user_tools = []
+    tool_paths = {}
+    for i in range(tools):
+        filename = f"tool_{i}.exe"
+        search_paths = rng.sample(leaves, min(4, len(leaves)))
+        if i % 3:
+            with open(os.path.join(root, search_paths[-1], filename), "wb"):
+                pass
+        tool = {
+            "id": f"user_tool_{i}",
+            "name": f"{_phrase(rng, 2).title()} Tool {i}",
+            "filename": filename,
+            "type": "exe",
+            "desc_en": _phrase(rng, 14),
+            "desc_de": _phrase(rng, 14),
+            "formats": rng.sample([".wd", ".lhc", ".lan", ".vdf", ".dds", ".mtr", ".chm"], 2),
+            "tags": rng.sample(WORDS, 3),
+            "search_paths": search_paths,
+            "guide_ids": [f"auto_synthetic_{rng.randrange(max(guides, 1))}"],
+        }
+        user_tools.append(tool)
+        if i % 10 == 0:
+            tool_paths[tool["id"]] = os.path.join(root, "missing", filename)
+
+    user_guides = [{"id": f"user_guide_{i}", "title_en": f"Notes {i}: {_phrase(rng, 3)}",
+                    "title_de": f"Notizen {i}", "icon": "\U0001f4dd", "tags": rng.sample(WORDS, 3),
+                    "tool_ids": [f"user_tool_{rng.randrange(max(tools, 1))}"],
+                    "content_en": _phrase(rng, size // 7), "content_de": _phrase(rng, 200)}
+                   for i in range(max(guides // 10, 1))]
+
+    cfg = {"lang": "en", "view_mode": "grid", "font_size": 10, "guides_dir": guides_dir,
+           "user_tools": user_tools, "user_guides": user_guides, "tool_paths": tool_paths,
+           "workspace_roots": [root], "discovery_depth": depth + 1}
+    os.makedirs(os.path.join(root, "config"), exist_ok=True)
+    save_config(cfg, _config_path(root))
+    return cfg
+
+
+def _config_path(root):
+    # Not in the root itself: save_config's temp file and rename would bump
+    # the root's mtime, which the tool locator entries depend on
+    return os.path.join(root, "config", "tw1_modding_hub.json")
+
+
+# ============================================================
+# BENCHMARKS
+# ============================================================
+def hot_paths(root, cfg):
+    """(name, items per call, setup, run) for every benchmarked hot path.
+
+    `setup` returns the state `run` works on, so cold paths get fresh
+    objects each iteration and only `run` is timed.
+    """
+    config_path = _config_path(root)
+    guides_dir = cfg["guides_dir"]
+    tools = all_tools(cfg)
+    tool_paths = cfg.get("tool_paths", {})
+
+    catalog = Catalog(cfg, guides_dir)
+    catalog.refresh()
+    guides = catalog.guides
+
+    # Index files live in their own folder: creating them must not touch the
+    # mtimes of the folders the tool locator depends on
+    os.makedirs(os.path.join(root, "cache"), exist_ok=True)
+    index_path = os.path.join(root, "cache", "index.json")
+    index = GuideIndex(index_path)
+    index.refresh(guides, guides_dir)
+    index.save()
+
+    # The same registries in SQLite storage, next to a settings-only JSON; the
+    # folder is created before the locator is warmed, which depends on the root
+    sqlite_dir = os.path.join(root, "sqlite")
+    os.makedirs(sqlite_dir)
+    sqlite_config = os.path.join(sqlite_dir, "tw1_modding_hub.json")
+    save_config(cfg, sqlite_config)
+    store = ConfigStore(sqlite_config)
+    store.set_storage("sqlite")
+    store.close()
+
+    warm_locator = ToolLocator(base_dir=root)
+    for tool in tools:
+        warm_locator.find(tool, tool_paths)
+
+    tool_engine = SearchEngine(TOOL_FIELDS)
+    tool_engine.build(tools)
+    guide_engine = SearchEngine(GUIDE_FIELDS)
+    guide_engine.build(guides)
+
+    def open_store(path):
+        ConfigStore(path).close()
+
+    def edited_store(path):
+        # one changed tool path: the write should not depend on the registry size
+        store = ConfigStore(path)
+        store.cfg["tool_paths"]["bench"] = str(time.perf_counter())
+        store.save()
+        return store
+
+    def flush_store(store):
+        store.flush()
+        store.close()
+
+    def save_burst(store):
+        # a burst of toggles: many save() calls, one write
+        for _ in range(50):
+            store.save()
+        store.flush()
+
+    def scan():
+        scanner = WorkspaceScanner()
+        scanner.start(cfg["workspace_roots"], tools, max_depth=cfg["discovery_depth"])
+        return scanner.collect()
+
+    def locate_all(locator):
+        for tool in tools:
+            locator.find(tool, tool_paths)
+
+    def revalidate(_):
+        warm_locator.revalidate()
+        assert warm_locator.entries, "revalidate dropped every entry: a benchmark wrote into a probed folder"
+
+    def load_all():
+        for guide in guides:
+            load_guide_content(guide, "en", guides_dir)
+
+    cold_path = os.path.join(root, "cache", "cold.json")
+
+    def fresh_index():
+        # refresh() saves the index, so drop it before every cold run
+        if os.path.exists(cold_path):
+            os.remove(cold_path)
+        return GuideIndex(cold_path)
+
+    nothing = lambda: None
+    return [
+        ("config.load", 1, nothing, lambda _: load_config(config_path)),
+        ("config.save", 1, nothing, lambda _: save_config(cfg, config_path)),
+        ("config.store_burst", 50, lambda: ConfigStore(config_path), save_burst),
+        ("config.edit_json", 1, lambda: edited_store(config_path), flush_store),
+        ("config.load_sqlite", 1, nothing, lambda _: open_store(sqlite_config)),
+        ("config.edit_sqlite", 1, lambda: edited_store(sqlite_config), flush_store),
+        ("all_tools", len(tools), nothing, lambda _: all_tools(cfg)),
+        ("catalog.rebuild", len(tools) + len(guides), lambda: Catalog(cfg, guides_dir), lambda c: c.refresh()),
+        ("catalog.refresh", 1, nothing, lambda _: catalog.refresh()),
+        ("locate.cold", len(tools), lambda: ToolLocator(base_dir=root), locate_all),
+        ("locate.warm", len(tools), lambda: warm_locator, locate_all),
+        ("locate.revalidate", len(tools), nothing, revalidate),
+        ("discovery.scan", len(tools), nothing, lambda _: scan()),
+        ("search.build_tools", len(tools), lambda: SearchEngine(TOOL_FIELDS), lambda e: e.build(tools)),
+        ("search.tools", len(QUERIES), nothing,
+         lambda _: [tool_engine.search(q) for q in QUERIES]),
+        ("search.guides", len(QUERIES), nothing,
+         lambda _: [search_guides(guide_engine, index, guides, q) for q in QUERIES]),
+        ("guides.load", len(guides), nothing, lambda _: load_all()),
+        ("index.cold", len(guides), fresh_index, lambda i: i.refresh(guides, guides_dir)),
+        ("index.warm", len(guides), nothing,
+         lambda _: GuideIndex(index_path).refresh(guides, guides_dir)),
+    ]
+
+
+def measure(setup, run, repeat):
+    """Time `repeat` runs plus one profiled run for the stat/byte counters."""
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    # TW1HUB_PROFILE=1 may have switched profiling on for the whole run: leave it on
+    was_enabled = PROFILER.enabled
+    PROFILER.reset()
+    PROFILER.enable()
+    try:
+        run(setup())
+    finally:
+        if not was_enabled:
+            PROFILER.disable()
+    return sorted(times), dict(PROFILER.counters)
+
+
+def run_suite(args):
+    root = tempfile.mkdtemp(prefix="tw1hub_bench_")
+    try:
+        start = time.perf_counter()
+        cfg = build_workspace(root, args.tools, args.guides, args.guide_kb, args.depth, args.fanout)
+        built = time.perf_counter() - start
+        results = {}
+        for name, items, setup, run in hot_paths(root, cfg):
+            if args.only and not any(name.startswith(o) for o in args.only):
+                continue
+            times, counters = measure(setup, run, args.repeat)
+            p50 = times[len(times) // 2]
+            results[name] = {
+                "items": items,
+                "p50_ms": round(p50 * 1000, 3),
+                "p95_ms": round(times[int((len(times) - 1) * 0.95)] * 1000, 3),
+                "mean_ms": round(statistics.fmean(times) * 1000, 3),
+                "items_per_s": round(items / p50, 1) if p50 else None,
+                "stat_calls": counters.get("os.stat", 0),
+                "bytes_read": counters.get("bytes read", 0),
+            }
+        return {"version": VERSION, "workspace": {"tools": args.tools, "guides": args.guides,
+                                                  "guide_kb": args.guide_kb, "depth": args.depth,
+                                                  "fanout": args.fanout, "build_s": round(built, 2)},
+                "repeat": args.repeat, "results": results}
+    finally:
+        if args.keep:
+            print(f"workspace kept in {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def regressions(report, baseline, tolerance):
+    """Hot paths whose p50 grew by more than `tolerance` over the baseline."""
+    slower = []
+    for name, result in report["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before and before["p50_ms"] > 0 and result["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            slower.append((name, before["p50_ms"], result["p50_ms"]))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the TW1 Modding Hub hot paths without a display.")
+    parser.add_argument("--tools", type=int, default=DEFAULT_TOOLS, help="user tools in the config")
+    parser.add_argument("--guides", type=int, default=DEFAULT_GUIDES, help="guide files in the guides folder")
+    parser.add_argument("--guide-kb", type=int, default=DEFAULT_GUIDE_KB, help="size of each guide file")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="depth of the search_paths tree")
+    parser.add_argument("--fanout", type=int, default=DEFAULT_FANOUT, help="subfolders per tree level")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per hot path")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run hot paths starting with these names")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--save", metavar="FILE", help="write the report as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="compare p50 latencies against a saved report")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed p50 slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic workspace")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    slower = []
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                slower = regressions(report, json.load(f), args.tolerance)
+        except (OSError, ValueError) as e:
+            print(f"Baseline error: {e}", file=sys.stderr)
+            return 2
+        report["regressions"] = [{"name": n, "baseline_ms": b, "p50_ms": c} for n, b, c in slower]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        ws = report["workspace"]
+        print(f"workspace: {ws['tools']} tools, {ws['guides']} guides x {ws['guide_kb']} KB, "
+              f"tree {ws['fanout']}^{ws['depth']} (built in {ws['build_s']} s), {args.repeat} runs each")
+        print(f"{'hot path':<20} {'p50':>10} {'p95':>10} {'items/s':>12} {'stats':>7} {'read':>10}")
+        for name, r in report["results"].items():
+            rate = f"{r['items_per_s']:,.0f}" if r["items_per_s"] else "-"
+            print(f"{name:<20} {r['p50_ms']:>8.2f}ms {r['p95_ms']:>8.2f}ms {rate:>12} "
+                  f"{r['stat_calls']:>7} {r['bytes_read'] // 1024:>8}KB")
+        for name, before, now in slower:
+            print(f"REGRESSION {name}: {before:.2f} ms -> {now:.2f} ms")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — command line
+Answers tool, guide and file format queries without starting the GUI.
+Never imports tkinter, so it is quick enough to call from batch files.
+
+    tw1_hub_cli.py --which par_tool
+    tw1_hub_cli.py --format .lhc
+    tw1_hub_cli.py --find "pack wd" --json
+    tw1_hub_cli.py --launch wd_repacker
+    tw1_hub_cli.py --find editor --profile
+    tw1_hub_cli.py --storage sqlite
+    tw1_hub_cli.py --usage
+    tw1_hub_cli.py --workflow map_to_mod
+    tw1_hub_cli.py --batch vdf_to_obj --folder Models --jobs 4
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+
+from tw1_hub_core import (
+    VERSION, DEFAULT_DISCOVERY_DEPTH, FILE_FORMATS, TOOL_FIELDS, GUIDE_FIELDS, FORMAT_FIELDS,
+    ConfigStore, save_config, resolve_guides_dir, all_tools, workspace_roots, launch_tool, format_records, search_guides,
+    GuideIndex, SearchEngine, ToolLocator, WorkspaceScanner, Catalog, UsageLog, PROFILER,
+)
+
+EXIT_OK = 0
+EXIT_NOT_FOUND = 1
+EXIT_ERROR = 2
+BAR_WIDTH = 30
+
+
+class HubQueries:
+    """The hub's lookups (tool paths, catalogs, search) without any window."""
+
+    def __init__(self, cfg, lang):
+        self.cfg = cfg
+        self.lang = lang
+        self.guides_dir = resolve_guides_dir(cfg)
+        self.tools = all_tools(cfg)
+        self.locator = ToolLocator()
+        self._catalog = None
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            self._catalog = Catalog(self.cfg, self.guides_dir)
+            self._catalog.refresh()
+        return self._catalog
+
+    def tool(self, name):
+        """Tool by id, name or filename (case-insensitive)."""
+        key = name.lower()
+        return next((tool for tool in self.tools if key in tool.lookup_keys), None)
+
+    def find_tool_path(self, tool, scan=False):
+        path = self.locator.find(tool, self.cfg.get("tool_paths", {}))
+        if path is None and scan:
+            scanner = WorkspaceScanner()
+            scanner.start(workspace_roots(self.cfg), [tool],
+                          max_depth=self.cfg.get("discovery_depth", DEFAULT_DISCOVERY_DEPTH),
+                          ignore=self.cfg.get("discovery_ignore", []))
+            for tool_id, hit, depth in scanner.collect():
+                self.locator.add_discovered(tool_id, hit, depth)
+            path = self.locator.find(tool, self.cfg.get("tool_paths", {}))
+        return path
+
+    def tool_record(self, tool, scan=False):
+        path = self.find_tool_path(tool, scan)
+        return {"id": tool.get("id"), "name": tool.get("name"), "filename": tool.get("filename"),
+                "formats": tool.get("formats", []), "found": path is not None, "path": path}
+
+    def format_info(self, ext):
+        ext = ext.lower() if ext.startswith(".") else "." + ext.lower()
+        desc = FILE_FORMATS.get(ext)
+        if desc is None:
+            return None
+        tools = [t.get("id") or t.get("name") for t in self.tools if ext in t.get("formats", [])]
+        return {"format": ext, "description": desc.get(self.lang, desc.get("en", "")), "tools": tools}
+
+    def find(self, query, limit):
+        engines = {}
+        for kind, fields, items in (("tools", TOOL_FIELDS, self.tools),
+                                    ("guides", GUIDE_FIELDS, self.catalog.guides),
+                                    ("formats", FORMAT_FIELDS, format_records())):
+            engines[kind] = SearchEngine(fields)
+            engines[kind].build(items)
+
+        index = GuideIndex()
+        index.refresh(self.catalog.guides, self.guides_dir)
+        guides = search_guides(engines["guides"], index, self.catalog.guides, query, limit)
+
+        title_key = f"title_{self.lang}"
+        return {
+            "tools": [{"id": t.get("id"), "name": t.get("name")} for t in engines["tools"].search(query, limit)],
+            "guides": [{"id": g.get("id"), "title": g.get(title_key, g.get("title_en", ""))}
+                       for g in guides],
+            "formats": [{"format": f["name"], "description": f[f"desc_{self.lang}"] or f["desc_en"]}
+                        for f in engines["formats"].search(query, limit)],
+        }
+
+
+def _print_find(result):
+    for kind in ("tools", "guides", "formats"):
+        if result[kind]:
+            print(f"{kind.capitalize()}:")
+            for hit in result[kind]:
+                label = hit.get("name") or hit.get("title") or hit.get("format")
+                ident = hit.get("id")
+                print(f"  {label}" + (f"  [{ident}]" if ident else f"  {hit.get('description', '')[:70]}"))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tw1_hub_cli",
+                                     description="Query the TW1 Modding Hub without opening its window.")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--which", metavar="TOOL", help="print the path of a tool (id, name or filename)")
+    action.add_argument("--launch", metavar="TOOL", help="start a tool like the hub's Launch button")
+    action.add_argument("--format", metavar="EXT", help="describe a file format, e.g. .wd or lhc")
+    action.add_argument("--find", metavar="QUERY", help="search tools, guides and file formats")
+    action.add_argument("--list", action="store_true", help="list all tools and whether they were found")
+    action.add_argument("--workflow", metavar="ID",
+                        help="run a workflow such as map_to_mod; unchanged steps are skipped")
+    action.add_argument("--batch", metavar="TOOL",
+                        help="run a tool over every matching file of --folder (resumes an unfinished run)")
+    action.add_argument("--usage", action="store_true",
+                        help="per-tool launch statistics from the hub's usage log")
+    action.add_argument("--storage", choices=["json", "sqlite"],
+                        help="move user tools, guides and tool paths to this storage")
+    action.add_argument("--export-config", metavar="FILE",
+                        help="write the whole config, guide bodies included, as one JSON file")
+    parser.add_argument("--json", action="store_true", help="print JSON for scripts")
+    parser.add_argument("--lang", choices=["en", "de"], help="language of descriptions and titles")
+    parser.add_argument("--scan", action="store_true",
+                        help="also search the workspace folders for tools that are not found directly")
+    parser.add_argument("--limit", type=int, default=10, help="results per category for --find")
+    batch = parser.add_argument_group("batch runs")
+    batch.add_argument("--folder", default=".", help="folder with the input files (default: current)")
+    batch.add_argument("--glob", default="**/*", help="which files under --folder, e.g. '*.vdf' (default: all)")
+    # Defaults come from tw1_hub_batch, which is only imported for --batch
+    batch.add_argument("--jobs", type=int, help="processes at a time (default: CPUs - 1, at most 8)")
+    batch.add_argument("--timeout", type=float, help="seconds per file (default: 300)")
+    batch.add_argument("--retries", type=int, help="extra attempts per failed file (default: 1)")
+    batch.add_argument("--fresh", action="store_true", help="ignore the manifest of an earlier run")
+    parser.add_argument("--profile", action="store_true",
+                        help="print timing spans and counters as JSON to stderr when done")
+    parser.add_argument("--version", action="version", version=f"TW1 Modding Hub {VERSION}")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not args.profile:
+        return run(args)
+    PROFILER.enable()
+    try:
+        return run(args)
+    finally:
+        json.dump(PROFILER.snapshot(), sys.stderr, indent=2)
+        print(file=sys.stderr)
+
+
+def run(args):
+    store = ConfigStore()
+    cfg = store.cfg
+    hub = HubQueries(cfg, args.lang or cfg.get("lang", "en"))
+
+    def emit(data, text):
+        print(json.dumps(data, indent=2, ensure_ascii=False) if args.json else text)
+
+    if args.storage or args.export_config:
+        if args.storage:
+            ok = store.set_storage(args.storage)
+            target = store.backend.db_path if args.storage == "sqlite" else store.path
+        else:
+            ok = save_config(store.export(), args.export_config)
+            target = args.export_config
+        store.backend.close()
+        emit({"ok": ok, "path": target}, f"{'Saved' if ok else 'Could not write'} {target}")
+        return EXIT_OK if ok else EXIT_ERROR
+
+    if args.usage:
+        stats = UsageLog().stats()
+
+        def ms(value):
+            return "-" if value is None else f"{value:,.0f}"
+
+        lines = [f"{'tool':<22} {'launches':>8} {'start p50/p95 ms':>18} {'run p50/p95 s':>16} {'peak MB':>8}"]
+        for tool_id, st in sorted(stats.items(), key=lambda kv: -kv[1]["launches"]):
+            run_s = "-" if st["run_p50_s"] is None else f"{st['run_p50_s']:,.0f}/{st['run_p95_s']:,.0f}"
+            lines.append(f"{tool_id:<22} {st['launches']:>8} "
+                         f"{ms(st['start_p50_ms']) + '/' + ms(st['start_p95_ms']):>18} "
+                         f"{run_s:>16} {ms(st['peak_mb']):>8}")
+        emit(stats, "\n".join(lines))
+        return EXIT_OK
+
+    if args.workflow:
+        return run_workflow(args, cfg, emit)
+
+    if args.list:
+        records = [hub.tool_record(t, args.scan) for t in hub.tools]
+        emit(records, "\n".join(f"{'+' if r['found'] else '-'} {r['id']:<22} {r['path'] or ''}" for r in records))
+        return EXIT_OK
+
+    if args.format:
+        info = hub.format_info(args.format)
+        if info is None:
+            emit({"format": args.format, "error": "unknown format"}, f"Unknown format: {args.format}")
+            return EXIT_NOT_FOUND
+        emit(info, f"{info['format']}  {info['description']}\nTools: {', '.join(info['tools']) or '-'}")
+        return EXIT_OK
+
+    if args.find:
+        result = hub.find(args.find, args.limit)
+        if args.json:
+            emit(result, "")
+        else:
+            _print_find(result)
+        return EXIT_OK if any(result.values()) else EXIT_NOT_FOUND
+
+    name = args.which or args.launch or args.batch
+    tool = hub.tool(name)
+    if tool is None:
+        emit({"tool": name, "error": "unknown tool"}, f"Unknown tool: {name}")
+        return EXIT_NOT_FOUND
+    record = hub.tool_record(tool, args.scan)
+    if not record["found"]:
+        emit(record, f"Tool not found: {tool.get('filename', '?')}")
+        return EXIT_NOT_FOUND
+
+    if args.batch:
+        return run_batch(args, tool, record["path"], emit)
+
+    if args.launch:
+        try:
+            record["pid"] = launch_tool(tool, record["path"]).pid
+        except OSError as e:
+            record["error"] = str(e)
+            emit(record, f"Launch error: {e}")
+            return EXIT_ERROR
+    emit(record, record["path"])
+    return EXIT_OK
+
+
+def run_workflow(args, cfg, emit):
+    """Run a workflow with the variables saved by the hub; manual steps wait for Enter."""
+    from tw1_hub_workflow import WorkflowRunner, WorkflowError, builtin_workflows, workflow_vars
+    try:
+        workflow = next((w for w in builtin_workflows() if w.id == args.workflow), None)
+    except WorkflowError as e:
+        emit({"error": str(e)}, f"Invalid workflow: {e}")
+        return EXIT_ERROR
+    if workflow is None:
+        emit({"workflow": args.workflow, "error": "unknown workflow"}, f"Unknown workflow: {args.workflow}")
+        return EXIT_NOT_FOUND
+    lang = args.lang or cfg.get("lang", "en")
+    results = []
+
+    def on_event(step_id, state, seconds, message):
+        step = workflow.by_id[step_id]
+        if state == "running":
+            return
+        results.append({"step": step_id, "state": state, "seconds": seconds, "message": message})
+        if args.json:
+            return
+        timing = "" if seconds is None else f" ({seconds:.2f} s)"
+        print(f"{state:<8} {step.name(lang)}{timing}")
+        if state == "waiting":
+            print("\n".join(f"         {line}" for line in message.splitlines()))
+            print("         Press Enter when done.", flush=True)
+            threading.Thread(target=wait_for_user, args=(step_id,), daemon=True).start()
+        elif state == "failed" and message:
+            print("\n".join(f"         {line}" for line in message.splitlines()))
+
+    def wait_for_user(step_id):
+        try:
+            input()
+        except EOFError:
+            runner.cancel()
+            return
+        runner.confirm(step_id)
+
+    # With --json nobody is at the keyboard: manual steps that are not up to date fail
+    runner = WorkflowRunner(workflow, workflow_vars(workflow, cfg), on_event=on_event,
+                            interactive=not args.json)
+    ok = runner.run()
+    if args.json:
+        emit({"workflow": workflow.id, "ok": ok, "steps": results}, "")
+    return EXIT_OK if ok else EXIT_ERROR
+
+
+def run_batch(args, tool, path, emit):
+    from tw1_hub_batch import BATCH_WORKERS, BATCH_TIMEOUT_S, BATCH_RETRIES, BatchRun, batch_inputs
+    if not batch_inputs(tool):
+        emit({"tool": tool.get("id"), "error": "no batch mode"}, f"{tool.get('name')} has no batch mode")
+        return EXIT_ERROR
+    show = not args.json and sys.stderr.isatty()
+
+    def on_progress(job, counts):
+        if show:
+            finished = counts["done"] + counts["skipped"] + counts["failed"]
+            filled = BAR_WIDTH * finished // max(counts["total"], 1)
+            print(f"\r[{'#' * filled}{'.' * (BAR_WIDTH - filled)}] {finished}/{counts['total']}"
+                  f"  {counts['failed']} failed", end="", file=sys.stderr, flush=True)
+
+    run = BatchRun(tool, path, args.folder, args.glob,
+                   workers=BATCH_WORKERS if args.jobs is None else args.jobs,
+                   timeout=BATCH_TIMEOUT_S if args.timeout is None else args.timeout,
+                   retries=BATCH_RETRIES if args.retries is None else args.retries,
+                   fresh=args.fresh, on_progress=on_progress)
+    try:
+        ok = run.run()
+    except KeyboardInterrupt:
+        run.cancel()
+        ok = False
+    if show:
+        print(file=sys.stderr)
+    counts = run.counts
+    failed = [os.path.relpath(job.input, run.folder) for job in run.jobs if job.state in ("failed", "timeout")]
+    emit({**counts, "failed_files": failed, "manifest": run.manifest_path, "log": run.log_path},
+         f"{counts['done']} done, {counts['skipped']} already done, {counts['failed']} failed "
+         f"of {counts['total']}  (log: {run.log_path})")
+    return EXIT_OK if ok else EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
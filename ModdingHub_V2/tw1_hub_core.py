@@ -0,0 +1,2069 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — core
+Data, configuration, guide/tool catalogs, caches and search shared by the
+GUI (tw1_modding_hub.py) and the command line (tw1_hub_cli.py).
+Never imports tkinter.
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import marshal
+import functools
+import heapq
+import bisect
+import queue
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+# subprocess and concurrent.futures are imported where they are used, so
+# scripts that only want the data tables do not pay for them
+
+VERSION = "2.0"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, 'frozen', False) else __file__))
+CONFIG_FILE = os.path.join(SCRIPT_DIR, "tw1_modding_hub.json")
+CONFIG_BACKUP_SUFFIX = ".bak"          # previous config generation, next to the config
+CONFIG_SAVE_DELAY_MS = 500             # config changes are written once this long after the last one
+DB_KEYS = ("user_tools", "user_guides", "tool_paths")   # kept in SQLite with "storage": "sqlite"
+INDEX_FILE = os.path.join(SCRIPT_DIR, "tw1_modding_hub_index.json")
+USAGE_FILE = os.path.join(SCRIPT_DIR, "tw1_modding_hub_usage.jsonl")
+DATA_FILE = os.path.join(SCRIPT_DIR, "tw1_hub_data.json")
+DATA_CACHE = os.path.join(SCRIPT_DIR, "tw1_hub_data.cache")
+DATA_FORMAT = 1
+GUIDES_DIR = os.path.join(SCRIPT_DIR, "guides")
+
+# Background tool discovery (overridable in the config)
+DEFAULT_WORKSPACE_ROOTS = ["."]   # relative to the hub folder
+DEFAULT_DISCOVERY_DEPTH = 4
+DISCOVERY_IGNORE = {".git", ".svn", "__pycache__", "node_modules", ".venv", "venv",
+                    "$recycle.bin", "system volume information"}
+DISCOVERY_WORKERS = 4
+
+GUIDE_CACHE_BYTES = 16 * 1024 * 1024   # decoded guide text kept in memory
+MMAP_THRESHOLD = 4 * 1024 * 1024       # larger guide files are paged from an mmap
+SEARCH_LIMIT = 200                     # ranked results shown per tab
+KILL_GRACE_S = 2.0                     # a killed tool gets this long to exit before SIGKILL
+WARM_SCRIPT = os.path.join(SCRIPT_DIR, "tw1_hub_warm.py")
+WARM_MODULES = ("tkinter", "tkinter.ttk", "tkinter.filedialog", "tkinter.messagebox",
+                "zlib", "struct", "json", "re", "io", "threading", "subprocess")
+PROFILE_ENV = "TW1HUB_PROFILE"         # set to 1 to collect spans and counters
+PROFILE_WINDOW = 512                   # samples kept per span for p50/p95
+
+# ============================================================
+# PROFILING
+# ============================================================
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Timing spans and counters for the hot paths, off unless enabled.
+
+    Disabled, a span costs one attribute check. Enabled, every span keeps
+    its last PROFILE_WINDOW durations for rolling p50/p95, os.stat calls are
+    counted, and the loaders report the bytes they read. The GUI can also
+    run cProfile alongside and export its trace.
+    """
+
+    NULL_SPAN = _NullSpan()
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = {}       # name -> deque of recent durations (seconds)
+        self.totals = {}      # name -> [calls, total seconds]
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._real_stat = None
+        self._cprofile = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        real_stat = self._real_stat = os.stat
+
+        def counting_stat(*args, **kwargs):
+            self.count("os.stat")
+            return real_stat(*args, **kwargs)
+        os.stat = counting_stat
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        os.stat = self._real_stat
+        self.stop_cprofile()
+
+    def start_cprofile(self):
+        import cProfile
+        if self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop_cprofile(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+
+    @property
+    def cprofile_running(self):
+        return self._cprofile is not None
+
+    def span(self, name):
+        """Context manager timing one run of a hot path."""
+        return _Span(self, name) if self.enabled else self.NULL_SPAN
+
+    def timed(self, name):
+        """Decorator form of span()."""
+        def wrap(func):
+            @functools.wraps(func)
+            def timed_call(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return timed_call
+        return wrap
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self.spans.get(name)
+            if samples is None:
+                samples = self.spans[name] = deque(maxlen=PROFILE_WINDOW)
+                self.totals[name] = [0, 0.0]
+            samples.append(seconds)
+            total = self.totals[name]
+            total[0] += 1
+            total[1] += seconds
+
+    def count(self, name, n=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def stats(self):
+        """{span: {calls, p50_ms, p95_ms, max_ms, total_ms}} over the rolling window."""
+        with self._lock:
+            items = [(name, sorted(samples), list(self.totals[name]))
+                     for name, samples in self.spans.items()]
+        result = {}
+        for name, samples, (calls, total) in items:
+            last = len(samples) - 1
+            result[name] = {
+                "calls": calls,
+                "p50_ms": round(samples[last // 2] * 1000, 3),
+                "p95_ms": round(samples[int(last * 0.95)] * 1000, 3),
+                "max_ms": round(samples[-1] * 1000, 3),
+                "total_ms": round(total * 1000, 3),
+            }
+        return result
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self.counters)
+        return {"version": VERSION, "time": time.time(),
+                "spans": self.stats(), "counters": counters}
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.totals.clear()
+            self.counters.clear()
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def export_cprofile(self, path):
+        """Dump the cProfile trace (pstats format) and keep profiling."""
+        if self._cprofile is None:
+            raise RuntimeError("cProfile is not running")
+        self._cprofile.dump_stats(path)   # dump_stats stops the collector
+        self._cprofile.enable()
+
+
+PROFILER = Profiler()
+if os.environ.get(PROFILE_ENV, "").strip() not in ("", "0"):
+    PROFILER.enable()
+
+
+# ============================================================
+# DATA PACK
+# ============================================================
+# UI strings, the file format database, built-in tools/guides and credits
+# live in tw1_hub_data.json. Table name -> key in the pack:
+DATA_TABLES = {"LANG": "strings", "FILE_FORMATS": "file_formats", "BUILTIN_TOOLS": "tools",
+               "BUILTIN_GUIDES": "guides", "CREDITS": "credits", "WORKFLOWS": "workflows"}
+
+
+class DataPack:
+    """The hub's static data, loaded on first use through a marshal cache.
+
+    The JSON pack is the source of truth. Its SHA-1 keys a marshal cache
+    next to it, so later starts skip JSON parsing; a changed pack, another
+    DATA_FORMAT or another marshal version rebuilds the cache. Embedded
+    guide bodies are kept as marshalled bytes inside the cache and only
+    decoded when a guide is opened; their digests feed the search index
+    without decoding them.
+    """
+
+    def __init__(self, path=DATA_FILE, cache_path=DATA_CACHE):
+        self.path = path
+        self.cache_path = cache_path
+        self.tables = {}
+        self._bodies = {}       # guide id -> {lang: marshalled text}
+        self._digests = {}      # guide id -> {lang: sha1 of the text}
+        self._decoded = {}
+        self._load()
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        PROFILER.count("bytes read", len(raw))
+        key = [DATA_FORMAT, marshal.version, hashlib.sha1(raw).hexdigest()]
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = marshal.load(f)
+            if cached.get("key") == key:
+                self.tables, self._bodies, self._digests = cached["tables"], cached["bodies"], cached["digests"]
+                return
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass  # missing, stale or unreadable cache: rebuild from the pack
+
+        pack = json.loads(raw.decode("utf-8"))
+        if pack.get("format") != DATA_FORMAT:
+            raise ValueError(f"{self.path}: unsupported data pack format {pack.get('format')!r}")
+        self.tables = {name: pack[section] for name, section in DATA_TABLES.items()}
+        self._bodies, self._digests = {}, {}
+        for guide_id, bodies in pack.get("guide_bodies", {}).items():
+            self._bodies[guide_id] = {lang: marshal.dumps(text) for lang, text in bodies.items()}
+            self._digests[guide_id] = {lang: hashlib.sha1(text.encode("utf-8")).hexdigest()
+                                       for lang, text in bodies.items()}
+        try:
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump({"key": key, "tables": self.tables, "bodies": self._bodies,
+                              "digests": self._digests}, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass  # read-only install: the pack still works, just without the cache
+
+    def table(self, name):
+        return self.tables[name]
+
+    def body(self, guide_id, lang):
+        """Embedded text of a built-in guide, decoded on first use (None if absent)."""
+        key = (guide_id, lang)
+        if key not in self._decoded:
+            data = self._bodies.get(guide_id, {}).get(lang)
+            self._decoded[key] = marshal.loads(data) if data is not None else None
+        return self._decoded[key]
+
+    def body_digest(self, guide_id, lang):
+        return self._digests.get(guide_id, {}).get(lang)
+
+
+_data_pack = None
+_data_lock = threading.Lock()
+
+
+def data_pack():
+    global _data_pack
+    if _data_pack is None:
+        with _data_lock:
+            if _data_pack is None:
+                _data_pack = DataPack()
+    return _data_pack
+
+
+def data_table(name):
+    return data_pack().table(name)
+
+
+def __getattr__(name):
+    # LANG, FILE_FORMATS, ... are loaded from the pack the first time they are used
+    if name in DATA_TABLES:
+        value = globals()[name] = data_table(name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ============================================================
+# CATALOG RECORDS
+# ============================================================
+def _ext(fmt):
+    fmt = fmt.strip().lower()
+    return fmt if fmt.startswith(".") else "." + fmt
+
+
+class Record:
+    """Immutable, slotted catalog entry built from a tool or guide dict.
+
+    Known keys become attributes (lists are stored as tuples, missing keys
+    as None). `get`, `[]` and `in` read like the dict the record came
+    from, so code written against plain dicts keeps working. The lowercase
+    text of every search field is computed once, at construction.
+    """
+    __slots__ = ("_search",)
+    KEYS = ()
+    LISTS = frozenset()
+    SEARCH = ()
+
+    def __init__(self, data, **overrides):
+        values = dict(data, **overrides)
+        init = object.__setattr__
+        for key in self.KEYS:
+            value = values.get(key)
+            if key in self.LISTS:
+                value = tuple(value) if value else ()
+            init(self, key, value)
+        init(self, "_search", tuple(self._search_field(field).lower() for field in self.SEARCH))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} records are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} records are immutable")
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self.KEYS else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.get('id')!r})"
+
+    def search_text(self, field):
+        """Precomputed lowercase text of a search field ("" for unknown fields)."""
+        try:
+            return self._search[self.SEARCH.index(field)]
+        except ValueError:
+            return ""
+
+    def as_dict(self):
+        """The record as a plain dict (lists again), e.g. for JSON output."""
+        return {key: list(value) if key in self.LISTS else value
+                for key in self.KEYS if (value := getattr(self, key)) is not None}
+
+    def _search_field(self, field):
+        return ""
+
+
+class Tool(Record):
+    __slots__ = ("id", "name", "icon", "filename", "type", "desc_en", "desc_de", "formats", "tags",
+                 "search_paths", "tool_path", "download", "guide_ids", "max_instances", "batch",
+                 "custom", "lookup_keys")
+    KEYS = ("id", "name", "icon", "filename", "type", "desc_en", "desc_de", "formats", "tags",
+            "search_paths", "tool_path", "download", "guide_ids", "max_instances", "batch", "custom")
+    LISTS = frozenset({"formats", "tags", "search_paths", "guide_ids"})
+    SEARCH = ("name", "formats", "desc", "format_desc")
+
+    def __init__(self, data, **overrides):
+        values = dict(data, **overrides)
+        values["formats"] = [_ext(fmt) for fmt in values.get("formats") or () if fmt.strip()]
+        super().__init__(values)
+        keys = {str(self.get(key, "")).lower() for key in ("id", "name", "filename")}
+        keys.discard("")
+        object.__setattr__(self, "lookup_keys", frozenset(keys))
+
+    def _search_field(self, field):
+        if field == "name":
+            return self.name or ""
+        if field == "formats":
+            return " ".join(self.get("formats", ()))
+        if field == "desc":
+            return f"{self.desc_en or ''} {self.desc_de or ''}"
+        formats = data_table("FILE_FORMATS")
+        return " ".join(f"{d.get('en', '')} {d.get('de', '')}"
+                        for d in (formats.get(fmt) for fmt in self.formats) if d)
+
+
+class Guide(Record):
+    __slots__ = ("id", "title_en", "title_de", "icon", "tags", "tool_ids", "file_en", "file_de",
+                 "content_en", "content_de", "fallback_en", "fallback_de", "embedded", "stored",
+                 "custom", "auto_discovered")
+    KEYS = __slots__
+    LISTS = frozenset({"tags", "tool_ids"})
+    SEARCH = ("title", "tags", "tools")
+
+    def _search_field(self, field):
+        if field == "title":
+            return f"{self.title_en or ''} {self.title_de or ''}"
+        if field == "tags":
+            return " ".join(self.get("tags", ()))
+        return " ".join(self.get("tool_ids", ()))
+
+
+_BUILTIN_RECORDS = {}
+
+
+def builtin_records(name):
+    """Built-in tools ("BUILTIN_TOOLS") or guides ("BUILTIN_GUIDES") as shared records."""
+    records = _BUILTIN_RECORDS.get(name)
+    if records is None:
+        make = Tool if name == "BUILTIN_TOOLS" else Guide
+        records = _BUILTIN_RECORDS[name] = tuple(make(item) for item in data_table(name))
+    return records
+
+
+# ============================================================
+# CONFIG MANAGEMENT
+# ============================================================
+def _read_config(path):
+    with open(path, "r", encoding="utf-8") as f:
+        if PROFILER.enabled:
+            PROFILER.count("bytes read", os.fstat(f.fileno()).st_size)
+        return json.load(f)
+
+
+def load_config(path=CONFIG_FILE):
+    """The config at `path`, its backup if the file is missing or damaged, or defaults."""
+    for candidate in (path, path + CONFIG_BACKUP_SUFFIX):
+        if os.path.exists(candidate):
+            try:
+                return _read_config(candidate)
+            except Exception:
+                pass
+    return {"lang": "en", "view_mode": "grid", "font_size": 10,
+            "guides_dir": GUIDES_DIR,
+            "user_tools": [], "user_guides": [], "tool_paths": {}}
+
+
+@PROFILER.timed("save_config")
+def save_config(cfg, path=CONFIG_FILE):
+    """Write the config atomically: temp file, previous version to .bak, rename.
+
+    The backup is a hard link to (or, where links aren't supported, a copy
+    of) the current file, and the temp file is then renamed over it, so
+    the config path exists at every moment: other instances and a crash
+    see either the old or the new file. Returns True on success.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cfg, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            backup = path + CONFIG_BACKUP_SUFFIX
+            try:
+                os.remove(backup)
+            except OSError:
+                pass
+            try:
+                os.link(path, backup)
+            except OSError:
+                import shutil
+                shutil.copy2(path, backup)
+        os.replace(tmp, path)
+        return True
+    except Exception as e:
+        print(f"Config save error: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
+_MISSING = object()
+
+
+def _merge_items(base, ours, theirs):
+    """Three-way merge of lists of {"id": ...} dicts (user tools/guides)."""
+    b = {item.get("id"): item for item in base}
+    o = {item.get("id"): item for item in ours}
+    t = {item.get("id"): item for item in theirs}
+    merged = []
+    for item in ours:
+        key = item.get("id")
+        if key in b and item == b[key]:
+            if key not in t:
+                continue                    # deleted by the other instance
+            item = t[key]                   # unchanged here: take their version
+        merged.append(item)
+    merged += [item for key, item in t.items() if key not in o and key not in b]
+    return merged
+
+
+def _merge_config(base, ours, theirs):
+    """Three-way merge of config values; where both sides changed, ours wins."""
+    if ours == base:
+        return theirs
+    if theirs == base or theirs == ours:
+        return ours
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(ours) + [k for k in theirs if k not in ours]:
+            value = _merge_config(base.get(key, _MISSING), ours.get(key, _MISSING),
+                                  theirs.get(key, _MISSING))
+            if value is not _MISSING:
+                merged[key] = value
+        return merged
+    if (isinstance(ours, list) and isinstance(theirs, list) and isinstance(base, list)
+            and all(isinstance(item, dict) for item in base + ours + theirs)):
+        return _merge_items(base, ours, theirs)
+    return ours
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+class JsonConfigBackend:
+    """Everything in the one JSON config file (the default storage)."""
+
+    def __init__(self, path=CONFIG_FILE):
+        self.path = path
+
+    def load(self, settings=None):
+        return settings if settings is not None else load_config(self.path)
+
+    def read(self):
+        return _read_config(self.path)
+
+    def stamp(self):
+        return _file_stamp(self.path)
+
+    def bodies(self, guide_id):
+        return {}
+
+    def save(self, cfg):
+        return save_config(cfg, self.path)
+
+    def close(self):
+        pass
+
+
+def config_backend(path, cfg):
+    """Storage backend named by a loaded config's "storage" key."""
+    if cfg.get("storage") == "sqlite":
+        from tw1_hub_sqlite import SqliteConfigBackend
+        db_path = cfg.get("storage_path")
+        return SqliteConfigBackend(path, os.path.join(os.path.dirname(path), db_path) if db_path else None)
+    return JsonConfigBackend(path)
+
+
+class ConfigStore:
+    """The config dict plus coalesced, atomic, merge-on-write persistence.
+
+    `save()` only marks the config dirty; the write happens once no save
+    came in for CONFIG_SAVE_DELAY_MS, so a burst of toggles costs a single
+    write and a single timer. `schedule(ms, callback)` / `cancel(handle)`
+    default to threading.Timer (headless use); the GUI passes Tk's
+    after/after_cancel so writes run on the Tk thread. Before writing,
+    `sync()` compares the backend's stamp (file mtime and size, plus the
+    database generation for SQLite storage) with what was last read or
+    written; if another hub instance changed it, the edit is merged key by
+    key (user tools and guides by id) against the last common version,
+    and `on_reload` is called.
+    """
+
+    def __init__(self, path=CONFIG_FILE, schedule=None, cancel=None, on_reload=None):
+        self.path = path
+        settings = load_config(path)
+        self.backend = config_backend(path, settings)
+        self.cfg = self.backend.load(settings)
+        self.on_reload = on_reload
+        self._schedule = schedule or self._timer
+        self._cancel = cancel or (lambda timer: timer.cancel())
+        self._base = json.loads(json.dumps(self.cfg))   # last version shared with the disk
+        self._stamp = self.backend.stamp()
+        self._pending = None
+        self._due = 0.0
+        self.dirty = False
+
+    @staticmethod
+    def _timer(ms, callback):
+        timer = threading.Timer(ms / 1000, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def save(self):
+        """Mark the config changed; the write happens after a short quiet period."""
+        self.dirty = True
+        self._due = time.monotonic() + CONFIG_SAVE_DELAY_MS / 1000
+        if self._pending is None:
+            self._pending = self._schedule(CONFIG_SAVE_DELAY_MS, self._on_timer)
+
+    def _on_timer(self):
+        self._pending = None
+        remaining = self._due - time.monotonic()
+        if remaining > 0.001:
+            # saved again meanwhile: wait out the rest of the quiet period
+            self._pending = self._schedule(int(remaining * 1000) + 1, self._on_timer)
+        else:
+            self.flush()
+
+    def flush(self):
+        """Write now if anything changed. Returns True if the file is up to date."""
+        if self._pending is not None:
+            self._cancel(self._pending)
+            self._pending = None
+        self.sync()
+        if not self.dirty:
+            return True
+        if not self.backend.save(self.cfg):
+            return False
+        self.dirty = False
+        self._base = json.loads(json.dumps(self.cfg))
+        self._stamp = self.backend.stamp()
+        return True
+
+    def sync(self):
+        """Merge edits another process made to the file. Returns True if there were any."""
+        stamp = self.backend.stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        try:
+            theirs = self.backend.read()
+        except Exception:
+            return False            # half-written by a non-atomic writer: retry next time
+        self._stamp = stamp
+        merged = _merge_config(self._base, self.cfg, theirs)
+        self._base = json.loads(json.dumps(theirs))
+        if merged is not self.cfg:
+            self.cfg.clear()
+            self.cfg.update(merged)   # in place: the catalog and UI hold this dict
+        self.dirty = self.cfg != self._base
+        if self.on_reload:
+            self.on_reload()
+        return True
+
+    def close(self):
+        self.flush()
+        self.backend.close()
+
+    def export(self):
+        """The whole config in the JSON layout, stored guide bodies included."""
+        cfg = json.loads(json.dumps(self.cfg))
+        for key in ("storage", "storage_path"):
+            cfg.pop(key, None)
+        for guide in cfg.get("user_guides", []):
+            if guide.pop("stored", None):
+                for lang, body in self.backend.bodies(guide.get("id")).items():
+                    guide.setdefault(f"content_{lang}", body)
+        return cfg
+
+    def set_storage(self, storage):
+        """Move the config to "json" or "sqlite" storage. Returns True on success."""
+        self.flush()
+        cfg = self.export()
+        if storage == "sqlite":
+            cfg["storage"] = "sqlite"
+        backend = config_backend(self.path, cfg)
+        backend.load()      # snapshot what an older database holds, so the save replaces it
+        if not backend.save(cfg):
+            backend.close()
+            return False
+        self.backend.close()
+        self.backend = backend
+        self.cfg.clear()
+        self.cfg.update(backend.load())
+        self._base = json.loads(json.dumps(self.cfg))
+        self._stamp = backend.stamp()
+        return True
+
+
+def resolve_guides_dir(cfg):
+    """Configured guides folder, or the first existing default spelling next to the hub."""
+    guides_dir = cfg.get("guides_dir", GUIDES_DIR)
+    if not os.path.isdir(guides_dir):
+        for alt in ["guides", "Guids", "Guides", "guids"]:
+            alt_path = os.path.join(SCRIPT_DIR, alt)
+            if os.path.isdir(alt_path):
+                return alt_path
+    return guides_dir
+
+
+def all_tools(cfg):
+    """Built-in tools followed by the user's custom tools, as Tool records."""
+    return list(builtin_records("BUILTIN_TOOLS")) + [Tool(ut, custom=True) for ut in cfg.get("user_tools", [])]
+
+
+# ============================================================
+# GUIDE FILE LOADER
+# ============================================================
+@PROFILER.timed("load_guide_content")
+def load_guide_content(guide, lang, guides_dir):
+    """Load guide content from external file or fallback to embedded."""
+    file_key = f"file_{lang}"
+    content_key = f"content_{lang}"
+
+    # Try external file first
+    if file_key in guide:
+        filepath = os.path.join(guides_dir, guide[file_key])
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    if PROFILER.enabled:
+                        PROFILER.count("bytes read", os.fstat(f.fileno()).st_size)
+                    return f.read()
+            except Exception:
+                pass
+
+    # Fallback to embedded content (user guides carry it, built-ins keep it in the data pack)
+    if content_key in guide:
+        return guide[content_key]
+    if guide.get("embedded"):
+        body = data_pack().body(guide.get("id"), lang)
+        if body is not None:
+            return body
+    if guide.get("stored"):
+        from tw1_hub_sqlite import guide_body
+        body = guide_body(guide["stored"], guide.get("id"), lang)
+        if body is not None:
+            return body
+
+    # Fallback text
+    fallback_key = f"fallback_{lang}"
+    if fallback_key in guide:
+        return guide[fallback_key]
+
+    # Final fallback
+    return data_table("LANG").get("guide_not_found", {}).get(lang, "Guide file not found.")
+
+
+def guide_file(guide, lang, guides_dir):
+    """Path of the guide file for a language, or None if it is embedded/missing."""
+    fname = guide.get(f"file_{lang}")
+    if fname:
+        filepath = os.path.join(guides_dir, fname)
+        if os.path.isfile(filepath):
+            return filepath
+    return None
+
+
+# ============================================================
+# GUIDE CONTENT CACHE
+# ============================================================
+MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+RULE_RE = re.compile(r"^\s*([=\-\u2500\u2550])\1{2,}\s*$")
+
+
+def parse_sections(lines):
+    """Build the section table of a guide from an iterable of lines.
+
+    Recognises Markdown `#` headings (outside code fences), banner titles
+    framed by `====` rules, and text lines underlined with `====` (level 1)
+    or `----`/`\u2500\u2500\u2500\u2500` (level 2). Returns (title, level, line, offset)
+    tuples; `line` is 1-based and `offset` the character offset of the line.
+    """
+    sections = []
+    fence = False
+    prev = None             # (text, line, offset) of the previous non-rule line
+    prev_rule = False       # previous line was a rule (banner candidate)
+    offset = 0
+    for lineno, raw in enumerate(lines, 1):
+        line = raw.rstrip("\r\n")
+        stripped = line.strip()
+        start = offset
+        offset += len(raw) if raw.endswith("\n") else len(raw) + 1
+        if stripped.startswith("```"):
+            fence = not fence
+            prev, prev_rule = None, False
+            continue
+        if fence:
+            continue
+
+        rule = RULE_RE.match(line)
+        if rule:
+            if prev and prev[0]:
+                level = 1 if rule.group(1) in "=\u2550" else 2
+                if prev[3]:
+                    level = 1   # text framed by rules above and below
+                sections.append((prev[0], level, prev[1], prev[2]))
+            prev, prev_rule = None, True
+            continue
+
+        m = MD_HEADING_RE.match(line)
+        if m:
+            sections.append((m.group(2), len(m.group(1)), lineno, start))
+            prev, prev_rule = None, False
+            continue
+        prev = (stripped, lineno, start, prev_rule) if stripped else None
+        prev_rule = False
+    return sections
+
+
+def align_section(sections, index, other):
+    """Map a section index onto another language version of the same guide.
+
+    Translations keep the chapter structure but not always every
+    subsection, so chapters (top-level headings) are matched by ordinal and
+    the subsection ordinal is clamped to the target chapter.
+    """
+    if not other:
+        return None
+    top = min(level for _, level, _, _ in sections)
+    chapter, start = -1, 0
+    for i, section in enumerate(sections[:index + 1]):
+        if section[1] == top:
+            chapter, start = chapter + 1, i
+    chapters = [i for i, section in enumerate(other) if section[1] == top]
+    if chapter < 0 or not chapters:
+        return min(index, len(other) - 1)
+    chapter = min(chapter, len(chapters) - 1)
+    end = chapters[chapter + 1] - 1 if chapter + 1 < len(chapters) else len(other) - 1
+    return min(chapters[chapter] + index - start, end)
+
+
+class GuideContentCache:
+    """Byte-bounded LRU of decoded guide text, keyed by (guide id, lang).
+
+    Entries loaded from a file are validated against the file's mtime and
+    size on every hit. Embedded content is already in memory and bypasses
+    the cache. `prefetch` warms the cache on a single worker thread; a
+    newer prefetch request supersedes any that is still queued.
+    """
+
+    def __init__(self, max_bytes=GUIDE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()   # key -> (signature, text, size)
+        self._sections = {}             # key -> (signature, section table)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._generation = 0
+
+    @staticmethod
+    def _signature(guide, lang, guides_dir):
+        fname = guide.get(f"file_{lang}")
+        if not fname:
+            return None
+        filepath = os.path.join(guides_dir, fname)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return filepath, st.st_mtime_ns, st.st_size
+
+    def get(self, guide, lang, guides_dir):
+        sig = self._signature(guide, lang, guides_dir)
+        if sig is None:
+            return load_guide_content(guide, lang, guides_dir)
+
+        key = (guide.get("id"), lang)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == sig:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        text = load_guide_content(guide, lang, guides_dir)
+        size = sys.getsizeof(text)
+        if size <= self.max_bytes:
+            with self._lock:
+                old = self._entries.pop(key, None)
+                if old:
+                    self.size -= old[2]
+                self._entries[key] = (sig, text, size)
+                self.size += size
+                while self.size > self.max_bytes:
+                    _, (_, _, evicted) = self._entries.popitem(last=False)
+                    self.size -= evicted
+        return text
+
+    def sections(self, guide, lang, guides_dir):
+        """Section table of a guide, parsed once per file version."""
+        sig = self._signature(guide, lang, guides_dir)
+        if sig is None:
+            return parse_sections(load_guide_content(guide, lang, guides_dir).splitlines(True))
+
+        key = (guide.get("id"), lang)
+        entry = self._sections.get(key)
+        if entry and entry[0] == sig:
+            return entry[1]
+        if sig[2] > MMAP_THRESHOLD:
+            with open(sig[0], "r", encoding="utf-8", errors="replace") as f:
+                PROFILER.count("bytes read", sig[2])
+                table = parse_sections(f)
+        else:
+            table = parse_sections(self.get(guide, lang, guides_dir).splitlines(True))
+        self._sections[key] = (sig, table)
+        return table
+
+    def prefetch(self, requests, guides_dir):
+        """Load (guide, lang) pairs in the background, most likely first."""
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tw1hub-prefetch")
+        self._generation += 1
+        generation = self._generation
+
+        def work():
+            for guide, lang in requests:
+                if generation != self._generation:
+                    return  # superseded by a newer selection
+                sig = self._signature(guide, lang, guides_dir)
+                if sig and sig[2] > MMAP_THRESHOLD:
+                    continue  # paged on demand, never cached whole
+                try:
+                    self.get(guide, lang, guides_dir)
+                except Exception:
+                    pass
+
+        self._pool.submit(work)
+
+    def close(self):
+        self._generation += 1
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================
+# GUIDE FULL-TEXT INDEX
+# ============================================================
+TOKEN_RE = re.compile(r"\w{2,}")
+
+
+def tokenize(text):
+    """Split text into lowercase search terms (2+ word characters)."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class GuideIndex:
+    """Inverted index over guide bodies, persisted next to the config.
+
+    Every guide is indexed in both languages. A source is either a guide
+    file (keyed by its path, validated by mtime + size) or embedded text
+    (keyed by guide id + language, validated by a content hash), so a
+    refresh only re-tokenizes sources that actually changed.
+    """
+    FORMAT = 1
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.docs = {}          # source key -> {"sig": ..., "terms": [...]}
+        self.terms = {}         # term -> frozenset of guide ids
+        self.vocab = []         # sorted terms, for prefix lookups
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == self.FORMAT:
+                self.docs = data.get("docs", {})
+        except Exception:
+            self.docs = {}
+
+    def save(self):
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"format": self.FORMAT, "docs": self.docs}, f,
+                          ensure_ascii=False, separators=(",", ":"))
+        except Exception as e:
+            print(f"Index save error: {e}")
+
+    def _source(self, guide, lang, guides_dir):
+        """Return (key, signature) for one language of a guide."""
+        fname = guide.get(f"file_{lang}")
+        if fname:
+            filepath = os.path.join(guides_dir, fname)
+            try:
+                st = os.stat(filepath)
+                return os.path.normcase(os.path.abspath(filepath)), [st.st_mtime_ns, st.st_size]
+            except OSError:
+                pass
+        digest = None
+        if guide.get("embedded"):
+            digest = data_pack().body_digest(guide.get("id"), lang)
+        elif guide.get("stored"):
+            from tw1_hub_sqlite import guide_digest
+            digest = guide_digest(guide["stored"], guide.get("id"), lang)
+        if digest is None:
+            content = load_guide_content(guide, lang, guides_dir)
+            digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        return f"embedded:{guide.get('id')}:{lang}", digest
+
+    @staticmethod
+    def _terms(guide, lang, guides_dir):
+        # Guide files are tokenized line by line so large dumps never sit in one string
+        fname = guide.get(f"file_{lang}")
+        if fname:
+            try:
+                terms = set()
+                with open(os.path.join(guides_dir, fname), "r", encoding="utf-8", errors="replace") as f:
+                    if PROFILER.enabled:
+                        PROFILER.count("bytes read", os.fstat(f.fileno()).st_size)
+                    for line in f:
+                        terms.update(tokenize(line))
+                return terms
+            except OSError:
+                pass
+        return set(tokenize(load_guide_content(guide, lang, guides_dir)))
+
+    def refresh(self, guides, guides_dir):
+        """Bring the index up to date with the given guides.
+
+        Returns True if anything was re-tokenized or dropped.
+        """
+        owners = {}
+        changed = False
+        for guide in guides:
+            for lang in ("en", "de"):
+                key, sig = self._source(guide, lang, guides_dir)
+                owners.setdefault(key, set()).add(guide.get("id"))
+                doc = self.docs.get(key)
+                if doc is None or doc.get("sig") != sig:
+                    self.docs[key] = {"sig": sig, "terms": sorted(self._terms(guide, lang, guides_dir))}
+                    changed = True
+
+        for key in [k for k in self.docs if k not in owners]:
+            del self.docs[key]
+            changed = True
+
+        postings = {}
+        for key, gids in owners.items():
+            for term in self.docs[key]["terms"]:
+                postings.setdefault(term, set()).update(gids)
+        self.terms = {term: frozenset(gids) for term, gids in postings.items()}
+        self.vocab = sorted(self.terms)
+
+        if changed:
+            self.save()
+        return changed
+
+    def _prefix(self, prefix):
+        hits = set()
+        i = bisect.bisect_left(self.vocab, prefix)
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix):
+            hits |= self.terms[self.vocab[i]]
+            i += 1
+        return hits
+
+    def search(self, query):
+        """Return the ids of guides whose body contains every query term.
+
+        The last term is matched as a prefix so results appear while typing.
+        """
+        words = tokenize(query)
+        if not words:
+            return set()
+        result = None
+        for i, word in enumerate(words):
+            hits = self._prefix(word) if i == len(words) - 1 else set(self.terms.get(word, ()))
+            result = hits if result is None else result & hits
+            if not result:
+                return set()
+        return result
+
+
+# ============================================================
+# RANKED SEARCH
+# ============================================================
+WORD_RE = re.compile(r"\w+")
+
+# Field weights per record type: a hit in a name counts more than one in a description
+TOOL_FIELDS = (("name", 3.0), ("formats", 2.5), ("desc", 1.0), ("format_desc", 0.5))
+GUIDE_FIELDS = (("title", 3.0), ("tags", 2.0), ("tools", 1.0))
+FORMAT_FIELDS = (("name", 3.0), ("desc", 1.0))
+
+
+def format_records():
+    """FILE_FORMATS as searchable records: {"name": ext, "desc_en": ..., "desc_de": ...}."""
+    return [{"name": ext, "desc_en": desc.get("en", ""), "desc_de": desc.get("de", "")}
+            for ext, desc in data_table("FILE_FORMATS").items()]
+
+
+def _trigrams(term):
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _within_edits(a, b, limit):
+    """True if the Levenshtein distance between a and b is at most `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return False
+        prev = cur
+    return prev[-1] <= limit
+
+
+class SearchEngine:
+    """BM25-ranked search over tool or guide records with prefix and typo tolerance.
+
+    Each field of a record is tokenized with its weight (TOOL_FIELDS or
+    GUIDE_FIELDS, both languages). BM25 scores are computed per term and
+    record at build time, so a query only merges precomputed postings; a
+    one-word exact query is a slice of a presorted list. A query word
+    matches its exact term, then terms it prefixes, and - when neither
+    exists - vocabulary terms within one or two edits, found through a
+    trigram index. Every word must match for a record to be returned.
+    """
+    K1 = 1.2
+    B = 0.75
+    PREFIX_WEIGHT = 0.7
+    FUZZY_WEIGHT = 0.4
+    MAX_EXPANSIONS = 40
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.key = None
+        self.items = []
+        self.postings = {}              # term -> {record number: score}
+        self.vocab = []
+        self.grams = {}                 # trigram -> set of terms
+        self._sorted = {}               # term -> record numbers, best first
+        self._expansions = {}
+
+    def build(self, items, key=None):
+        self.key = key
+        self.items = list(items)
+        freqs = {}
+        lengths = []
+        for doc, item in enumerate(self.items):
+            length = 0.0
+            record = isinstance(item, Record)
+            for field, weight in self.fields:
+                text = item.search_text(field) if record else self._field(item, field).lower()
+                for term in WORD_RE.findall(text):
+                    bucket = freqs.setdefault(term, {})
+                    bucket[doc] = bucket.get(doc, 0.0) + weight
+                    length += weight
+            lengths.append(length)
+
+        n = len(self.items)
+        avg = (sum(lengths) / n) if n else 1.0
+        norms = [self.K1 * (1 - self.B + self.B * length / avg) for length in lengths]
+        self.postings = {}
+        for term, bucket in freqs.items():
+            idf = math.log(1 + (n - len(bucket) + 0.5) / (len(bucket) + 0.5))
+            self.postings[term] = {doc: idf * tf * (self.K1 + 1) / (tf + norms[doc])
+                                   for doc, tf in bucket.items()}
+        self.vocab = sorted(self.postings)
+        grams = {}
+        for term in self.vocab:
+            for gram in _trigrams(term):
+                grams.setdefault(gram, set()).add(term)
+        self.grams = grams
+        self._sorted = {}
+        self._expansions = {}
+
+    @staticmethod
+    def _field(item, field):
+        if field == "name":
+            return item.get("name", "")
+        if field == "formats":
+            return " ".join(item.get("formats", []))
+        if field == "desc":
+            return f"{item.get('desc_en', '')} {item.get('desc_de', '')}"
+        if field == "format_desc":
+            formats = data_table("FILE_FORMATS")
+            return " ".join(f"{d.get('en', '')} {d.get('de', '')}"
+                            for d in (formats.get(fmt) for fmt in item.get("formats", [])) if d)
+        if field == "title":
+            return f"{item.get('title_en', '')} {item.get('title_de', '')}"
+        if field == "tags":
+            return " ".join(item.get("tags", []))
+        return " ".join(item.get("tool_ids", []))
+
+    def _expand(self, word):
+        """[(term, weight)] that a query word matches."""
+        cached = self._expansions.get(word)
+        if cached is not None:
+            return cached
+        found = []
+        if word in self.postings:
+            found.append((word, 1.0))
+        i = bisect.bisect_left(self.vocab, word)
+        while i < len(self.vocab) and len(found) < self.MAX_EXPANSIONS and self.vocab[i].startswith(word):
+            if self.vocab[i] != word:
+                found.append((self.vocab[i], self.PREFIX_WEIGHT))
+            i += 1
+        if not found and len(word) >= 4:
+            limit = 1 if len(word) <= 6 else 2
+            grams = _trigrams(word)
+            shared = {}
+            for gram in grams:
+                for term in self.grams.get(gram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            need = max(1, len(grams) - 3 * limit)
+            for term, count in shared.items():
+                if count >= need and _within_edits(word, term, limit):
+                    found.append((term, self.FUZZY_WEIGHT))
+        if len(self._expansions) > 512:
+            self._expansions.clear()
+        self._expansions[word] = found
+        return found
+
+    def _word_scores(self, word):
+        expansions = self._expand(word)
+        if len(expansions) == 1 and expansions[0][1] == 1.0:
+            return self.postings[word]
+        scores = {}
+        for term, weight in expansions:
+            for doc, score in self.postings[term].items():
+                score *= weight
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Records matching every word of `query`, best first."""
+        words = WORD_RE.findall(query.lower())
+        if not words:
+            return []
+        if len(words) == 1 and words[0] in self.postings and len(self._expand(words[0])) == 1:
+            ranked = self._sorted.get(words[0])
+            if ranked is None:
+                bucket = self.postings[words[0]]
+                ranked = self._sorted[words[0]] = sorted(bucket, key=lambda doc: (-bucket[doc], doc))
+            return [self.items[doc] for doc in ranked[:limit]]
+
+        per_word = sorted((self._word_scores(word) for word in words), key=len)
+        scores = dict(per_word[0])
+        for other in per_word[1:]:
+            scores = {doc: total + other[doc] for doc, total in scores.items() if doc in other}
+            if not scores:
+                return []
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda hit: (hit[1], -hit[0]))
+        return [self.items[doc] for doc, _ in ranked]
+
+
+def search_guides(engine, index, guides, query, limit=SEARCH_LIMIT):
+    """Ranked title/tag hits, then guides that only mention the query in their text."""
+    ranked = engine.search(query, limit)
+    body_hits = index.search(query)
+    shown = {g.get("id") for g in ranked}
+    ranked += [g for g in guides if g.get("id") in body_hits and g.get("id") not in shown]
+    return ranked[:limit]
+
+
+# ============================================================
+# TOOL DISCOVERY CACHE
+# ============================================================
+def workspace_roots(cfg):
+    return [os.path.normpath(os.path.join(SCRIPT_DIR, r))
+            for r in cfg.get("workspace_roots", DEFAULT_WORKSPACE_ROOTS)]
+
+
+def launch_tool(tool, path):
+    """Start a tool in its own folder; Python tools run with this interpreter."""
+    import subprocess
+    if _is_python_tool(tool, path):
+        return subprocess.Popen([sys.executable, path], cwd=os.path.dirname(path))
+    return subprocess.Popen([path], cwd=os.path.dirname(path))
+
+
+def _dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ToolLocator:
+    """Remembers where each tool was found, so redraws never touch the disk.
+
+    Each entry stores the resolved path (or None) plus the mtimes of the
+    directories that were probed for it. Entries are only dropped by an
+    explicit `invalidate` (path changed by the user) or by `revalidate`
+    (manual rescan), which stats each dependency directory once and
+    re-probes just the tools whose directories changed.
+    """
+
+    def __init__(self, base_dir=SCRIPT_DIR):
+        self.base_dir = base_dir
+        self.entries = {}       # tool id -> (path, {dir: mtime_ns})
+        self.discovered = {}    # tool id -> (depth, path) from the workspace scan
+
+    def find(self, tool, tool_paths):
+        tool_id = tool.get("id") or tool.get("name")
+        entry = self.entries.get(tool_id)
+        if entry is None:
+            entry = self.entries[tool_id] = self._probe(tool, tool_paths)
+        return entry[0]
+
+    def _probe(self, tool, tool_paths):
+        deps = {}
+
+        def exists(path):
+            folder = os.path.dirname(path)
+            if folder not in deps:
+                deps[folder] = _dir_mtime(folder)
+            return os.path.exists(path)
+
+        saved = tool_paths.get(tool.get("id") or tool.get("name"))
+        if saved and exists(saved):
+            return saved, deps
+
+        filename = tool.get("filename", "")
+        if not filename:
+            return None, deps
+
+        local = os.path.join(self.base_dir, filename)
+        if exists(local):
+            return local, deps
+
+        for sp in tool.get("search_paths", []):
+            check = os.path.normpath(os.path.join(self.base_dir, sp, filename))
+            if exists(check):
+                return check, deps
+
+        cp = tool.get("tool_path")
+        if cp and exists(cp):
+            return cp, deps
+
+        hit = self.discovered.get(tool.get("id") or tool.get("name"))
+        if hit and exists(hit[1]):
+            return hit[1], deps
+
+        return None, deps
+
+    def add_discovered(self, tool_id, path, depth):
+        """Record a scan hit; the shallowest hit wins.
+
+        Returns True if the tool's resolved path changed.
+        """
+        known = self.discovered.get(tool_id)
+        if known and known[0] <= depth:
+            return False
+        self.discovered[tool_id] = (depth, path)
+        entry = self.entries.get(tool_id)
+        if entry is None:
+            return True
+        if entry[0] is None or (known and entry[0] == known[1]):
+            deps = dict(entry[1])
+            folder = os.path.dirname(path)
+            deps[folder] = _dir_mtime(folder)
+            self.entries[tool_id] = (path, deps)
+            return True
+        return False
+
+    def invalidate(self, tool_id=None):
+        """Forget one tool, or every tool when no id is given."""
+        if tool_id is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(tool_id, None)
+
+    def revalidate(self):
+        """Drop entries whose dependency directories changed.
+
+        Returns the ids of the dropped tools.
+        """
+        mtimes = {}
+        stale = []
+        for tool_id, (path, deps) in self.entries.items():
+            for folder, mtime in deps.items():
+                if folder not in mtimes:
+                    mtimes[folder] = _dir_mtime(folder)
+                if mtimes[folder] != mtime:
+                    stale.append(tool_id)
+                    break
+        for tool_id in stale:
+            del self.entries[tool_id]
+        return stale
+
+
+class WorkspaceScanner:
+    """Searches the workspace for tool files on a thread pool.
+
+    One pass matches every wanted filename through a set lookup; each
+    directory is a separate task, so slow shares are read in parallel.
+    Matches are queued as (tool_id, path, depth) for the Tk thread to
+    `drain`; `done` turns True once the walk has finished or was cancelled.
+    """
+
+    def __init__(self, workers=DISCOVERY_WORKERS):
+        self.workers = workers
+        self.results = queue.Queue()
+        self.done = True
+        self._stop = threading.Event()
+
+    def start(self, roots, tools, max_depth=DEFAULT_DISCOVERY_DEPTH, ignore=()):
+        self.cancel()
+        wanted = {}
+        for tool in tools:
+            fname = tool.get("filename")
+            if fname:
+                wanted.setdefault(fname.lower(), []).append(tool.get("id") or tool.get("name"))
+        ignore = DISCOVERY_IGNORE | {name.lower() for name in ignore}
+
+        self._stop = threading.Event()
+        self.results = queue.Queue()
+        self.done = False
+        threading.Thread(target=self._run, name="tw1hub-discovery", daemon=True,
+                         args=(roots, wanted, max_depth, ignore, self._stop, self.results)).start()
+
+    def cancel(self):
+        self._stop.set()
+
+    def drain(self):
+        hits = []
+        while True:
+            try:
+                item = self.results.get_nowait()
+            except queue.Empty:
+                return hits
+            if item is None:
+                self.done = True
+            else:
+                hits.append(item)
+
+    def collect(self):
+        """Block until the walk has finished and return all hits (headless use)."""
+        hits = []
+        while True:
+            item = self.results.get()
+            if item is None:
+                self.done = True
+                return hits
+            hits.append(item)
+
+    def _run(self, roots, wanted, max_depth, ignore, stop, results):
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tw1hub-scan") as pool:
+            pending = set()
+            for root in roots:
+                key = os.path.normcase(os.path.realpath(root))
+                if key not in seen and os.path.isdir(root):
+                    seen.add(key)
+                    pending.add(pool.submit(self._scan_dir, root, 0, wanted, max_depth, ignore, results))
+            while pending and not stop.is_set():
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    for sub, depth in fut.result():
+                        key = os.path.normcase(os.path.realpath(sub))
+                        if key not in seen:
+                            seen.add(key)
+                            pending.add(pool.submit(self._scan_dir, sub, depth, wanted,
+                                                    max_depth, ignore, results))
+            for fut in pending:
+                fut.cancel()
+        results.put(None)
+
+    @staticmethod
+    def _scan_dir(path, depth, wanted, max_depth, ignore, results):
+        """Scan one directory; queue matches and return subdirectories to visit."""
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < max_depth and name not in ignore:
+                                subdirs.append((entry.path, depth + 1))
+                        elif name in wanted:
+                            for tool_id in wanted[name]:
+                                results.put((tool_id, entry.path, depth))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return subdirs
+
+
+# ============================================================
+# PROCESS SUPERVISOR
+# ============================================================
+class LaunchLimitError(Exception):
+    """A tool is already running as often as its limit allows."""
+
+    def __init__(self, tool, limit):
+        super().__init__(f"{tool.get('name', '?')} is already running {limit}x")
+        self.tool = tool
+        self.limit = limit
+
+
+def _proc_sampler():
+    """(pid, cache) -> (cpu seconds, rss bytes) or None: psutil if installed, else /proc."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        def sample(pid, cache):
+            try:
+                proc = cache.get("proc")
+                if proc is None:
+                    proc = cache["proc"] = psutil.Process(pid)
+                cpu = proc.cpu_times()
+                return cpu.user + cpu.system, proc.memory_info().rss
+            except psutil.Error:
+                return None
+        return sample
+    if os.path.isdir("/proc"):
+        ticks = os.sysconf("SC_CLK_TCK")
+        page = os.sysconf("SC_PAGE_SIZE")
+
+        def sample(pid, cache):
+            try:
+                with open(f"/proc/{pid}/stat", "rb") as f:
+                    fields = f.read().rsplit(b")", 1)[1].split()
+            except (OSError, IndexError):
+                return None
+            # fields start at "state" (3rd field of stat): utime 14, stime 15, rss 24
+            return (int(fields[11]) + int(fields[12])) / ticks, int(fields[21]) * page
+        return sample
+    return lambda pid, cache: None
+
+
+def _is_python_tool(tool, path):
+    return tool.get("type") == "python" or path.endswith(".py")
+
+
+class WarmLauncher:
+    """Hands Python tools to a spare interpreter that has already started.
+
+    The spare runs tw1_hub_warm.py, which imports WARM_MODULES and then
+    waits for a script path on stdin; each launch takes the spare and the
+    next one is started once the tool has shown its window (so the two
+    don't compete for the CPU). A reader thread per launch times the
+    launch-to-first-window interval: it is kept per tool in
+    `window_times` and on the process as `first_window` (seconds).
+    Available wherever the hub runs from source (not in a frozen build).
+    """
+
+    def __init__(self, modules=WARM_MODULES):
+        self.modules = modules
+        self.window_times = {}
+        self._spare = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available():
+        return not getattr(sys, "frozen", False) and os.path.exists(WARM_SCRIPT)
+
+    def prestart(self):
+        """Start a spare interpreter unless one is already waiting."""
+        import subprocess
+        with self._lock:
+            if self._closed:
+                return None
+            if self._spare is None or self._spare.poll() is not None:
+                self._spare = subprocess.Popen([sys.executable, WARM_SCRIPT, *self.modules],
+                                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                               cwd=SCRIPT_DIR)
+            return self._spare
+
+    def launch(self, tool, path):
+        proc = self.prestart()
+        with self._lock:
+            # close() may have run since prestart(): its spare is gone or has a closed stdin
+            taken = proc is not None and self._spare is proc
+            if taken:
+                self._spare = None
+        if not taken:
+            return launch_tool(tool, path)
+        started = time.perf_counter()
+        proc.first_window = None
+        proc.stdin.write(os.path.abspath(path).encode("utf-8") + b"\n")
+        proc.stdin.close()
+        threading.Thread(target=self._watch, args=(proc, tool.get("id") or tool.get("name"), started),
+                         name="tw1hub-warm", daemon=True).start()
+        return proc
+
+    def _watch(self, proc, tool_id, started):
+        mark = proc.stdout.readline()
+        if mark:
+            elapsed = time.perf_counter() - started
+            proc.first_window = self.window_times[tool_id] = elapsed
+            PROFILER.record(f"launch.{tool_id}", elapsed)
+        proc.stdout.close()
+        self.prestart()
+
+    def close(self):
+        """Let the waiting spare exit (EOF on its stdin)."""
+        with self._lock:
+            spare, self._spare = self._spare, None
+            self._closed = True
+        if spare is not None and spare.poll() is None:
+            spare.stdin.close()
+
+
+class RunningTool:
+    """One launched tool process and its latest resource sample."""
+    __slots__ = ("tool", "path", "popen", "started", "cpu_percent", "rss",
+                 "returncode", "kill_at", "spawn_s", "peak_rss", "_cpu", "_sampled", "_cache")
+
+    def __init__(self, tool, path, popen, spawn_s=None):
+        self.tool = tool
+        self.path = path
+        self.popen = popen
+        self.spawn_s = spawn_s       # time until the process existed (Popen returned)
+        self.peak_rss = None
+        self.started = time.monotonic()
+        self.cpu_percent = None
+        self.rss = None
+        self.returncode = None
+        self.kill_at = None          # set by ProcessSupervisor.kill: SIGKILL deadline
+        self._cpu = None
+        self._sampled = None
+        self._cache = {}
+
+    @property
+    def pid(self):
+        return self.popen.pid
+
+    @property
+    def tool_id(self):
+        return self.tool.get("id") or self.tool.get("name")
+
+    @property
+    def uptime(self):
+        return time.monotonic() - self.started
+
+    @property
+    def first_window(self):
+        """Launch-to-first-window seconds (warm launches only), or None."""
+        return getattr(self.popen, "first_window", None)
+
+
+class ProcessSupervisor:
+    """Keeps the processes of launched tools, reaps them and samples CPU/RSS.
+
+    `poll()` never blocks: it reaps finished children with Popen.poll()
+    (so no zombies are left behind on POSIX) and takes one CPU/memory
+    sample of each live one; the GUI calls it on a timer while anything
+    is running. `launch` refuses to start a tool that already runs as
+    often as its limit: the config's `tool_limits[id]`, else the tool's
+    `max_instances`, else unlimited. After `set_warm(True)` (the GUI
+    follows the config's `warm_launch`), Python tools go through a
+    WarmLauncher.
+    """
+
+    def __init__(self, cfg=None, usage=None):
+        self.cfg = cfg if cfg is not None else {}
+        self.usage = usage           # UsageLog that finished launches are appended to
+        self.running = []
+        self.warm = None
+        self._sample = None
+
+    def set_warm(self, enabled):
+        """Switch warm launching on (starting a spare interpreter) or off."""
+        if enabled and self.warm is None and WarmLauncher.available():
+            self.warm = WarmLauncher()
+            self.warm.prestart()
+        elif not enabled and self.warm is not None:
+            self.warm.close()
+            self.warm = None
+
+    def limit(self, tool):
+        tool_id = tool.get("id") or tool.get("name")
+        return self.cfg.get("tool_limits", {}).get(tool_id, tool.get("max_instances"))
+
+    def instances(self, tool_id):
+        """Live instances of a tool; ones already being killed don't count."""
+        return [rt for rt in self.running if rt.tool_id == tool_id and rt.kill_at is None]
+
+    def launch(self, tool, path):
+        """Start a tool; raises LaunchLimitError or OSError."""
+        limit = self.limit(tool)
+        if limit and len(self.instances(tool.get("id") or tool.get("name"))) >= limit:
+            raise LaunchLimitError(tool, limit)
+        started = time.perf_counter()
+        if self.warm is not None and _is_python_tool(tool, path):
+            popen = self.warm.launch(tool, path)
+        else:
+            popen = launch_tool(tool, path)
+        rt = RunningTool(tool, path, popen, time.perf_counter() - started)
+        self.running.append(rt)
+        return rt
+
+    def poll(self):
+        """Reap finished tools (logging them to `usage`) and sample the rest. Returns the finished ones."""
+        if self._sample is None:
+            self._sample = _proc_sampler()
+        finished = []
+        now = time.monotonic()
+        for rt in self.running:
+            code = rt.popen.poll()
+            if code is not None:
+                rt.returncode = code
+                finished.append(rt)
+                if self.usage is not None:
+                    self.usage.record(rt)
+                continue
+            if rt.kill_at is not None and now >= rt.kill_at:
+                rt.popen.kill()
+            sample = self._sample(rt.pid, rt._cache)
+            if sample is None:
+                continue
+            cpu, rt.rss = sample
+            rt.peak_rss = max(rt.peak_rss or 0, rt.rss)
+            if rt._cpu is not None and now > rt._sampled:
+                rt.cpu_percent = max(0.0, (cpu - rt._cpu) / (now - rt._sampled) * 100)
+            rt._cpu, rt._sampled = cpu, now
+        if finished:
+            self.running = [rt for rt in self.running if rt.returncode is None]
+        return finished
+
+    def kill(self, rt):
+        """Ask a tool to terminate; poll() kills it if it is still alive KILL_GRACE_S later."""
+        if rt.kill_at is not None or rt.popen.poll() is not None:
+            return
+        rt.popen.terminate()
+        rt.kill_at = time.monotonic() + KILL_GRACE_S
+
+    def restart(self, rt):
+        self.kill(rt)
+        return self.launch(rt.tool, rt.path)
+
+    def close(self):
+        if self.warm is not None:
+            self.warm.close()
+
+
+# ============================================================
+# USAGE LOG
+# ============================================================
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[int((len(values) - 1) * fraction)] if values else None
+
+
+class UsageLog:
+    """Local, append-only record of tool launches (one JSON line each).
+
+    A line holds the tool id, wall-clock start, spawn time, time to the
+    first window (warm launches), run time, exit code (plus "killed" if
+    stopped from the hub) and the highest RSS sampled: `{"tool": "lan_viewer", "ts": 1760000000, "spawn_ms": 9.1,
+    "window_ms": 412.0, "run_s": 95.2, "exit": 0, "peak_mb": 84.6}`.
+    Nothing leaves the machine. The file is read on first use, kept in
+    memory and only ever appended to; damaged lines are skipped.
+    """
+
+    def __init__(self, path=USAGE_FILE):
+        self.path = path
+        self._records = None
+        self._stats = None
+
+    def records(self):
+        if self._records is None:
+            records = []
+            try:
+                with open(self.path, "rb") as f:
+                    for line in f:
+                        try:
+                            records.append(json.loads(line))
+                        except ValueError:
+                            pass  # torn last line from a crash
+            except OSError:
+                pass
+            self._records = records
+        return self._records
+
+    def record(self, rt):
+        """Append a finished RunningTool."""
+        entry = {"tool": rt.tool_id, "ts": round(time.time() - rt.uptime),
+                 "spawn_ms": None if rt.spawn_s is None else round(rt.spawn_s * 1000, 1),
+                 "window_ms": None if rt.first_window is None else round(rt.first_window * 1000, 1),
+                 "run_s": round(rt.uptime, 1), "exit": rt.returncode,
+                 "peak_mb": None if rt.peak_rss is None else round(rt.peak_rss / 1048576, 1),
+                 "killed": True if rt.kill_at is not None else None}
+        self.append({k: v for k, v in entry.items() if v is not None})
+
+    def append(self, entry):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        except OSError as e:
+            print(f"Usage log error: {e}")
+        self.records().append(entry)
+        self._stats = None
+
+    def stats(self):
+        """{tool id: {launches, start_p50_ms, start_p95_ms, run_p50_s, run_p95_s, peak_mb, failed}}.
+
+        Start is the time to the first window where it was measured, else
+        the spawn time.
+        """
+        if self._stats is None:
+            grouped = {}
+            for entry in self.records():
+                grouped.setdefault(entry.get("tool"), []).append(entry)
+            self._stats = {}
+            for tool_id, entries in grouped.items():
+                starts = [e.get("window_ms", e.get("spawn_ms")) for e in entries]
+                starts = [v for v in starts if v is not None]
+                runs = [e["run_s"] for e in entries if "run_s" in e]
+                peaks = [e["peak_mb"] for e in entries if "peak_mb" in e]
+                self._stats[tool_id] = {
+                    "launches": len(entries),
+                    "start_p50_ms": _percentile(starts, 0.5),
+                    "start_p95_ms": _percentile(starts, 0.95),
+                    "run_p50_s": _percentile(runs, 0.5),
+                    "run_p95_s": _percentile(runs, 0.95),
+                    "peak_mb": max(peaks) if peaks else None,
+                    "failed": sum(1 for e in entries if e.get("exit") not in (0, None) and not e.get("killed")),
+                }
+        return self._stats
+
+    def by_frequency(self, tools):
+        """Tools ordered by number of launches, most used first (stable otherwise)."""
+        stats = self.stats()
+        return sorted(tools, key=lambda t: -stats.get(t.get("id") or t.get("name"), {}).get("launches", 0))
+
+
+# ============================================================
+# CATALOG
+# ============================================================
+class Catalog:
+    """All tools and guides (built-in, user and auto-discovered) with lookup indexes.
+
+    The catalog is built by the first `refresh()`; afterwards a refresh
+    costs one stat and only re-scans the guides folder when its mtime
+    changed (files added, removed or renamed). Tools and guides added with
+    `add_tool` / `add_guide` are indexed incrementally.
+
+    Indexes: `tool_by_id`, `guide_by_id`, `tools_by_format` (extension, as
+    in FILE_FORMATS), `tools_by_tag`, `guides_by_tag`, `guides_by_tool`
+    (tool id -> guides listing it in `tool_ids`) and `tools_by_guide`
+    (guide id -> tools listing it in `guide_ids`). `tools_version` and
+    `guides_version` change whenever the respective list does.
+    """
+
+    def __init__(self, cfg, guides_dir):
+        self.cfg = cfg
+        self.guides_dir = guides_dir
+        self.tools = []
+        self.guides = []
+        self.tools_version = 0
+        self.guides_version = 0
+        self._static_guides = 0     # built-in + user guides before the discovered ones
+        self._dir_mtime = None
+        self._built = False
+        self._clear_tool_indexes()
+        self._clear_guide_indexes()
+
+    def _clear_tool_indexes(self):
+        self.tool_by_id = {}
+        self.tools_by_format = {}
+        self.tools_by_tag = {}
+        self.tools_by_guide = {}
+        self._tool_names = {}
+
+    def _clear_guide_indexes(self):
+        self.guide_by_id = {}
+        self.guides_by_tag = {}
+        self.guides_by_tool = {}
+
+    def set_guides_dir(self, guides_dir):
+        if guides_dir != self.guides_dir:
+            self.guides_dir = guides_dir
+            if self._built:
+                self._load_guides()
+
+    def refresh(self):
+        """Build on first use, re-scan if the guides folder changed; one stat otherwise."""
+        if not self._built:
+            self.rebuild()
+            return True
+        if _dir_mtime(self.guides_dir) != self._dir_mtime:
+            self._load_guides()
+            return True
+        return False
+
+    def rebuild(self):
+        self._built = True
+        self._clear_tool_indexes()
+        self.tools = list(builtin_records("BUILTIN_TOOLS"))
+        self.tools += [Tool(ut, custom=True) for ut in self.cfg.get("user_tools", [])]
+        for tool in self.tools:
+            self._index_tool(tool)
+        self.tools_version += 1
+        self._load_guides()
+
+    def _load_guides(self):
+        self._dir_mtime = _dir_mtime(self.guides_dir)
+        self._clear_guide_indexes()
+        guides = list(builtin_records("BUILTIN_GUIDES"))
+        guides += [Guide(ug, custom=True) for ug in self.cfg.get("user_guides", [])]
+        self._static_guides = len(guides)
+        # Auto-discover new guides from folder
+        guides += self._scan_guides_folder(guides)
+        for guide in guides:
+            self._index_guide(guide)
+        self.guides = guides
+        self.guides_version += 1
+
+    def _index_tool(self, tool):
+        self.tool_by_id.setdefault(tool.id, tool)
+        for key in tool.lookup_keys:
+            self._tool_names.setdefault(key, tool)
+        for ext in tool.formats:
+            self.tools_by_format.setdefault(ext, []).append(tool)
+        for tag in tool.tags:
+            self.tools_by_tag.setdefault(tag.lower(), []).append(tool)
+        for guide_id in tool.guide_ids:
+            self.tools_by_guide.setdefault(guide_id, []).append(tool)
+
+    def _index_guide(self, guide):
+        self.guide_by_id.setdefault(guide.id, guide)
+        for tag in guide.tags:
+            self.guides_by_tag.setdefault(tag.lower(), []).append(guide)
+        for tool_id in guide.tool_ids:
+            self.guides_by_tool.setdefault(tool_id, []).append(guide)
+
+    def add_tool(self, data):
+        """Store a user tool in the config and index it; returns its record."""
+        self.refresh()
+        self.cfg.setdefault("user_tools", []).append(data)
+        tool = Tool(data, custom=True)
+        self.tools.append(tool)
+        self._index_tool(tool)
+        self.tools_version += 1
+        return tool
+
+    def add_guide(self, data):
+        """Store a user guide in the config and index it; returns its record."""
+        self.refresh()
+        self.cfg.setdefault("user_guides", []).append(data)
+        guide = Guide(data, custom=True)
+        self.guides.insert(self._static_guides, guide)
+        self._static_guides += 1
+        self._index_guide(guide)
+        self.guides_version += 1
+        return guide
+
+    def get(self, guide_id):
+        return self.guide_by_id.get(guide_id)
+
+    def tool(self, name):
+        """Tool by id, name or filename (case-insensitive)."""
+        return self._tool_names.get(name.lower())
+
+    def tools_for_format(self, ext):
+        return self.tools_by_format.get(_ext(ext), [])
+
+    def related(self, tool):
+        """Guides for a tool: its own `guide_ids` first, then guides linking to it."""
+        related = [self.guide_by_id[gid] for gid in tool.guide_ids if gid in self.guide_by_id]
+        for g in self.guides_by_tool.get(tool.id, []):
+            if g not in related:
+                related.append(g)
+        return related
+
+    def related_tools(self, guide):
+        """Tools for a guide: its own `tool_ids` first, then tools linking to it."""
+        related = [self.tool_by_id[tid] for tid in guide.tool_ids if tid in self.tool_by_id]
+        for t in self.tools_by_guide.get(guide.id, []):
+            if t not in related:
+                related.append(t)
+        return related
+
+    @PROFILER.timed("_scan_guides_folder")
+    def _scan_guides_folder(self, existing_guides):
+        """Scan guides folder for .txt/.md files not yet registered."""
+        if not os.path.isdir(self.guides_dir):
+            return []
+
+        # Collect all filenames already known by built-in/user guides
+        known_files = set()
+        for g in existing_guides:
+            for key in ("file_en", "file_de"):
+                if key in g and g[key]:
+                    known_files.add(g[key].lower())
+
+        # Scan folder
+        found_files = {}
+        for fname in os.listdir(self.guides_dir):
+            if not fname.lower().endswith((".txt", ".md")):
+                continue
+            if fname.lower() in known_files:
+                continue
+            # Group by base name (strip _en/_de suffix)
+            base = fname
+            lang_suffix = None
+            name_no_ext = os.path.splitext(fname)[0]
+            if name_no_ext.endswith("_en"):
+                base = name_no_ext[:-3]
+                lang_suffix = "en"
+            elif name_no_ext.endswith("_de"):
+                base = name_no_ext[:-3]
+                lang_suffix = "de"
+            else:
+                base = name_no_ext
+                lang_suffix = "en"  # default: treat as English
+
+            if base not in found_files:
+                found_files[base] = {"en": None, "de": None}
+            found_files[base][lang_suffix] = fname
+
+        # Create guide entries
+        discovered = []
+        for base, files in found_files.items():
+            # Make a readable title from the filename
+            title = base.replace("_", " ").replace("-", " ").strip()
+            title = " ".join(w.capitalize() for w in title.split())
+
+            guide = {
+                "id": f"auto_{base.lower()}",
+                "title_en": title,
+                "title_de": title,
+                "icon": "\U0001f4c4",
+                "tags": [t.lower() for t in base.replace("-", "_").split("_") if len(t) > 2],
+                "tool_ids": [],
+                "custom": True,
+                "auto_discovered": True,
+            }
+
+            if files["en"]:
+                guide["file_en"] = files["en"]
+            if files["de"]:
+                guide["file_de"] = files["de"]
+
+            # If only one language exists, use it for both
+            if files["en"] and not files["de"]:
+                guide["file_de"] = files["en"]
+            elif files["de"] and not files["en"]:
+                guide["file_en"] = files["de"]
+
+            discovered.append(Guide(guide))
+
+        return discovered
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — SQLite storage
+Optional backend for large user registries: user tools, user guides, tool
+paths and guide bodies live in indexed tables of `tw1_modding_hub.db`,
+while `tw1_modding_hub.json` keeps only the settings plus
+"storage": "sqlite". Guide bodies are read on demand, and a save only
+touches the rows that changed, so neither startup nor saving scales with
+the amount of stored guide text.
+
+Switch with `tw1_hub_cli.py --storage sqlite` (and back with `--storage json`).
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+
+from tw1_hub_core import CONFIG_FILE, DB_KEYS, load_config, save_config, _file_stamp
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tools (
+    key TEXT PRIMARY KEY, pos INTEGER NOT NULL, name TEXT, filename TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS tools_pos ON tools (pos);
+CREATE INDEX IF NOT EXISTS tools_filename ON tools (filename COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS guides (
+    key TEXT PRIMARY KEY, pos INTEGER NOT NULL, title TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS guides_pos ON guides (pos);
+CREATE TABLE IF NOT EXISTS guide_bodies (
+    guide_id TEXT NOT NULL, lang TEXT NOT NULL, body TEXT NOT NULL, digest TEXT NOT NULL,
+    PRIMARY KEY (guide_id, lang)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tool_paths (tool_id TEXT PRIMARY KEY, path TEXT NOT NULL) WITHOUT ROWID;
+"""
+BODY_KEYS = ("content_en", "content_de")
+STORED = "stored"          # guide key pointing at the database that holds its bodies
+
+
+def default_db_path(config_path=CONFIG_FILE):
+    return os.path.splitext(config_path)[0] + ".db"
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+    conn.execute("INSERT OR IGNORE INTO meta VALUES ('generation', '0')")
+    conn.commit()
+    return conn
+
+
+# ============================================================
+# ON-DEMAND GUIDE BODIES
+# ============================================================
+_readers = {}
+_readers_lock = threading.Lock()
+
+
+def _query(db_path, sql, args):
+    # One shared read connection per database; guide prefetch runs on worker threads
+    with _readers_lock:
+        conn = _readers.get(db_path)
+        if conn is None:
+            conn = _readers[db_path] = _connect(db_path)
+        return conn.execute(sql, args).fetchone()
+
+
+def guide_body(db_path, guide_id, lang):
+    """Stored body of a user guide, or None."""
+    row = _query(db_path, "SELECT body FROM guide_bodies WHERE guide_id = ? AND lang = ?", (guide_id, lang))
+    return row[0] if row else None
+
+
+def guide_digest(db_path, guide_id, lang):
+    """SHA-1 of a stored body without reading it, or None."""
+    row = _query(db_path, "SELECT digest FROM guide_bodies WHERE guide_id = ? AND lang = ?", (guide_id, lang))
+    return row[0] if row else None
+
+
+def _digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# CONFIG BACKEND
+# ============================================================
+class SqliteConfigBackend:
+    """Settings in the JSON config, registries in SQLite.
+
+    Keeps what it last read or wrote per row (position + serialized
+    record, body digests, tool paths), so `save` writes only the
+    difference in one transaction. `stamp` combines the JSON file's
+    stamp with a generation counter bumped on every database write, which
+    is how ConfigStore notices other instances.
+    """
+
+    def __init__(self, path=CONFIG_FILE, db_path=None):
+        self.path = path
+        self.db_path = db_path or default_db_path(path)
+        self.conn = _connect(self.db_path)
+        self._rows = {"tools": {}, "guides": {}}
+        self._digests = {}
+        self._paths = {}
+
+    # ── reading ─────────────────────────────────────────────
+    def load(self, settings=None):
+        cfg = dict(settings if settings is not None else load_config(self.path))
+        for key in DB_KEYS:
+            cfg.pop(key, None)
+        c = self.conn
+        self._rows = {table: {key: (pos, data) for key, pos, data in
+                              c.execute(f"SELECT key, pos, data FROM {table}")}
+                      for table in ("tools", "guides")}
+        self._digests = {(gid, lang): digest for gid, lang, digest in
+                         c.execute("SELECT guide_id, lang, digest FROM guide_bodies")}
+        self._paths = dict(c.execute("SELECT tool_id, path FROM tool_paths"))
+
+        with_bodies = {gid for gid, _ in self._digests}
+        cfg["user_tools"] = [json.loads(data) for _, data in sorted(self._rows["tools"].values())]
+        guides = []
+        for _, data in sorted(self._rows["guides"].values()):
+            guide = json.loads(data)
+            if guide.get("id") in with_bodies:
+                guide[STORED] = self.db_path
+            guides.append(guide)
+        cfg["user_guides"] = guides
+        cfg["tool_paths"] = dict(self._paths)
+        return cfg
+
+    read = load
+
+    def stamp(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return _file_stamp(self.path), row[0] if row else None
+
+    def bodies(self, guide_id):
+        return dict(self.conn.execute("SELECT lang, body FROM guide_bodies WHERE guide_id = ?", (guide_id,)))
+
+    # ── writing ─────────────────────────────────────────────
+    @staticmethod
+    def _keyed(items):
+        """(row key, position, item) with duplicate ids made unique."""
+        seen = {}
+        for pos, item in enumerate(items):
+            ident = str(item.get("id") or item.get("name") or pos)
+            n = seen[ident] = seen.get(ident, 0) + 1
+            yield (ident if n == 1 else f"{ident}\x00{n}"), pos, item
+
+    @staticmethod
+    def _serialize(item):
+        record = {k: v for k, v in item.items() if k not in BODY_KEYS and k != STORED}
+        return json.dumps(record, ensure_ascii=False, sort_keys=True)
+
+    def _sync_table(self, table, items, columns):
+        old = self._rows[table]
+        new = {}
+        for key, pos, item in self._keyed(items):
+            row = new[key] = (pos, self._serialize(item))
+            if old.get(key) != row:
+                values = [item.get(col) for col in columns]
+                self.conn.execute(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?{', ?' * (len(columns) - 1)})",
+                                  (key, pos, *values, row[1]))
+        gone = [(key,) for key in old if key not in new]
+        self.conn.executemany(f"DELETE FROM {table} WHERE key = ?", gone)
+        self._rows[table] = new
+        return new
+
+    def save(self, cfg):
+        settings = {k: v for k, v in cfg.items() if k not in DB_KEYS}
+        settings["storage"] = "sqlite"
+        try:
+            with self.conn:
+                self._sync_table("tools", cfg.get("user_tools", []), ("name", "filename"))
+                self._sync_table("guides", cfg.get("user_guides", []), ("title_en",))
+
+                digests = {}
+                for guide in cfg.get("user_guides", []):
+                    gid = guide.get("id")
+                    for lang in ("en", "de"):
+                        body = guide.get(f"content_{lang}")
+                        if body is None:
+                            if (gid, lang) in self._digests:
+                                digests[(gid, lang)] = self._digests[(gid, lang)]   # stored, not loaded
+                            continue
+                        digest = digests[(gid, lang)] = _digest(body)
+                        if self._digests.get((gid, lang)) != digest:
+                            self.conn.execute("INSERT OR REPLACE INTO guide_bodies VALUES (?, ?, ?, ?)",
+                                              (gid, lang, body, digest))
+                self.conn.executemany("DELETE FROM guide_bodies WHERE guide_id = ? AND lang = ?",
+                                      [k for k in self._digests if k not in digests])
+                self._digests = digests
+
+                paths = cfg.get("tool_paths", {})
+                self.conn.executemany("INSERT OR REPLACE INTO tool_paths VALUES (?, ?)",
+                                      [(k, v) for k, v in paths.items() if self._paths.get(k) != v])
+                self.conn.executemany("DELETE FROM tool_paths WHERE tool_id = ?",
+                                      [(k,) for k in self._paths if k not in paths])
+                self._paths = dict(paths)
+                self.conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'generation'")
+        except sqlite3.Error as e:
+            print(f"Config database error: {e}")
+            self.load()        # the transaction was rolled back: resync the row snapshot
+            return False
+        return save_config(settings, self.path)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — startup benchmark
+Starts the hub N times in fresh processes and reports time to first paint
+(first Expose of the main window) and time until tools and guides are
+loaded, measured from the start of the hub module. Needs a display.
+
+    python tw1_hub_startup_bench.py               # 5 runs, compare to targets
+    python tw1_hub_startup_bench.py --runs 20 --json
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+FIRST_PAINT_TARGET_MS = 300
+READY_TARGET_MS = 1000
+TIMEOUT_S = 30
+
+
+def _child():
+    """Start the hub, wait until it is painted and loaded, print its timings."""
+    import time
+    import tw1_modding_hub as hub
+
+    root = hub.tk.Tk()
+    app = hub.ModdingHub(root)
+    deadline = time.perf_counter() + TIMEOUT_S
+    while ("first_paint" not in app.startup_times or not app.ready) and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    app.scanner.cancel()
+    app.guide_cache.close()
+    root.destroy()
+    print(json.dumps({k: v * 1000 for k, v in app.startup_times.items()}))
+
+
+def run(runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"], cwd=here,
+                             capture_output=True, text=True, timeout=TIMEOUT_S + 10)
+        if out.returncode != 0:
+            raise RuntimeError(out.stderr.strip() or f"child exited with {out.returncode}")
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def summarize(samples):
+    result = {}
+    for key in ("window", "first_paint", "ready"):
+        values = sorted(s[key] for s in samples if key in s)
+        if values:
+            result[key] = {"median_ms": round(statistics.median(values), 1),
+                           "max_ms": round(values[-1], 1),
+                           "first_run_ms": round(samples[0].get(key, 0.0), 1)}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure TW1 Modding Hub startup time.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _child()
+        return 0
+
+    try:
+        summary = summarize(run(args.runs))
+    except Exception as e:
+        print(f"Benchmark failed: {e}", file=sys.stderr)
+        return 2
+    paint = summary.get("first_paint", {}).get("median_ms", float("inf"))
+    ready = summary.get("ready", {}).get("median_ms", float("inf"))
+    ok = paint <= FIRST_PAINT_TARGET_MS and ready <= READY_TARGET_MS
+
+    if args.json:
+        print(json.dumps({"runs": args.runs, "targets_ms": {"first_paint": FIRST_PAINT_TARGET_MS,
+                                                            "ready": READY_TARGET_MS},
+                          "results": summary, "ok": ok}, indent=2))
+    else:
+        print(f"{'stage':<12} {'median':>9} {'max':>9} {'1st run':>9}")
+        for key, stats in summary.items():
+            print(f"{key:<12} {stats['median_ms']:>7.1f}ms {stats['max_ms']:>7.1f}ms {stats['first_run_ms']:>7.1f}ms")
+        print(f"targets: first paint <= {FIRST_PAINT_TARGET_MS} ms, ready <= {READY_TARGET_MS} ms -> "
+              f"{'OK' if ok else 'MISSED'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — warm tool interpreter
+Started by the hub ahead of time as a spare interpreter: it imports the
+modules the Python tools share (tkinter, zlib, struct, ...) and then waits
+on stdin for the path of a tool script. The hub hands the next launched
+tool to it and starts a new spare, so a tool starts without paying for
+interpreter startup and the common imports.
+
+Once the tool's first window is mapped, one line is written to the report
+pipe (the original stdout) so the hub can measure launch-to-first-window
+time; the tool's own output goes to stderr. Closing stdin without sending
+a path ends the spare.
+"""
+
+import os
+import sys
+import importlib
+
+WINDOW_MARK = b"tw1hub:window\n"
+
+
+def _report_first_window(report):
+    """Hook tkinter so the first mapped window of the tool is reported once."""
+    import tkinter
+    original = tkinter.Tk.__init__
+    state = {"done": False}
+
+    def on_map(event):
+        if state["done"]:
+            return
+        state["done"] = True
+        try:
+            report.write(WINDOW_MARK)
+            report.close()
+        except OSError:
+            pass  # the hub is gone: nobody is waiting for the number
+
+    def init(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        tkinter.Tk.__init__ = original
+        self.bind_all("<Map>", on_map, add="+")
+
+    tkinter.Tk.__init__ = init
+
+
+def main(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    line = sys.stdin.buffer.readline()
+    if not line.strip():
+        return 0
+    path = os.path.abspath(line.decode("utf-8").strip())
+
+    # The report pipe keeps fd 1's pipe; the tool prints to stderr instead
+    report = os.fdopen(os.dup(1), "wb", buffering=0)
+    if sys.stderr is not None:
+        os.dup2(sys.stderr.fileno(), 1)
+        sys.stdout = sys.stderr
+    else:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+    if "tkinter" in sys.modules:
+        _report_first_window(report)
+
+    folder = os.path.dirname(path)
+    os.chdir(folder)
+    sys.argv = [path]
+    sys.path[0] = folder
+    import runpy
+    runpy.run_path(path, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+TW1 Modding Hub — workflows
+Runs multi-step jobs such as the map-to-mod pipeline (cook physics, copy
+and rename the map files, regenerate the LevelHeaders cache, pack the
+.wd) from a declarative description in the data pack.
+
+Steps form a dependency graph: steps whose dependencies are done run
+concurrently, and a step is skipped when the content of its input files
+and its own definition are unchanged since its last successful run and
+its outputs are still as it left them. After a small map edit only the
+steps downstream of the changed files run again.
+
+Step kinds:
+    copy     copy input files into `dest`, optionally renaming them
+    command  run an external program (argv list, `cwd` optional)
+    manual   done by the user (e.g. in the editor); the hub can open the
+             step's `tool` and waits for a confirmation
+
+Strings in a step may use the workflow's variables as {name}; {python}
+is this interpreter. `tw1_hub_cli.py --workflow map_to_mod` runs one
+from the command line.
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from tw1_hub_core import SCRIPT_DIR, data_table, PROFILER
+
+WORKFLOW_CACHE = os.path.join(SCRIPT_DIR, "tw1_modding_hub_workflows.json")
+WORKFLOW_WORKERS = 4                   # steps run at the same time
+HASH_CHUNK = 1024 * 1024
+OUTPUT_TAIL = 2000                     # characters of a failed command's output kept
+
+STEP_KINDS = ("copy", "command", "manual")
+
+
+class WorkflowError(Exception):
+    """A step failed, or the workflow description is invalid."""
+
+
+# ============================================================
+# DEFINITIONS
+# ============================================================
+class Step:
+    FIELDS = ("id", "name_en", "name_de", "kind", "deps", "inputs", "outputs",
+              "dest", "rename", "command", "cwd", "tool", "instructions")
+    __slots__ = FIELDS + ("_definition",)
+
+    def __init__(self, data):
+        for key in self.FIELDS:
+            setattr(self, key, data.get(key))
+        self.deps = list(self.deps or ())
+        self.inputs = list(self.inputs or ())
+        self.outputs = list(self.outputs or ())
+        self.instructions = list(self.instructions or ())
+        if self.kind not in STEP_KINDS:
+            raise WorkflowError(f"step {self.id!r}: unknown kind {self.kind!r}")
+        self._definition = json.dumps(data, sort_keys=True)
+
+    def name(self, lang="en"):
+        return (self.name_de if lang == "de" else self.name_en) or self.name_en or self.id
+
+
+class Workflow:
+    """A named set of steps with their dependencies, checked for cycles."""
+
+    def __init__(self, data):
+        self.id = data["id"]
+        self.title_en = data.get("title_en", self.id)
+        self.title_de = data.get("title_de", self.title_en)
+        self.guide_id = data.get("guide_id")
+        self.vars = dict(data.get("vars", {}))
+        self.steps = [Step(s) for s in data.get("steps", [])]
+        self.by_id = {s.id: s for s in self.steps}
+        for step in self.steps:
+            missing = [d for d in step.deps if d not in self.by_id]
+            if missing:
+                raise WorkflowError(f"step {step.id!r} depends on unknown {', '.join(missing)}")
+        self.order()
+
+    def title(self, lang="en"):
+        return self.title_de if lang == "de" else self.title_en
+
+    def order(self):
+        """Steps in dependency order; raises WorkflowError on a cycle."""
+        ordered, state = [], {}
+
+        def visit(step, chain):
+            if state.get(step.id) == "done":
+                return
+            if state.get(step.id) == "visiting":
+                raise WorkflowError(f"dependency cycle: {' -> '.join(chain + [step.id])}")
+            state[step.id] = "visiting"
+            for dep in step.deps:
+                visit(self.by_id[dep], chain + [step.id])
+            state[step.id] = "done"
+            ordered.append(step)
+
+        for step in self.steps:
+            visit(step, [])
+        return ordered
+
+
+def builtin_workflows():
+    return [Workflow(w) for w in data_table("WORKFLOWS")]
+
+
+def workflow_vars(workflow, cfg):
+    """Defaults from the workflow, overridden by the config's `workflow_vars[id]`."""
+    values = dict(workflow.vars)
+    values.update(cfg.get("workflow_vars", {}).get(workflow.id, {}))
+    values = {k: os.path.expanduser(os.path.expandvars(str(v))) for k, v in values.items()}
+    values["python"] = sys.executable
+    return values
+
+
+# ============================================================
+# CONTENT HASHES
+# ============================================================
+class FileHashes:
+    """SHA-1 of files, remembered by (mtime, size) so unchanged files aren't re-read."""
+
+    def __init__(self, known=None):
+        self.known = dict(known or {})
+        self.used = set()
+        self._lock = threading.Lock()
+
+    def digest(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            self.used.add(path)
+            entry = self.known.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                h.update(chunk)
+        PROFILER.count("bytes read", st.st_size)
+        with self._lock:
+            self.known[path] = [st.st_mtime_ns, st.st_size, h.hexdigest()]
+        return h.hexdigest()
+
+
+def _expand(text, values):
+    try:
+        return text.format_map(values)
+    except KeyError as e:
+        raise WorkflowError(f"unknown variable {e} in {text!r}") from None
+
+
+def _glob(patterns, values):
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(_expand(pattern, values), recursive=True) if os.path.isfile(p))
+    return sorted(paths)
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+class WorkflowRunner:
+    """Runs one workflow; `on_event(step_id, state, seconds, message)` reports progress.
+
+    States: running, waiting (manual step: call `confirm(step_id)` once
+    done), skipped, done, failed, blocked (a dependency failed). Events
+    come from worker threads. The cache of file hashes and step results
+    is written after the run. Without `interactive`, manual steps that are
+    not up to date fail instead of waiting.
+    """
+
+    def __init__(self, workflow, values, cache_path=WORKFLOW_CACHE, on_event=None, workers=WORKFLOW_WORKERS,
+                 interactive=True):
+        self.workflow = workflow
+        self.interactive = interactive
+        self.values = values
+        self.cache_path = cache_path
+        self.on_event = on_event or (lambda *event: None)
+        self.workers = workers
+        self.timings = {}
+        self.states = {}
+        self._confirmed = {}
+        self._cancelled = False
+        self._procs = set()
+        self._lock = threading.Lock()
+        cache = self._read_cache()
+        self.hashes = FileHashes(cache.get("files"))
+        self._results = cache.get("steps", {})
+
+    # ── cache ───────────────────────────────────────────────
+    def _read_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self):
+        tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                # Only files this run looked at: hashes of deleted or renamed files don't pile up
+                files = {path: self.hashes.known[path] for path in self.hashes.used if path in self.hashes.known}
+                json.dump({"files": files, "steps": self._results}, f, separators=(",", ":"))
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            print(f"Workflow cache error: {e}")
+
+    def _key(self, step, inputs):
+        h = hashlib.sha1(step._definition.encode("utf-8"))
+        h.update(json.dumps(self.values, sort_keys=True).encode("utf-8"))
+        for path in inputs:
+            h.update(f"\0{path}\0{self.hashes.digest(path)}".encode("utf-8"))
+        return h.hexdigest()
+
+    def _up_to_date(self, step, key):
+        last = self._results.get(f"{self.workflow.id}/{step.id}")
+        if not last or last["key"] != key:
+            return False
+        return all(self.hashes.digest(path) == digest for path, digest in last["outputs"].items())
+
+    # ── control ─────────────────────────────────────────────
+    def confirm(self, step_id):
+        """Mark a waiting manual step as done by the user."""
+        with self._lock:
+            event = self._confirmed.setdefault(step_id, threading.Event())
+        event.set()
+
+    def cancel(self):
+        """Start no further steps; running commands are killed and waiting manual steps fail."""
+        with self._lock:
+            self._cancelled = True
+            events = list(self._confirmed.values())
+            procs = list(self._procs)
+        for event in events:
+            event.set()
+        for proc in procs:
+            proc.kill()
+
+    def _emit(self, step, state, seconds=None, message=""):
+        self.states[step.id] = state
+        if seconds is not None:
+            self.timings[step.id] = seconds
+        self.on_event(step.id, state, seconds, message)
+
+    # ── steps ───────────────────────────────────────────────
+    def _run_step(self, step):
+        started = time.perf_counter()
+        try:
+            inputs = _glob(step.inputs, self.values)
+            key = self._key(step, inputs)
+            if self._up_to_date(step, key):
+                self._emit(step, "skipped", 0.0)
+                return True
+            started = time.perf_counter()
+            with PROFILER.span(f"workflow.{step.kind}"):
+                outputs = getattr(self, f"_{step.kind}")(step, inputs)
+            digests = {path: self.hashes.digest(path) for path in outputs}
+        except Exception as e:
+            # Any error fails just this step; the run goes on and still saves its cache
+            self._emit(step, "failed", time.perf_counter() - started, str(e) or type(e).__name__)
+            return False
+        seconds = time.perf_counter() - started
+        self._results[f"{self.workflow.id}/{step.id}"] = {
+            "key": key, "outputs": digests, "seconds": round(seconds, 3)}
+        self._emit(step, "done", seconds)
+        return True
+
+    def _copy(self, step, inputs):
+        if not inputs:
+            raise WorkflowError(f"no files match {', '.join(step.inputs)}")
+        dest = _expand(step.dest, self.values)
+        os.makedirs(dest, exist_ok=True)
+        pattern, replacement = step.rename or (None, None)
+        outputs = []
+        for src in inputs:
+            name = os.path.basename(src)
+            if pattern:
+                name = re.sub(pattern, replacement, name)
+            target = os.path.join(dest, name)
+            if self.hashes.digest(target) != self.hashes.digest(src):
+                shutil.copy2(src, target)
+            outputs.append(target)
+        return outputs
+
+    def _command(self, step, inputs):
+        import subprocess
+        argv = [_expand(arg, self.values) for arg in step.command]
+        cwd = _expand(step.cwd, self.values) if step.cwd else None
+        proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        with self._lock:
+            self._procs.add(proc)
+            if self._cancelled:
+                proc.kill()            # started after cancel() took its copy of _procs
+        try:
+            output, _ = proc.communicate()
+        finally:
+            with self._lock:
+                self._procs.discard(proc)
+        if self._cancelled:
+            raise WorkflowError("cancelled")
+        if proc.returncode != 0:
+            output = output.decode("utf-8", "replace")[-OUTPUT_TAIL:]
+            raise WorkflowError(f"{os.path.basename(argv[0])} exited with {proc.returncode}\n{output}".rstrip())
+        return _glob(step.outputs, self.values)
+
+    def _manual(self, step, inputs):
+        if not self.interactive:
+            raise WorkflowError("has to be done by hand: " + "; ".join(step.instructions))
+        with self._lock:
+            event = self._confirmed.setdefault(step.id, threading.Event())
+            if self._cancelled:
+                # cancel() may have set the events before this one was registered
+                raise WorkflowError("cancelled")
+        self._emit(step, "waiting", message="\n".join(step.instructions))
+        event.wait()
+        if self._cancelled:
+            raise WorkflowError("cancelled")
+        outputs = _glob(step.outputs, self.values)
+        if step.outputs and not outputs:
+            raise WorkflowError(f"no files match {', '.join(step.outputs)}")
+        return outputs
+
+    # ── scheduling ──────────────────────────────────────────
+    def run(self):
+        """Run all steps; returns True if none failed."""
+        pending = {step.id: step for step in self.workflow.order()}
+        ok, failed = set(), set()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tw1hub-workflow") as pool:
+                running = {}
+                while pending or running:
+                    for step in list(pending.values()):
+                        if any(dep in failed for dep in step.deps) or self._cancelled:
+                            del pending[step.id]
+                            failed.add(step.id)
+                            self._emit(step, "blocked")
+                        elif all(dep in ok for dep in step.deps):
+                            del pending[step.id]
+                            self._emit(step, "running")
+                            running[pool.submit(self._run_step, step)] = step
+                    if not running:
+                        break
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        step = running.pop(future)
+                        (ok if future.result() else failed).add(step.id)
+        finally:
+            # Steps that finished keep their results even if the run was interrupted
+            self._write_cache()
+        return not failed
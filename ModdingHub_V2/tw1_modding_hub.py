@@ -5,19 +5,54 @@ Central hub for all Two Worlds 1 modding tools and guides.
 By MedievalDev — Credits: Buglord, JadetheReaper, Smoothness
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
 import os
+import re
 import sys
-import json
-import subprocess
+import mmap
+import time
+import bisect
+import codecs
+import queue
+import threading
 import webbrowser
-from pathlib import Path
 
-VERSION = "2.0"
-SCRIPT_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, 'frozen', False) else __file__))
-CONFIG_FILE = os.path.join(SCRIPT_DIR, "tw1_modding_hub.json")
-GUIDES_DIR = os.path.join(SCRIPT_DIR, "guides")
+STARTED = time.perf_counter()   # startup timings are measured from here
+
+# Command-line queries (--which, --find, ...) are answered without importing tkinter;
+# --profile on its own still opens the window
+if __name__ == "__main__" and any(arg != "--profile" for arg in sys.argv[1:]):
+    from tw1_hub_cli import main as cli_main
+    sys.exit(cli_main(sys.argv[1:]))
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from tw1_hub_core import (
+    VERSION, DEFAULT_WORKSPACE_ROOTS, DEFAULT_DISCOVERY_DEPTH, MMAP_THRESHOLD,
+    LANG, FILE_FORMATS, CREDITS, TOOL_FIELDS, GUIDE_FIELDS,
+    ConfigStore, resolve_guides_dir, workspace_roots,
+    guide_file, align_section, search_guides, GuideContentCache, GuideIndex, SearchEngine,
+    ToolLocator, WorkspaceScanner, Catalog, ProcessSupervisor, LaunchLimitError, UsageLog, PROFILER,
+)
+
+SEARCH_DEBOUNCE_MS = 150   # wait this long after the last keystroke before searching
+RENDER_CHUNK = 8           # cards/items created per Tk event-loop tick
+OVERSCAN_ROWS = 2          # rows materialized above/below the visible area
+CARD_CACHE = 48            # hidden cards kept alive for quick scroll-back
+GUIDE_ROW_HEIGHT = 76      # fixed height of one guide list row
+
+GUIDE_PREFETCH = 4                     # guides warmed up after the list is shown
+
+STREAM_FIRST_CHARS = 12000             # inserted at once: the first screenfuls
+STREAM_CHUNK_CHARS = 60000             # appended per after() tick afterwards
+MMAP_PAGE_BYTES = 256 * 1024           # bytes decoded per page of a mapped file
+FIND_BATCH = 400                       # find highlights tagged per after() tick
+
+STARTUP_POLL_MS = 30                   # how often the UI checks on the background load
+DISCOVERY_POLL_MS = 150                # workspace scan hits are picked up this often
+DIAG_REFRESH_MS = 1000                 # diagnostics panel refresh interval
+SUPERVISOR_POLL_MS = 1000              # reap/sample launched tools while any are running
+WORKFLOW_POLL_MS = 100                 # workflow and batch panels pick up progress this often
 
 # ============================================================
 # THEME
@@ -43,632 +78,639 @@ BORDER   = "#2a3a5e"
 SEARCH_BG = "#0d1b33"
 
 # ============================================================
-# BILINGUAL STRINGS
+# STREAMING GUIDE VIEWER
 # ============================================================
-LANG = {
-    "title":            {"en": "TW1 Modding Hub", "de": "TW1 Modding Hub"},
-    "tools":            {"en": "Tools", "de": "Tools"},
-    "guides":           {"en": "Guides", "de": "Anleitungen"},
-    "settings":         {"en": "Settings", "de": "Einstellungen"},
-    "search":           {"en": "Search tools, guides, file formats...", "de": "Tools, Anleitungen, Dateiformate suchen..."},
-    "launch":           {"en": "Launch", "de": "Starten"},
-    "not_found":        {"en": "Not Found", "de": "Nicht gefunden"},
-    "found":            {"en": "Found", "de": "Gefunden"},
-    "add_tool":         {"en": "+ Add Tool", "de": "+ Tool hinzufügen"},
-    "add_guide":        {"en": "+ Add Guide", "de": "+ Anleitung hinzufügen"},
-    "credits":          {"en": "Credits", "de": "Credits"},
-    "grid_view":        {"en": "Grid", "de": "Kacheln"},
-    "list_view":        {"en": "List", "de": "Liste"},
-    "formats":          {"en": "Formats", "de": "Formate"},
-    "description":      {"en": "Description", "de": "Beschreibung"},
-    "path":             {"en": "Path", "de": "Pfad"},
-    "download":         {"en": "Download", "de": "Download"},
-    "related_guides":   {"en": "Related Guides", "de": "Zugehörige Anleitungen"},
-    "open_full":        {"en": "Open Full View", "de": "Vollansicht öffnen"},
-    "close":            {"en": "Close", "de": "Schließen"},
-    "preview":          {"en": "Preview", "de": "Vorschau"},
-    "no_results":       {"en": "No results found.", "de": "Keine Ergebnisse gefunden."},
-    "file_format_info": {"en": "File Format Info", "de": "Dateiformat-Info"},
-    "tool_name":        {"en": "Tool Name", "de": "Tool-Name"},
-    "tool_path":        {"en": "Tool Path (.py or .exe)", "de": "Tool-Pfad (.py oder .exe)"},
-    "tool_formats":     {"en": "Supported Formats (comma-separated, e.g. .lan,.par)", "de": "Unterstützte Formate (kommagetrennt, z.B. .lan,.par)"},
-    "tool_desc_en":     {"en": "Description (English)", "de": "Beschreibung (Englisch)"},
-    "tool_desc_de":     {"en": "Description (German)", "de": "Beschreibung (Deutsch)"},
-    "tool_default_path":{"en": "Default Path (where it's usually located)", "de": "Standard-Pfad (wo es normalerweise liegt)"},
-    "tool_download":    {"en": "Download Link (optional)", "de": "Download-Link (optional)"},
-    "guide_title":      {"en": "Guide Title", "de": "Anleitung Titel"},
-    "guide_title_en":   {"en": "Title (English)", "de": "Titel (Englisch)"},
-    "guide_title_de":   {"en": "Title (German)", "de": "Titel (Deutsch)"},
-    "guide_content_en": {"en": "Content (English)", "de": "Inhalt (Englisch)"},
-    "guide_content_de": {"en": "Content (German)", "de": "Inhalt (Deutsch)"},
-    "guide_tags":       {"en": "Tags (comma-separated)", "de": "Tags (kommagetrennt)"},
-    "guide_tools":      {"en": "Related Tools (comma-separated tool names)", "de": "Zugehörige Tools (kommagetrennt)"},
-    "browse":           {"en": "Browse...", "de": "Durchsuchen..."},
-    "save":             {"en": "Save", "de": "Speichern"},
-    "cancel":           {"en": "Cancel", "de": "Abbrechen"},
-    "or_file":          {"en": "Or load from file (.txt / .md):", "de": "Oder aus Datei laden (.txt / .md):"},
-    "select_all":       {"en": "— All —", "de": "— Alle —"},
-    "builtin":          {"en": "Built-in", "de": "Eingebaut"},
-    "custom":           {"en": "Custom", "de": "Benutzerdefiniert"},
-    "by":               {"en": "by", "de": "von"},
-    "set_path":         {"en": "Set Path", "de": "Pfad setzen"},
-    "reset_path":       {"en": "Reset", "de": "Zurücksetzen"},
-    "font_size":        {"en": "Font Size", "de": "Schriftgröße"},
-    "language":         {"en": "Language", "de": "Sprache"},
-    "view_mode":        {"en": "View Mode", "de": "Ansichtsmodus"},
-    "guides_folder":    {"en": "Guides Folder", "de": "Anleitungen-Ordner"},
-    "tool_paths_mgmt":  {"en": "Tool Paths", "de": "Tool-Pfade"},
-    "general":          {"en": "General", "de": "Allgemein"},
-    "guide_not_found":  {"en": "Guide file not found. Place guide .txt files in the 'guides' folder next to this hub.",
-                         "de": "Guide-Datei nicht gefunden. Guide .txt-Dateien im 'guides'-Ordner neben diesem Hub ablegen."},
-    "open_folder":      {"en": "Open Folder", "de": "Ordner öffnen"},
-}
+def _text_chunks(text):
+    yield text[:STREAM_FIRST_CHARS]
+    for pos in range(STREAM_FIRST_CHARS, len(text), STREAM_CHUNK_CHARS):
+        yield text[pos:pos + STREAM_CHUNK_CHARS]
+
+
+def _mapped_pages(path):
+    """Decode a memory-mapped UTF-8 file one page at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    carry = ""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        for pos in range(0, size, MMAP_PAGE_BYTES):
+            end = pos + MMAP_PAGE_BYTES
+            PROFILER.count("bytes read", min(end, size) - pos)
+            text = carry + decoder.decode(mm[pos:end], final=end >= size)
+            carry = ""
+            if text.endswith("\r") and end < size:
+                text, carry = text[:-1], "\r"  # keep CRLF pairs together
+            yield text.replace("\r\n", "\n")
+    if carry:
+        yield carry
+
+
+class GuideStream:
+    """Feeds guide text into a read-only Text widget without blocking.
+
+    Regular guides get their first screenfuls inserted immediately and the
+    rest appended in after()-scheduled chunks. Files above MMAP_THRESHOLD are
+    paged from a memory map: the next page is only decoded and appended when
+    the reader scrolls near the end, so the file never sits in one string.
+    """
+
+    def __init__(self, widget, scrollbar=None):
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.loaded = 0         # characters inserted so far
+        self.complete = True
+        self.paged = False
+        self._pages = None
+        self._job = None
+        widget.configure(yscrollcommand=self._on_scroll)
+
+    def load(self, content=None, path=None):
+        """Show `content`, or page through the file at `path`."""
+        self.cancel()
+        self.paged = path is not None
+        self._pages = _mapped_pages(path) if self.paged else _text_chunks(content)
+        self.loaded = 0
+        self.complete = False
+        self.widget.config(state="normal")
+        self.widget.delete("1.0", "end")
+        self.widget.config(state="disabled")
+        self._append()
+        if not self.paged:
+            self._schedule()
+
+    def cancel(self):
+        if self._job:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if self._pages is not None:
+            self._pages.close()  # releases the mmap of a paged file
+            self._pages = None
+
+    def load_until(self, chars):
+        """Synchronously append until at least `chars` characters are shown."""
+        while not self.complete and self.loaded < chars:
+            self._append()
+
+    def _append(self):
+        chunk = next(self._pages, None) if self._pages is not None else None
+        if chunk is None:
+            self.complete = True
+            self._pages = None
+            return False
+        self.widget.config(state="normal")
+        self.widget.insert("end-1c", chunk)
+        self.widget.config(state="disabled")
+        self.loaded += len(chunk)
+        return True
+
+    def _schedule(self):
+        self._job = self.widget.after(1, self._step)
+
+    def _step(self):
+        self._job = None
+        if not self.widget.winfo_exists():
+            self.cancel()
+            return
+        if self._append():
+            self._schedule()
+
+    def _on_scroll(self, first, last):
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        if self.paged and not self.complete and float(last) > 0.9:
+            self._append()
+
+
+class GuideOutline:
+    """Clickable section outline that jumps a streamed Text to a heading."""
+
+    def __init__(self, parent, text, stream):
+        self.text = text
+        self.stream = stream
+        self.sections = []
+        self._lines = []
+        self.listbox = tk.Listbox(parent, width=30, font=("Segoe UI", 9), bg=BG2, fg=FG_DIM,
+                                  selectbackground=BG3, selectforeground=FG, relief="flat",
+                                  highlightthickness=0, activestyle="none", exportselection=False)
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+
+    def set(self, sections):
+        self.sections = sections
+        self._lines = [line for _, _, line, _ in sections]
+        self.listbox.delete(0, "end")
+        if sections:
+            top = min(level for _, level, _, _ in sections)
+            self.listbox.insert("end", *["    " * (level - top) + title
+                                         for title, level, _, _ in sections])
+
+    def current(self):
+        """Index of the section at the top of the view, or None."""
+        if not self.sections:
+            return None
+        top = int(self.text.index("@0,0").split(".")[0])
+        return max(bisect.bisect_right(self._lines, top) - 1, 0)
+
+    def jump(self, index):
+        title, _, line, offset = self.sections[index]
+        self.stream.load_until(offset + len(title) + 1)
+        self.text.yview(f"{line}.0")
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+
+    def _on_select(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self.jump(selection[0])
+
+
+class FindBar:
+    """Find-in-guide bar for a streamed Text widget.
+
+    Every keystroke recomputes the match offsets with one regex pass over the
+    loaded text and bumps a generation counter, so a highlight pass still
+    running for an older query stops at its next tick. Matches in the
+    viewport are tagged first, the rest in FIND_BATCH-sized after() batches.
+    Next/previous jumps walk the precomputed offset list.
+    """
+
+    def __init__(self, hub, parent, text, stream):
+        self.hub = hub
+        self.text = text
+        self.stream = stream
+        self.matches = []           # (start, end) character offsets
+        self.current = -1
+        self._line_starts = [0]
+        self._searched = -1         # stream.loaded when matches were computed
+        self._generation = 0
+        self._job = None
+
+        self.frame = tk.Frame(parent, bg=BG2, padx=8, pady=4)
+        self.var = tk.StringVar()
+        self.entry = tk.Entry(self.frame, textvariable=self.var, font=("Segoe UI", 10), bg=SEARCH_BG, fg=FG,
+                              insertbackground=FG, relief="flat", width=28)
+        self.entry.pack(side="left", ipady=2)
+        self.regex_var = tk.BooleanVar()
+        self.case_var = tk.BooleanVar()
+        for label, var in (("find_regex", self.regex_var), ("find_case", self.case_var)):
+            tk.Checkbutton(self.frame, text=hub.t(label), variable=var, command=self.search,
+                           font=("Segoe UI", 9), bg=BG2, fg=FG_DIM, selectcolor=BG3,
+                           activebackground=BG2, activeforeground=FG).pack(side="left", padx=(6, 0))
+        for glyph, step in (("\u25b2", -1), ("\u25bc", 1)):
+            tk.Button(self.frame, text=glyph, font=("Segoe UI", 8), bg=BG3, fg=FG, relief="flat",
+                      padx=6, pady=0, cursor="hand2", command=lambda s=step: self.step(s)).pack(side="left", padx=(6, 0))
+        self.count_lbl = tk.Label(self.frame, font=("Segoe UI", 9), bg=BG2, fg=FG_DIM)
+        self.count_lbl.pack(side="left", padx=8)
+        tk.Button(self.frame, text="\u2715", font=("Segoe UI", 8), bg=BG2, fg=FG_DIM, relief="flat",
+                  cursor="hand2", command=self.hide).pack(side="right")
+
+        text.tag_configure("find_match", background=BG4, foreground=YELLOW)
+        text.tag_configure("find_current", background=ORANGE, foreground=BG)
+        text.tag_raise("find_current", "find_match")
+        self.var.trace_add("write", lambda *a: self.search())
+        self.entry.bind("<Return>", lambda e: self.step(1))
+        self.entry.bind("<Shift-Return>", lambda e: self.step(-1))
+        self.entry.bind("<Escape>", lambda e: self.hide())
+        text.bind("<Control-f>", lambda e: self.show())
+
+    @property
+    def visible(self):
+        return self.frame.winfo_ismapped()
+
+    def show(self):
+        if not self.visible:
+            self.frame.pack(side="top", fill="x", before=self.text)
+        self.entry.focus_set()
+        self.entry.select_range(0, "end")
+        if self._searched != self.stream.loaded:
+            self.search()
+        return "break"
+
+    def hide(self):
+        self._clear()
+        self.frame.pack_forget()
+        self.text.focus_set()
+
+    def reset(self):
+        """Forget matches after the Text got new content; re-run if the bar is open."""
+        self._clear()
+        if self.visible and self.var.get():
+            self.search()
+
+    def _clear(self):
+        self._generation += 1
+        if self._job:
+            self.text.after_cancel(self._job)
+            self._job = None
+        self.text.tag_remove("find_match", "1.0", "end")
+        self.text.tag_remove("find_current", "1.0", "end")
+        self.matches = []
+        self.current = -1
+        self._searched = -1
+        self.count_lbl.config(text="")
+
+    def search(self):
+        self._clear()
+        query = self.var.get()
+        if not query:
+            return
+        flags = 0 if self.case_var.get() else re.IGNORECASE
+        try:
+            pattern = re.compile(query if self.regex_var.get() else re.escape(query), flags)
+        except re.error:
+            self.count_lbl.config(text=self.hub.t("find_invalid"), fg=RED)
+            return
 
-# ============================================================
-# FILE FORMAT DATABASE
-# ============================================================
-FILE_FORMATS = {
-    ".wd": {
-        "en": "WD Archive — Two Worlds mod container format. Contains packed game files (maps, physics, textures). Compressed with zlib, directory at end of file. Version 0x200 for TW1. GUID identifies each archive. .phx files must NOT be compressed inside.",
-        "de": "WD-Archiv — Two Worlds Mod-Containerformat. Enthält gepackte Spieldateien (Maps, Physik, Texturen). Zlib-komprimiert, Verzeichnis am Dateiende. Version 0x200 für TW1. GUID identifiziert jedes Archiv. .phx-Dateien dürfen NICHT komprimiert werden.",
-    },
-    ".lan": {
-        "en": "LAN Language File — Binary file containing all localized game text. Three sections: translations (16,194 entries), aliases (215 redirects), quest dialog trees (583 quests, 9,799 entries). UTF-16-LE encoded strings with 'translate' prefix keys.",
-        "de": "LAN-Sprachdatei — Binärdatei mit allen lokalisierten Spieltexten. Drei Abschnitte: Übersetzungen (16.194 Einträge), Aliase (215 Weiterleitungen), Quest-Dialogbäume (583 Quests, 9.799 Einträge). UTF-16-LE kodierte Strings mit 'translate'-Präfix.",
-    },
-    ".par": {
-        "en": "PAR Parameter File — Central binary database containing all item definitions, NPC stats, creatures, skills, weapons, armor. Compressed with zlib. Contains groups with typed entries (int32, float, uint32, string + arrays). GUID in header.",
-        "de": "PAR-Parameterdatei — Zentrale Binär-Datenbank mit allen Item-Definitionen, NPC-Stats, Kreaturen, Skills, Waffen, Rüstungen. Zlib-komprimiert. Enthält Gruppen mit typisierten Einträgen (int32, float, uint32, string + Arrays). GUID im Header.",
-    },
-    ".lnd": {
-        "en": "LND Level/Map File — Contains terrain heightmap, textures, object placements, NPC spawns, and all map tile data. Zlib-compressed. Each tile is 128x128. Files named Map_F01.lnd etc. Editor saves with 's' suffix (Map_F01s.lnd).",
-        "de": "LND Level/Map-Datei — Enthält Terrain-Heightmap, Texturen, Objekt-Platzierungen, NPC-Spawns und alle Map-Tile-Daten. Zlib-komprimiert. Jedes Tile ist 128x128. Dateien heißen Map_F01.lnd etc. Editor speichert mit 's'-Suffix (Map_F01s.lnd).",
-    },
-    ".vdf": {
-        "en": "VDF 3D Model File — Two Worlds proprietary 3D model format. Contains mesh geometry, textures, animations. Created by Maya plugins or TreesGenerator. Can be used as terrain stamps in the editor.",
-        "de": "VDF 3D-Modelldatei — Two Worlds proprietäres 3D-Modellformat. Enthält Mesh-Geometrie, Texturen, Animationen. Wird von Maya-Plugins oder TreesGenerator erstellt. Kann als Terrain-Stempel im Editor verwendet werden.",
-    },
-    ".phx": {
-        "en": "PHX Physics File — Collision data for map tiles. Generated by cooking PhysX in the editor (4 console commands). Must NOT be compressed when packed into .wd archives or the game will crash.",
-        "de": "PHX-Physikdatei — Kollisionsdaten für Map-Tiles. Wird durch PhysX-Kochen im Editor erzeugt (4 Konsolenbefehle). Darf beim Packen in .wd-Archive NICHT komprimiert werden, sonst crasht das Spiel.",
-    },
-    ".lhc": {
-        "en": "LHC LevelHeaders Cache — Index file containing header information of all map files. Generated by LevelHeadersCacheGen.bat / MeshParamsGen.exe. Must be regenerated after every map change.",
-        "de": "LHC LevelHeaders-Cache — Indexdatei mit Header-Informationen aller Map-Dateien. Wird durch LevelHeadersCacheGen.bat / MeshParamsGen.exe erzeugt. Muss nach jeder Map-Änderung neu generiert werden.",
-    },
-    ".idx": {
-        "en": "IDX Quest Data (SOAP-XML) — Full quest data export from WhizzEdit. Contains complete quest trees, NPC definitions, dialog structures, quest logic (GIVER, FC, AOQ, ACTION, REWARD). Recommended format for quest editing.",
-        "de": "IDX Quest-Daten (SOAP-XML) — Vollständiger Quest-Datenexport aus WhizzEdit. Enthält komplette Quest-Bäume, NPC-Definitionen, Dialog-Strukturen, Quest-Logik (GIVER, FC, AOQ, ACTION, REWARD). Empfohlenes Format zum Quest-Editieren.",
-    },
-    ".qtx": {
-        "en": "QTX Quest Logic (Plaintext) — Compiled quest logic for the game engine. Contains NPC definitions, quest parameters, actions, rewards. No dialog text (that's in .lan). OBJECTS field can carry item drop lists.",
-        "de": "QTX Quest-Logik (Klartext) — Kompilierte Quest-Logik für die Game-Engine. Enthält NPC-Definitionen, Quest-Parameter, Aktionen, Belohnungen. Kein Dialog-Text (der ist in .lan). OBJECTS-Feld kann Item-Drop-Listen enthalten.",
-    },
-    ".shf": {
-        "en": "SHF WhizzEdit Project — Binary .NET BinaryFormatter format. WhizzEdit's native project files (one per folder). Contains 23,329 strings. Read-only in our tools — use .idx for editing.",
-        "de": "SHF WhizzEdit-Projekt — Binäres .NET BinaryFormatter-Format. WhizzEdits native Projektdateien (eine pro Ordner). Enthält 23.329 Strings. Nur lesbar in unseren Tools — .idx zum Editieren verwenden.",
-    },
-    ".bmp": {
-        "en": "BMP Minimap Image — Minimap bitmap for each map tile. Saved alongside .lnd files. Must be renamed (remove 's' suffix) when creating mods, just like .lnd and .phx files.",
-        "de": "BMP Minimap-Bild — Minimap-Bitmap für jedes Map-Tile. Wird neben .lnd-Dateien gespeichert. Muss beim Mod-Erstellen umbenannt werden ('s'-Suffix entfernen), genau wie .lnd und .phx.",
-    },
-}
+        if not self.stream.paged:
+            self.stream.load_until(float("inf"))  # already in memory; finish the stream
+        content = self.text.get("1.0", "end-1c")
+        self._searched = self.stream.loaded
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        self.matches = [m.span() for m in pattern.finditer(content) if m.end() > m.start()]
+        if not self.matches:
+            self.count_lbl.config(text=self.hub.t("find_none"), fg=FG_DIM)
+            return
 
-# ============================================================
-# BUILT-IN TOOLS
-# ============================================================
-BUILTIN_TOOLS = [
-    {
-        "id": "cmd_injector",
-        "name": "TW Editor CMD Injector",
-        "icon": "\u2328",
-        "desc_en": "Injects commands into the Two Worlds Editor console. Categorized command database with search, multi-command execution via .txt lists, auto-detection of editor window.",
-        "desc_de": "Injiziert Befehle in die Two Worlds Editor-Konsole. Kategorisierte Command-Datenbank mit Suche, Multi-Command-Ausführung über .txt-Listen, Auto-Erkennung des Editor-Fensters.",
-        "filename": "tw_editor_cmd_injector.py",
-        "formats": [],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/TwoWorldsEditor_Command_Injector",
-        "guide_ids": ["editor_beginner_guide", "physx_cooking"],
-    },
-    {
-        "id": "lan_viewer",
-        "name": "TW1 LAN Viewer",
-        "icon": "\U0001f4ac",
-        "desc_en": "View and search .lan language files. Chat-style dialog view, full-text search, compare mode. Part of the Dialog Viewer/Editor repository.",
-        "desc_de": "Anzeigen und Durchsuchen von .lan-Sprachdateien. Chat-Ansicht, Volltextsuche, Vergleichsmodus. Teil des Dialog Viewer/Editor Repositories.",
-        "filename": "tw1_lan_viewer.py",
-        "formats": [".lan"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Twor-Worlds-Dialog-Viewer-Editor",
-        "guide_ids": ["format_overview"],
-    },
-    {
-        "id": "quest_editor",
-        "name": "TW1 Quest Editor",
-        "icon": "\U0001f4dc",
-        "desc_en": "Edit .idx/.qtx quest data and .shf WhizzEdit projects. Quest tree editing, NPC assignments, dialog structures. Part of the Dialog Viewer/Editor repository.",
-        "desc_de": "Bearbeiten von .idx/.qtx Quest-Daten und .shf WhizzEdit-Projekten. Quest-Baum-Bearbeitung, NPC-Zuweisungen, Dialog-Strukturen. Teil des Dialog Viewer/Editor Repositories.",
-        "filename": "tw1_quest_editor.py",
-        "formats": [".idx", ".qtx", ".shf"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Twor-Worlds-Dialog-Viewer-Editor",
-        "guide_ids": ["format_overview"],
-    },
-    {
-        "id": "par_tool",
-        "name": "TW1 PAR Tool",
-        "icon": "\U0001f4ca",
-        "desc_en": "Convert TwoWorlds.par between binary and JSON. Tree view of all groups/entries, inline editing, GUID management, hex view, file comparison. Full import/export roundtrip.",
-        "desc_de": "Konvertiert TwoWorlds.par zwischen Binär und JSON. Baumansicht aller Gruppen/Einträge, Inline-Editing, GUID-Verwaltung, Hex-Ansicht, Dateivergleich. Vollständiger Import/Export.",
-        "filename": "tw1param_gui.py",
-        "formats": [".par"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/TwoWorlds_PAR_Editor",
-        "guide_ids": ["format_overview"],
-    },
-    {
-        "id": "vdf_to_obj",
-        "name": "TW1 VDF to OBJ",
-        "icon": "\U0001f4d0",
-        "desc_en": "Convert Two Worlds .vdf 3D models to standard .obj format. Export mesh geometry for use in Blender or other 3D editors.",
-        "desc_de": "Konvertiert Two Worlds .vdf 3D-Modelle ins Standard .obj-Format. Mesh-Geometrie exportieren für Blender oder andere 3D-Editoren.",
-        "filename": "tw1_vdf_to_obj.py",
-        "formats": [".vdf", ".obj"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Two-Worlds-VDF-In-Export-Tool",
-        "guide_ids": [],
-    },
-    {
-        "id": "obj_to_vdf",
-        "name": "TW1 OBJ to VDF",
-        "icon": "\U0001f4d0",
-        "desc_en": "Convert standard .obj 3D models to Two Worlds .vdf format. Import custom meshes into the game engine.",
-        "desc_de": "Konvertiert Standard .obj 3D-Modelle ins Two Worlds .vdf-Format. Eigene Meshes in die Game-Engine importieren.",
-        "filename": "tw1_obj_to_vdf.py",
-        "formats": [".obj", ".vdf"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Two-Worlds-VDF-In-Export-Tool",
-        "guide_ids": [],
-    },
-    {
-        "id": "lnd_viewer",
-        "name": "TW1 LND Viewer",
-        "icon": "\U0001f5fa",
-        "desc_en": "View Two Worlds .lnd level/map files. Inspect terrain data, textures, and map tile structure.",
-        "desc_de": "Two Worlds .lnd Level/Map-Dateien anzeigen. Terrain-Daten, Texturen und Map-Tile-Struktur inspizieren.",
-        "filename": "tw1_lnd_viewer.py",
-        "formats": [".lnd"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Twor-Worlds-LND-Viewer",
-        "guide_ids": ["editor_beginner_guide"],
-    },
-    {
-        "id": "lnd_world_maps",
-        "name": "TW1 LND World Maps Viewer",
-        "icon": "\U0001f30d",
-        "desc_en": "Export world map data from .lnd files — heightmaps, colormaps, and other terrain visualizations as image files.",
-        "desc_de": "Weltkarten-Daten aus .lnd-Dateien exportieren — Heightmaps, Colormaps und andere Terrain-Visualisierungen als Bilddateien.",
-        "filename": "tw1_lnd_world_maps.py",
-        "formats": [".lnd"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Twor-Worlds-LND-Viewer",
-        "guide_ids": ["editor_beginner_guide"],
-    },
-    {
-        "id": "lnd_objects_exporter",
-        "name": "TW1 LND Objects Exporter",
-        "icon": "\U0001f4cb",
-        "desc_en": "Export object data from .lnd files to CSV — position, scale, rotation, and object name for every placed object on a map tile.",
-        "desc_de": "Objektdaten aus .lnd-Dateien als CSV exportieren — Position, Skalierung, Rotation und Objektname für jedes platzierte Objekt auf einem Map-Tile.",
-        "filename": "tw1_lnd_objects_exporter.py",
-        "formats": [".lnd", ".csv"],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Twor-Worlds-LND-Viewer",
-        "guide_ids": [],
-    },
-    {
-        "id": "modding_guide",
-        "name": "TW1 Modding Guide",
-        "icon": "\U0001f4d6",
-        "desc_en": "Interactive step-by-step guide for new TW1 modders. Walks through SDK setup, editor usage, map creation, PhysX cooking, mod packaging and activation.",
-        "desc_de": "Interaktiver Schritt-für-Schritt-Guide für neue TW1-Modder. Führt durch SDK-Setup, Editor-Benutzung, Map-Erstellung, PhysX-Kochen, Mod-Verpackung und Aktivierung.",
-        "filename": "tw1_modding_guide.py",
-        "formats": [],
-        "type": "python",
-        "download": "https://github.com/MedievalDev/Two-Worlds-Modding-Guid",
-        "guide_ids": ["map_to_mod_guide", "editor_beginner_guide"],
-    },
-    {
-        "id": "tw_editor",
-        "name": "TwoWorlds Editor",
-        "icon": "\U0001f3ae",
-        "desc_en": "The official Two Worlds SDK map/level editor. Create and edit map tiles, place objects, NPCs, terrain, and structures. Console accessible via 'C' key.",
-        "desc_de": "Der offizielle Two Worlds SDK Map/Level-Editor. Map-Tiles erstellen und bearbeiten, Objekte, NPCs, Terrain und Strukturen platzieren. Konsole über 'C'-Taste erreichbar.",
-        "filename": "TwoWorldsEditor.exe",
-        "search_paths": ["..", "../Tools"],
-        "formats": [".lnd"],
-        "type": "exe",
-        "download": "https://www.moddb.com/games/two-worlds/downloads",
-        "guide_ids": ["editor_beginner_guide", "dungeon_guide_part1", "dungeon_guide_part2"],
-    },
-    {
-        "id": "whizzedit",
-        "name": "WhizzEdit",
-        "icon": "\U0001f9d9",
-        "desc_en": "Reality Pump's quest authoring tool from the SDK. Views quest trees, dialog structures, NPC assignments. Barely runs on modern systems. Use our LAN Viewer and Quest Editor instead.",
-        "desc_de": "Reality Pumps Quest-Erstellungstool aus dem SDK. Zeigt Quest-Bäume, Dialog-Strukturen, NPC-Zuweisungen. Läuft kaum auf modernen Systemen. Lieber unseren LAN Viewer und Quest Editor nutzen.",
-        "filename": "WhizzEdit.exe",
-        "search_paths": ["..", "../Tools"],
-        "formats": [".shf", ".idx"],
-        "type": "exe",
-        "download": "https://www.moddb.com/games/two-worlds/downloads",
-        "guide_ids": [],
-    },
-    {
-        "id": "mod_selector",
-        "name": "Mod Selector (Buglord)",
-        "icon": "\u2705",
-        "desc_en": "Buglord's tool to toggle mods on/off via Windows registry. Place in game directory, run, press Enter to switch mods between active (green) and inactive (red).",
-        "desc_de": "Buglords Tool zum Aktivieren/Deaktivieren von Mods über die Windows-Registry. Ins Spielverzeichnis legen, starten, Enter drücken zum Umschalten zwischen aktiv (grün) und inaktiv (rot).",
-        "filename": "TwoWorlds1 Mod Selector_ madebyBuglord.exe",
-        "search_paths": [],
-        "formats": [".wd"],
-        "type": "exe",
-        "download": "https://github.com/MedievalDev/Two-Worlds-Modding-Guid/blob/main/Guid/TwoWorlds1%20Mod%20Selector_%20madebyBuglord.exe",
-        "guide_ids": ["map_to_mod_guide"],
-    },
-    {
-        "id": "wd_repacker",
-        "name": "WD Repacker (Buglord)",
-        "icon": "\U0001f4e6",
-        "desc_en": "Buglord's GUI tool for packing/unpacking .wd archives. IMPORTANT: Select the FOLDER as source, not a .wd file! Correctly handles .phx files (uncompressed).",
-        "desc_de": "Buglords GUI-Tool zum Packen/Entpacken von .wd-Archiven. WICHTIG: Den ORDNER als Source wählen, nicht eine .wd-Datei! Behandelt .phx-Dateien korrekt (unkomprimiert).",
-        "filename": "Tw1WDRepacker.exe",
-        "search_paths": [],
-        "formats": [".wd"],
-        "type": "exe",
-        "download": "https://www.moddb.com/games/two-worlds/downloads",
-        "guide_ids": ["map_to_mod_guide"],
-    },
-]
+        # Viewport first, then everything else in batches
+        first = self._offset(self.text.index("@0,0"))
+        last = self._offset(self.text.index(f"@0,{self.text.winfo_height()}")) + 1
+        lo = bisect.bisect_left(self.matches, (first, 0))
+        hi = bisect.bisect_left(self.matches, (last, 0))
+        self._tag(self.matches[lo:hi])
+        rest = self.matches[hi:] + self.matches[:lo]
+        self._job = self.text.after(1, self._tag_batch, self._generation, rest, 0)
+
+        self.current = lo if lo < len(self.matches) else 0
+        self._select()
+
+    def step(self, delta):
+        if self._searched != self.stream.loaded:
+            self.search()  # a paged guide has grown since the last pass
+        if not self.matches:
+            return
+        self.current = (self.current + delta) % len(self.matches)
+        self._select()
+
+    def _select(self):
+        start, end = self._index(self.matches[self.current][0]), self._index(self.matches[self.current][1])
+        self.text.tag_remove("find_current", "1.0", "end")
+        self.text.tag_add("find_current", start, end)
+        self.text.see(start)
+        self.count_lbl.config(text=f"{self.current + 1}/{len(self.matches)}", fg=FG_DIM)
+
+    def _tag_batch(self, generation, spans, pos):
+        self._job = None
+        if generation != self._generation or not self.text.winfo_exists():
+            return  # a newer query or a closed window
+        self._tag(spans[pos:pos + FIND_BATCH])
+        if pos + FIND_BATCH < len(spans):
+            self._job = self.text.after(1, self._tag_batch, generation, spans, pos + FIND_BATCH)
+
+    def _tag(self, spans):
+        if spans:
+            indexes = []
+            for start, end in spans:
+                indexes += (self._index(start), self._index(end))
+            self.text.tag_add("find_match", *indexes)
+
+    def _index(self, offset):
+        line = bisect.bisect_right(self._line_starts, offset)
+        return f"{line}.{offset - self._line_starts[line - 1]}"
+
+    def _offset(self, index):
+        line, col = (int(part) for part in index.split("."))
+        return self._line_starts[min(line, len(self._line_starts)) - 1] + col
 
-# ============================================================
-# BUILT-IN GUIDES (with external file loading)
-# ============================================================
-BUILTIN_GUIDES = [
-    {
-        "id": "editor_beginner_guide",
-        "title_en": "Editor Beginner Guide",
-        "title_de": "Editor Einsteiger-Handbuch",
-        "icon": "\U0001f3ae",
-        "tags": ["editor", "shortcuts", "objects", "markers", "terrain", "textures", "console", "beginner"],
-        "tool_ids": ["cmd_injector", "tw_editor", "modding_guide"],
-        "file_en": "editor_beginner_guide_en.txt",
-        "file_de": "editor_beginner_guide_de.txt",
-        "fallback_en": "Complete editor reference with Quick Start section. Place 'editor_beginner_guide_en.txt' in the guides/ folder.",
-        "fallback_de": "Komplette Editor-Referenz mit Schnellstart-Abschnitt. Die Datei 'editor_beginner_guide_de.txt' im guides/-Ordner ablegen.",
-    },
-    {
-        "id": "dungeon_guide_part1",
-        "title_en": "Dungeon Guide Part 1 — Manual Method",
-        "title_de": "Dungeon-Guide Teil 1 — Manuelle Methode",
-        "icon": "\U0001f5ff",
-        "tags": ["dungeon", "underground", "cave", "entrance", "markers", "manual"],
-        "tool_ids": ["tw_editor", "cmd_injector"],
-        "file_en": "dungeon_guide_part1_en.txt",
-        "file_de": "dungeon_guide_part1_de.txt",
-        "fallback_en": "Manual dungeon creation using the main editor. Place 'dungeon_guide_part1_en.txt' in the guides/ folder.",
-        "fallback_de": "Manuelle Dungeon-Erstellung im Haupteditor. Die Datei 'dungeon_guide_part1_de.txt' im guides/-Ordner ablegen.",
-    },
-    {
-        "id": "dungeon_guide_part2",
-        "title_en": "Dungeon Guide Part 2 — SDK Dungeon Editor",
-        "title_de": "Dungeon-Guide Teil 2 — SDK Dungeon-Editor",
-        "icon": "\U0001f3f0",
-        "tags": ["dungeon", "underground", "cave", "sdk", "blocks", "dungeon editor"],
-        "tool_ids": ["tw_editor"],
-        "file_en": "dungeon_guide_part2_en.txt",
-        "file_de": "dungeon_guide_part2_de.txt",
-        "fallback_en": "Block-based dungeon creation with the SDK tool. Place 'dungeon_guide_part2_en.txt' in the guides/ folder.",
-        "fallback_de": "Blockbasierte Dungeon-Erstellung mit dem SDK-Tool. Die Datei 'dungeon_guide_part2_de.txt' im guides/-Ordner ablegen.",
-    },
-    {
-        "id": "map_to_mod_guide",
-        "title_en": "Map-to-Mod Conversion Guide",
-        "title_de": "Map-zu-Mod Konvertierungsguide",
-        "icon": "\U0001f4e6",
-        "tags": ["mod", "wd", "pack", "physx", "registry", "levelheaders", "rename", "conversion"],
-        "tool_ids": ["cmd_injector", "modding_guide", "mod_selector", "wd_repacker"],
-        "file_en": "map_to_mod_guide_en.txt",
-        "file_de": "map_to_mod_guide_de.txt",
-        "fallback_en": "Complete mod conversion workflow. Place 'map_to_mod_guide_en.txt' in the guides/ folder.",
-        "fallback_de": "Kompletter Mod-Konvertierungs-Workflow. Die Datei 'map_to_mod_guide_de.txt' im guides/-Ordner ablegen.",
-    },
-    {
-        "id": "physx_cooking",
-        "title_en": "PhysX Cooking Reference",
-        "title_de": "PhysX-Kochen Referenz",
-        "icon": "\U0001f525",
-        "tags": ["physx", "physics", "cooking", "console", "commands", "phx"],
-        "tool_ids": ["cmd_injector", "tw_editor"],
-        "content_en": """PHYSX COOKING REFERENCE
-=======================
-
-How to generate collision/physics data for your map.
-
-THE 4 COMMANDS
---------------
-Open the editor console (C key) and enter in this order:
-
-  1. editor.cookphysx.mode geomipmap
-  2. editor.cookphysx.strength = 1.0
-  3. editor.cookphysx.overwrite = 1
-  4. editor.cookphysx.pc out
-
-Command 1: Sets the cooking mode to geomipmap (terrain mesh)
-Command 2: Sets physics strength to maximum (1.0)
-Command 3: Enables overwriting existing .phx files
-Command 4: Starts the actual cooking process - wait until done!
-
-OUTPUT
-------
-The cooked .phx file is written to:
-  %USERPROFILE%\\Saved Games\\Two Worlds Saves\\Levels\\Physic\\
-
-File will be named after your map: Map_F01s.phx
-
-CRITICAL WARNINGS
------------------
-* The .phx file must NEVER be compressed in a .wd archive
-  -> Old/other WD packers compress .phx files -> game CRASH
-  -> Only use Buglord's wdio.py or his WD Repacker
-* Without physics data: no collision on terrain (you fall through)
-* Must be regenerated after ANY terrain changes
-* The cooking process can take a while for large/complex maps""",
-        "content_de": """PHYSX-KOCHEN REFERENZ
-=====================
-
-Wie man Kollisions-/Physikdaten fuer deine Map generiert.
-
-DIE 4 BEFEHLE
--------------
-Editor-Konsole oeffnen (C-Taste) und in dieser Reihenfolge eingeben:
-
-  1. editor.cookphysx.mode geomipmap
-  2. editor.cookphysx.strength = 1.0
-  3. editor.cookphysx.overwrite = 1
-  4. editor.cookphysx.pc out
-
-Befehl 1: Setzt den Kochmodus auf geomipmap (Terrain-Mesh)
-Befehl 2: Setzt Physik-Staerke auf Maximum (1.0)
-Befehl 3: Aktiviert Ueberschreiben vorhandener .phx-Dateien
-Befehl 4: Startet den Kochprozess - warten bis fertig!
-
-AUSGABE
--------
-Die gekochte .phx-Datei wird geschrieben nach:
-  %USERPROFILE%\\Saved Games\\Two Worlds Saves\\Levels\\Physic\\
-
-Dateiname nach deiner Map: Map_F01s.phx
-
-KRITISCHE WARNUNGEN
--------------------
-* Die .phx-Datei darf in einem .wd-Archiv NIEMALS komprimiert werden
-  -> Alte/andere WD-Packer komprimieren .phx -> Spiel CRASHT
-  -> Nur Buglords wdio.py oder seinen WD Repacker verwenden
-* Ohne Physikdaten: keine Kollision auf dem Terrain (man faellt durch)
-* Muss nach JEDER Terrain-Aenderung neu generiert werden
-* Der Kochprozess kann bei grossen/komplexen Maps eine Weile dauern""",
-    },
-    {
-        "id": "format_overview",
-        "title_en": "File Format Overview",
-        "title_de": "Dateiformat-Uebersicht",
-        "icon": "\U0001f4c4",
-        "tags": ["format", "wd", "lan", "par", "lnd", "phx", "idx", "qtx", "shf", "lhc", "bmp", "vdf"],
-        "tool_ids": ["lan_viewer", "quest_editor", "par_tool", "vdf_to_obj", "obj_to_vdf", "lnd_viewer", "lnd_world_maps", "lnd_objects_exporter", "wd_repacker"],
-        "content_en": """FILE FORMAT OVERVIEW
-====================
-
-All file formats used in Two Worlds 1 modding.
-
-GAME DATA FILES
----------------
-.wd     WD Archive - Mod container, zlib-compressed, GUID-identified
-.par    Parameter Database - Items, NPCs, skills, stats (binary)
-.lnd    Level/Map - Terrain, objects, spawns per tile (128x128)
-.phx    Physics - Collision data, must NOT be compressed in .wd
-.lhc    LevelHeaders Cache - Map index, regenerate after changes
-.bmp    Minimap - Bitmap image per map tile
-.vdf    3D Model - Mesh geometry, textures, animations
-
-QUEST & DIALOG FILES
---------------------
-.lan    Language - All localized text (16,194 translations, binary)
-.idx    Quest Data - SOAP-XML, full quest trees (recommended for editing)
-.qtx    Quest Logic - Plaintext, compiled for engine (no dialog text)
-.shf    WhizzEdit Project - .NET binary, read-only in our tools
-
-PIPELINE
---------
-WhizzEdit (.shf) -> Export -> .idx (XML) -> Compile -> .qtx + .lan
-Editor -> Save -> .lnd + .bmp -> Cook -> .phx -> Pack -> .wd
-
-WHICH TOOL FOR WHICH FILE?
----------------------------
-.lan    -> TW1 LAN Viewer
-.idx    -> TW1 Quest Editor
-.qtx    -> TW1 Quest Editor
-.shf    -> TW1 Quest Editor (read-only)
-.par    -> TW1 PAR Tool
-.vdf    -> TW1 VDF to OBJ / TW1 OBJ to VDF
-.lnd    -> TW1 LND Viewer / LND World Maps / LND Objects Exporter / TwoWorlds Editor
-.wd     -> WD Repacker / Mod Selector
-.phx    -> Generated by editor (PhysX cooking)
-.lhc    -> Generated by LevelHeadersCacheGen.bat
-.bmp    -> Any image viewer""",
-        "content_de": """DATEIFORMAT-UEBERSICHT
-======================
-
-Alle Dateiformate beim Two Worlds 1 Modding.
-
-SPIELDATEN-DATEIEN
-------------------
-.wd     WD-Archiv - Mod-Container, zlib-komprimiert, GUID-identifiziert
-.par    Parameter-Datenbank - Items, NPCs, Skills, Stats (binaer)
-.lnd    Level/Map - Terrain, Objekte, Spawns pro Tile (128x128)
-.phx    Physik - Kollisionsdaten, darf in .wd NICHT komprimiert werden
-.lhc    LevelHeaders-Cache - Map-Index, nach Aenderungen neu generieren
-.bmp    Minimap - Bitmap-Bild pro Map-Tile
-.vdf    3D-Modell - Mesh-Geometrie, Texturen, Animationen
-
-QUEST- & DIALOG-DATEIEN
------------------------
-.lan    Sprache - Alle lokalisierten Texte (16.194 Uebersetzungen, binaer)
-.idx    Quest-Daten - SOAP-XML, volle Quest-Baeume (empfohlen zum Editieren)
-.qtx    Quest-Logik - Klartext, kompiliert fuer Engine (kein Dialog-Text)
-.shf    WhizzEdit-Projekt - .NET-Binaer, nur lesbar in unseren Tools
-
-PIPELINE
---------
-WhizzEdit (.shf) -> Export -> .idx (XML) -> Kompilieren -> .qtx + .lan
-Editor -> Speichern -> .lnd + .bmp -> Kochen -> .phx -> Packen -> .wd
-
-WELCHES TOOL FUER WELCHE DATEI?
----------------------------------
-.lan    -> TW1 LAN Viewer
-.idx    -> TW1 Quest Editor
-.qtx    -> TW1 Quest Editor
-.shf    -> TW1 Quest Editor (nur lesen)
-.par    -> TW1 PAR Tool
-.vdf    -> TW1 VDF to OBJ / TW1 OBJ to VDF
-.lnd    -> TW1 LND Viewer / LND World Maps / LND Objects Exporter / TwoWorlds Editor
-.wd     -> WD Repacker / Mod Selector
-.phx    -> Vom Editor generiert (PhysX-Kochen)
-.lhc    -> Von LevelHeadersCacheGen.bat generiert
-.bmp    -> Jeder Bildbetrachter""",
-    },
-]
 
 # ============================================================
-# CREDITS
+# RECYCLED CARD WIDGETS
 # ============================================================
-CREDITS = {
-    "en": """CREDITS
-=======
-
-TOOLS & REVERSE ENGINEERING
-  Buglord (Discord: buglord)
-    wdio.py (WD packer/unpacker), Mod Selector, WD Repacker,
-    WD archive format documentation, registry mechanism,
-    LAN format specification, QTX format specification
-
-MODDING GUIDES & TESTING
-  JadetheReaper (Discord: .jadetheripper)
-    Map Test EX.wd, Map-to-Mod conversion process documentation
-
-  Smoothness (Discord)
-    Editor tutorials, dungeon/underground creation workflow,
-    game object behavior documentation, editor shortcuts
-
-DEVELOPMENT
-  MedievalDev
-    TW1 Modding Hub, CMD Injector, LAN Viewer, Quest Editor,
-    PAR Tool, VDF to OBJ, OBJ to VDF, LND Viewer,
-    LND World Maps, LND Objects Exporter, Modding Guide Tool
-
-DOCUMENTATION
-  MedievalDev & Claude (Anthropic)
-    Editor Beginner Guide, Dungeon Guide Part 1 & 2,
-    Map-to-Mod Conversion Guide (EN + DE)
-
-ORIGINAL GAME & SDK
-  Reality Pump Studios - Two Worlds (2007)
-  TopWare Interactive - Publisher""",
-    "de": """CREDITS
-=======
-
-TOOLS & REVERSE ENGINEERING
-  Buglord (Discord: buglord)
-    wdio.py (WD-Packer/Entpacker), Mod Selector, WD Repacker,
-    WD-Archivformat-Dokumentation, Registry-Mechanismus,
-    LAN-Format-Spezifikation, QTX-Format-Spezifikation
-
-MODDING-ANLEITUNGEN & TESTS
-  JadetheReaper (Discord: .jadetheripper)
-    Map Test EX.wd, Map-zu-Mod Konvertierungsprozess-Dokumentation
-
-  Smoothness (Discord)
-    Editor-Tutorials, Dungeon/Untergrund-Erstellungs-Workflow,
-    Spielobjekt-Verhaltensdokumentation, Editor-Tastenkuerzel
-
-ENTWICKLUNG
-  MedievalDev
-    TW1 Modding Hub, CMD Injector, LAN Viewer, Quest Editor,
-    PAR Tool, VDF to OBJ, OBJ to VDF, LND Viewer,
-    LND World Maps, LND Objects Exporter, Modding Guide Tool
-
-DOKUMENTATION
-  MedievalDev & Claude (Anthropic)
-    Editor Einsteiger-Handbuch, Dungeon-Guide Teil 1 & 2,
-    Map-zu-Mod Konvertierungsguide (EN + DE)
-
-ORIGINALSPIEL & SDK
-  Reality Pump Studios - Two Worlds (2007)
-  TopWare Interactive - Publisher""",
-}
+def card_size(font_size):
+    """Edge length of a square tool card; scales from ~180 to ~280."""
+    return 180 + (font_size - 8) * 10
+
+
+def list_row_height(font_size):
+    """Height of one tool row in list view."""
+    return 100 + font_size * 7
+
+
+class VirtualGrid:
+    """Materializes only the rows of a long item list that are on screen.
+
+    Items are laid out in fixed-height rows of `cols` cells inside
+    `container`, which is sized to the full list so the canvas scrollbar
+    stays accurate. Cards are created by `render(item, card)` for the
+    visible rows plus OVERSCAN_ROWS, placed with `card.show(x, y, w, h)`,
+    and hidden (then eventually destroyed) once they scroll out of view.
+    """
+
+    def __init__(self, hub, channel, canvas, container, render):
+        self.hub = hub
+        self.channel = channel
+        self.canvas = canvas
+        self.container = container
+        self.render = render
+        self.cards = {}     # key -> card, in least-recently-shown order
+        self.items = []
+        self.cols = 1
+        self.row_h = 1
+        self._sync_job = None
+
+    def set_items(self, items, cols, row_h):
+        self.items = items
+        self.cols = cols
+        self.row_h = row_h
+        rows = -(-len(items) // cols)
+        self.container.config(height=max(rows * row_h, 1))
+        self.sync()
+
+    def schedule_sync(self, *args):
+        if self._sync_job is None:
+            self._sync_job = self.hub.root.after_idle(self.sync)
+
+    def sync(self):
+        if self._sync_job:
+            self.hub.root.after_cancel(self._sync_job)
+            self._sync_job = None
+
+        cols, row_h = self.cols, self.row_h
+        rows = -(-len(self.items) // cols)
+        top = self.canvas.canvasy(0) - self.container.winfo_y()
+        view_h = self.canvas.winfo_height()
+        first = max(int(top // row_h) - OVERSCAN_ROWS, 0)
+        last = min(int((top + view_h) // row_h) + OVERSCAN_ROWS, rows - 1)
+        start = first * cols
+        window = self.items[start:(last + 1) * cols]
+
+        keys = {self.hub._item_key(item) for item in window}
+        for key, card in self.cards.items():
+            if key not in keys:
+                card.hide()
+
+        width = max(self.container.winfo_width(), cols)
+        col_w = width // cols
+
+        def render_one(i, item):
+            key = self.hub._item_key(item)
+            card = self.render(item, self.cards.pop(key, None))
+            self.cards[key] = card  # re-insert: most recently shown last
+            row, col = divmod(start + i, cols)
+            card.show(col * col_w, row * row_h, col_w, row_h)
+
+        self.hub._render_in_chunks(self.channel, window, render_one, on_done=self._trim)
+
+    def _trim(self):
+        """Destroy the least recently shown hidden cards beyond CARD_CACHE."""
+        hidden = [k for k, c in self.cards.items() if not c.visible]
+        for key in hidden[:max(len(hidden) - CARD_CACHE, 0)]:
+            self.cards.pop(key).destroy()
+
+    def prune(self, items):
+        """Destroy cards whose tool/guide no longer exists at all."""
+        keys = {self.hub._item_key(i) for i in items}
+        for key in [k for k in self.cards if k not in keys]:
+            self.cards.pop(key).destroy()
+
+
+class ToolCard:
+    """Widgets for one tool, kept alive across redraws.
+
+    The hub reconciles cards by tool id: `update` only reconfigures what
+    changed since the last call (language, found-status, grid/list), and
+    `show` only re-places the card when its geometry actually moved.
+    """
+
+    def __init__(self, hub, parent, tool):
+        self.hub = hub
+        self.tool = tool
+        self.font_size = hub.font_size
+        self.state = None   # (lang, found, grid) last applied
+        self.pos = None     # (x, y, width, height) last applied
+
+        size = card_size(self.font_size)
+        self.frame = tk.Frame(parent, bg=CARD_BG, highlightbackground=BORDER,
+                              highlightthickness=1, width=size, height=size)
+
+        inner = tk.Frame(self.frame, bg=CARD_BG, padx=10, pady=8)
+        inner.pack(fill="both", expand=True)
 
-# ============================================================
-# CONFIG MANAGEMENT
-# ============================================================
-def load_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {"lang": "en", "view_mode": "grid", "font_size": 10,
-            "guides_dir": GUIDES_DIR,
-            "user_tools": [], "user_guides": [], "tool_paths": {}}
+        # Font sizes relative to setting (base=10)
+        fs = self.font_size
+        fs_icon = fs + 4
+        fs_status = max(fs - 3, 6)
+        self.fs_desc = max(fs - 2, 7)
+        fs_tag = max(fs - 3, 6)
+        fs_btn = max(fs - 1, 8)
+
+        # Header
+        hdr = tk.Frame(inner, bg=CARD_BG)
+        hdr.pack(fill="x")
+        tk.Label(hdr, text=tool.get("icon", "\U0001f527"), font=("Segoe UI", fs_icon),
+                 bg=CARD_BG, fg=FG).pack(side="left")
+        self.status_lbl = tk.Label(hdr, font=("Segoe UI", fs_status), bg=CARD_BG)
+        self.status_lbl.pack(side="right")
 
-def save_config(cfg):
-    try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Config save error: {e}")
+        # Tool name
+        self.wrap_card = size - 25
+        tk.Label(inner, text=tool["name"], font=("Segoe UI", fs, "bold"), bg=CARD_BG, fg=FG,
+                 anchor="w", wraplength=self.wrap_card).pack(fill="x", pady=(2, 0))
 
+        # Description (short in grid, full in list)
+        self.desc_lbl = tk.Label(inner, font=("Segoe UI", self.fs_desc), bg=CARD_BG, fg=FG_DIM,
+                                 justify="left", anchor="nw")
+        self.desc_lbl.pack(fill="x", pady=(2, 0))
 
-# ============================================================
-# GUIDE FILE LOADER
-# ============================================================
-def load_guide_content(guide, lang, guides_dir):
-    """Load guide content from external file or fallback to embedded."""
-    file_key = f"file_{lang}"
-    content_key = f"content_{lang}"
-
-    # Try external file first
-    if file_key in guide:
-        filepath = os.path.join(guides_dir, guide[file_key])
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception:
-                pass
+        # Format tags
+        formats = tool.get("formats", [])
+        if formats:
+            fmt_frame = tk.Frame(inner, bg=CARD_BG)
+            fmt_frame.pack(fill="x", pady=(3, 0))
+            for fmt in formats[:4]:  # max 4 tags in square card
+                tk.Label(fmt_frame, text=fmt, font=("Consolas", fs_tag), bg=BG3, fg=CYAN,
+                         padx=3, pady=0).pack(side="left", padx=(0, 2))
+
+        # Related guides (list view only, built on first use)
+        self.guides_frame = tk.Frame(inner, bg=CARD_BG)
+        self.guide_lbls = None
+
+        # Spacer to push buttons to bottom
+        self.spacer = tk.Frame(inner, bg=CARD_BG)
+        self.spacer.pack(fill="both", expand=True)
+
+        # Action buttons (anchored at bottom)
+        btn_frame = tk.Frame(inner, bg=CARD_BG)
+        btn_frame.pack(fill="x", side="bottom")
+
+        self.launch_btn = tk.Button(btn_frame, font=("Segoe UI", fs_btn, "bold"),
+                                    bg=GREEN, fg="#111", relief="flat", padx=10, pady=3, cursor="hand2",
+                                    command=lambda: hub._launch_tool(self.tool))
+        self.download_btn = None
+        dl = tool.get("download")
+        if dl:
+            self.download_btn = tk.Button(btn_frame, font=("Segoe UI", fs_btn),
+                                          bg=ORANGE, fg="#111", relief="flat", padx=10, pady=3,
+                                          cursor="hand2", command=lambda u=dl: webbrowser.open(u))
+        self.path_btn = tk.Button(btn_frame, font=("Segoe UI", fs_btn),
+                                  bg=BG3, fg=FG, relief="flat", padx=10, pady=3, cursor="hand2",
+                                  command=lambda: hub._browse_tool_path(self.tool))
+
+        # Custom indicator
+        self.custom_lbl = None
+        if tool.get("custom"):
+            self.custom_lbl = tk.Label(btn_frame, font=("Segoe UI", self.fs_desc),
+                                       bg=CARD_BG, fg=PURPLE)
+            self.custom_lbl.pack(side="right")
+
+    def update(self, found, grid):
+        """Apply language/found/view changes with as few configure calls as possible."""
+        hub = self.hub
+        state = (hub.lang, bool(found), grid)
+        if state == self.state:
+            return
+        old_lang, old_found, old_grid = self.state or (None, None, None)
+        lang_changed = old_lang != hub.lang
+        found_changed = old_found != bool(found)
+        grid_changed = old_grid != grid
+
+        if lang_changed or found_changed:
+            self.status_lbl.config(text=f"\u25cf {hub.t('found') if found else hub.t('not_found')}",
+                                   fg=GREEN if found else RED)
+
+        if lang_changed or grid_changed:
+            desc = self.tool.get(f"desc_{hub.lang}", self.tool.get("desc_en", ""))
+            if grid and len(desc) > 80:
+                desc = desc[:77] + "..."
+            self.desc_lbl.config(text=desc, wraplength=self.wrap_card if grid else 900)
+
+        if grid_changed:
+            if grid:
+                self.guides_frame.pack_forget()
+            elif self._build_guide_links():
+                self.guides_frame.pack(fill="x", pady=(3, 0), before=self.spacer)
+
+        if self.guide_lbls and not grid and (lang_changed or grid_changed):
+            for lbl, guide in self.guide_lbls:
+                gtitle = guide.get(f"title_{hub.lang}", guide.get("title_en", guide.get("id")))
+                lbl.config(text=f"\U0001f4d6 {gtitle}")
+
+        if found_changed:
+            for btn in (self.launch_btn, self.download_btn, self.path_btn):
+                if btn:
+                    btn.pack_forget()
+            if found:
+                # FOUND: only Launch button
+                self.launch_btn.pack(side="left")
+            else:
+                # NOT FOUND: Download + Browse side by side
+                if self.download_btn:
+                    self.download_btn.pack(side="left", padx=(0, 4))
+                self.path_btn.pack(side="left")
+
+        if lang_changed:
+            self.launch_btn.config(text=f"\u25b6 {hub.t('launch')}")
+            if self.download_btn:
+                self.download_btn.config(text=f"\u2B07 {hub.t('download')}")
+            self.path_btn.config(text=f"\U0001f4c2 {hub.t('set_path')}")
+            if self.custom_lbl:
+                self.custom_lbl.config(text=hub.t("custom"))
+
+        self.state = state
+
+    def _build_guide_links(self):
+        if self.guide_lbls is None:
+            self.guide_lbls = []
+            for guide in self.hub.catalog.related(self.tool):
+                lbl = tk.Label(self.guides_frame, font=("Segoe UI", self.fs_desc),
+                               bg=CARD_BG, fg=BLUE, cursor="hand2")
+                lbl.pack(side="left", padx=(0, 8))
+                lbl.bind("<Button-1>", lambda e, g=guide: self.hub._show_guide_preview(g))
+                self.guide_lbls.append((lbl, guide))
+        return bool(self.guide_lbls)
+
+    @property
+    def visible(self):
+        return self.pos is not None
+
+    def show(self, x, y, width, height):
+        """Place the card in its grid cell (or list row), leaving a gap around it."""
+        pad_x, pad_y = (4, 4) if self.state[2] else (0, 3)
+        pos = (x + pad_x, y + pad_y, width - 2 * pad_x, height - 2 * pad_y)
+        if pos != self.pos:
+            self.frame.place(x=pos[0], y=pos[1], width=pos[2], height=pos[3])
+            self.pos = pos
+
+    def hide(self):
+        if self.pos is not None:
+            self.frame.place_forget()
+            self.pos = None
+
+    def destroy(self):
+        self.frame.destroy()
+
+
+class GuideItem:
+    """One entry of the guide list, kept alive across redraws."""
+
+    def __init__(self, hub, parent, guide):
+        self.hub = hub
+        self.guide = guide
+        self.lang = None
+        self.pos = None
+
+        self.frame = tk.Frame(parent, bg=CARD_BG, highlightbackground=BORDER,
+                              highlightthickness=1, padx=10, pady=8, cursor="hand2")
+
+        self.title_lbl = tk.Label(self.frame, font=("Segoe UI", 10, "bold"),
+                                  bg=CARD_BG, fg=FG, anchor="w")
+        self.title_lbl.pack(fill="x")
+
+        tags = guide.get("tags", [])
+        if tags:
+            tag_text = " ".join(f"#{t}" for t in tags[:5])
+            tk.Label(self.frame, text=tag_text, font=("Segoe UI", 8), bg=CARD_BG, fg=FG_DIM,
+                     anchor="w").pack(fill="x")
 
-    # Fallback to embedded content
-    if content_key in guide:
-        return guide[content_key]
+        self.custom_lbl = None
+        if guide.get("auto_discovered"):
+            tk.Label(self.frame, text="\U0001f4c2 Auto", font=("Segoe UI", 8),
+                     bg=CARD_BG, fg=GREEN, anchor="w").pack(fill="x")
+        elif guide.get("custom"):
+            self.custom_lbl = tk.Label(self.frame, font=("Segoe UI", 8),
+                                       bg=CARD_BG, fg=PURPLE, anchor="w")
+            self.custom_lbl.pack(fill="x")
 
-    # Fallback text
-    fallback_key = f"fallback_{lang}"
-    if fallback_key in guide:
-        return guide[fallback_key]
+        for widget in [self.frame] + self.frame.winfo_children():
+            widget.bind("<Button-1>", lambda e: hub._show_guide_preview(self.guide))
+            widget.bind("<Double-Button-1>", lambda e: hub._show_guide_popup(self.guide))
+
+    def update(self):
+        lang = self.hub.lang
+        if lang == self.lang:
+            return
+        title = self.guide.get(f"title_{lang}", self.guide.get("title_en", ""))
+        icon = self.guide.get("icon", "\U0001f4d6")
+        self.title_lbl.config(text=f"{icon}  {title}")
+        if self.custom_lbl:
+            self.custom_lbl.config(text=self.hub.t("custom"))
+        self.lang = lang
 
-    # Final fallback
-    return LANG.get("guide_not_found", {}).get(lang, "Guide file not found.")
+    @property
+    def visible(self):
+        return self.pos is not None
+
+    def show(self, x, y, width, height):
+        pos = (x + 6, y + 3, width - 12, height - 6)
+        if pos != self.pos:
+            self.frame.place(x=pos[0], y=pos[1], width=pos[2], height=pos[3])
+            self.pos = pos
+
+    def hide(self):
+        if self.pos is not None:
+            self.frame.place_forget()
+            self.pos = None
+
+    def destroy(self):
+        self.frame.destroy()
 
 
 # ============================================================
@@ -677,19 +719,14 @@ def load_guide_content(guide, lang, guides_dir):
 class ModdingHub:
     def __init__(self, root):
         self.root = root
-        self.cfg = load_config()
+        # Config changes are coalesced into one write on the Tk thread
+        self.store = ConfigStore(schedule=self.root.after, cancel=self.root.after_cancel,
+                                 on_reload=self._on_config_reload)
+        self.cfg = self.store.cfg
         self.lang = self.cfg.get("lang", "en")
         self.view_mode = self.cfg.get("view_mode", "grid")
         self.font_size = self.cfg.get("font_size", 10)
-        self.guides_dir = self.cfg.get("guides_dir", GUIDES_DIR)
-
-        # Auto-detect guides folder if default doesn't exist
-        if not os.path.isdir(self.guides_dir):
-            for alt in ["guides", "Guids", "Guides", "guids"]:
-                alt_path = os.path.join(SCRIPT_DIR, alt)
-                if os.path.isdir(alt_path):
-                    self.guides_dir = alt_path
-                    break
+        self.guides_dir = resolve_guides_dir(self.cfg)
 
         # DPI awareness BEFORE geometry calculations
         try:
@@ -711,12 +748,123 @@ class ModdingHub:
         self.root.minsize(800, 400)
         self.root.configure(bg=BG)
 
+        # Catalog, index and tool paths are filled in by _background_load
+        self.catalog = Catalog(self.cfg, self.guides_dir)
+        self.guide_cache = GuideContentCache()
+        self.tool_search = SearchEngine(TOOL_FIELDS)
+        self.guide_search = SearchEngine(GUIDE_FIELDS)
+        self.preview_stream = None
+        self.preview_guide = None
+        self._guides_shown = []
+        self.guide_index = None
+        self.locator = ToolLocator()
+        self.scanner = WorkspaceScanner()
+        self.usage = UsageLog()
+        self.supervisor = ProcessSupervisor(self.cfg, self.usage)
+
+        self._search_job = None
+        self._tools_query = None
+        self._guides_query = None
+        self._render_jobs = {}
+        self._diag_win = None
+        self._running_win = None
+        self._workflow_win = None
+        self._batch_win = None
+        self._run_cancels = {}     # panel -> cancel() of its workflow or batch run
+        self._supervise_job = None
+        self._discovery_job = None
+        self.ready = False
+        self.guides_built = False
+        self.startup_times = {}
+
+        # Stage 1: just the frame, toolbar, empty tabs and status bar
         self._setup_styles()
         self._build_toolbar()
         self._build_main()
         self._build_statusbar()
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<Expose>", self._on_first_paint, add="+")
+        self.root.bind("<Activate>", self._on_activate, add="+")
+        self._mark_startup("window")
+
+        # Stage 2: everything that touches the disk runs off the Tk thread
+        self._load_done = False
+        threading.Thread(target=self._background_load, name="tw1hub-startup", daemon=True).start()
+        self.root.after(STARTUP_POLL_MS, self._poll_startup)
+
+    # ────────────────────────────────────────────────────────
+    # STAGED STARTUP
+    # ────────────────────────────────────────────────────────
+    def _mark_startup(self, phase):
+        elapsed = time.perf_counter() - STARTED
+        self.startup_times[phase] = elapsed
+        PROFILER.record(f"startup.{phase}", elapsed)
+
+    def _on_first_paint(self, e=None):
+        if "first_paint" not in self.startup_times:
+            self._mark_startup("first_paint")
+
+    def _background_load(self):
+        """Scan the guides folder, load the index and locate every tool."""
+        try:
+            with PROFILER.span("startup.catalog"):
+                self.catalog.refresh()
+            with PROFILER.span("startup.index"):
+                index = GuideIndex()
+                index.refresh(self.catalog.guides, self.guides_dir)
+            self.guide_index = index
+            with PROFILER.span("startup.locate"):
+                tool_paths = self.cfg.get("tool_paths", {})
+                for tool in self._get_all_tools():
+                    self.locator.find(tool, tool_paths)
+        except Exception as e:
+            print(f"Startup load error: {e}")
+        self._load_done = True
+
+    def _poll_startup(self):
+        if not self._load_done:
+            self.root.after(STARTUP_POLL_MS, self._poll_startup)
+            return
+        if self.guide_index is None:
+            self.guide_index = GuideIndex()
+        self.ready = True
+        self.add_tool_btn.config(state="normal")
+        if self.guides_built:
+            self.add_guide_btn.config(state="normal")
+        query = self._current_query()
+        self._show_tools(query)
+        if self.guides_built:
+            self._show_guides(query)
+        self._update_statusbar()
+        self._mark_startup("ready")
+
+        # Deep workspace search runs in the background once everything else is up
+        self._start_discovery()
+        self.supervisor.set_warm(self.cfg.get("warm_launch", False))
+
+    def _on_activate(self, e=None):
+        # Another hub instance may have changed the shared config meanwhile
+        if e is None or e.widget is self.root:
+            self.store.sync()
+
+    def _on_config_reload(self):
+        """Show tools, guides and paths merged in from another instance's config write."""
+        if not self.ready:
+            return  # the startup load reads the merged config
+        self.catalog.rebuild()
+        self.locator.invalidate()
+        self._refresh_guide_index()
+        query = self._current_query()
+        self._show_tools(query)
+        self._show_guides(query)
+        self._update_statusbar()
+
+    def _refresh_guide_index(self):
+        if not self.ready:
+            return  # the startup load refreshes it
+        self.catalog.refresh()
+        self.guide_index.refresh(self._get_all_guides(), self.guides_dir)
 
     def t(self, key):
         entry = LANG.get(key, {})
@@ -765,11 +913,28 @@ class ModdingHub:
                                    command=self._toggle_view)
         self.view_btn.pack(side="right", padx=4)
 
+        # Workflows button
+        tk.Button(right, text="\u25b6 " + self.t("workflows"), font=("Segoe UI", 9), bg=BG3, fg=FG,
+                  relief="flat", padx=8, pady=2, cursor="hand2",
+                  command=self._show_workflows).pack(side="right", padx=4)
+
+        # Batch runs button
+        tk.Button(right, text="\u2630 " + self.t("batch"), font=("Segoe UI", 9), bg=BG3, fg=FG,
+                  relief="flat", padx=8, pady=2, cursor="hand2",
+                  command=self._show_batch).pack(side="right", padx=4)
+
         # Credits button
         tk.Button(right, text=self.t("credits"), font=("Segoe UI", 9), bg=BG3, fg=FG_DIM,
                   relief="flat", padx=8, pady=2, cursor="hand2",
                   command=self._show_credits).pack(side="right", padx=4)
 
+        # Diagnostics button (only when profiling)
+        if PROFILER.enabled:
+            tk.Button(right, text="\U0001f4ca " + self.t("diagnostics"), font=("Segoe UI", 9), bg=BG3, fg=YELLOW,
+                      relief="flat", padx=8, pady=2, cursor="hand2",
+                      command=self._show_diagnostics).pack(side="right", padx=4)
+            self.root.bind("<Control-Shift-D>", lambda e: self._show_diagnostics())
+
         # Search bar
         search_frame = tk.Frame(tb, bg=SEARCH_BG, highlightbackground=BORDER,
                                  highlightthickness=1, padx=6, pady=3)
@@ -788,6 +953,7 @@ class ModdingHub:
         self.search_entry.bind("<KeyRelease>", self._on_search)
 
     def _search_focus_in(self, e):
+        self._refresh_guide_index()
         if self.search_entry.get() in [LANG["search"]["en"], LANG["search"]["de"]]:
             self.search_entry.delete(0, "end")
             self.search_entry.config(fg=FG)
@@ -798,14 +964,53 @@ class ModdingHub:
             self.search_entry.config(fg=FG_DIM)
 
     def _on_search(self, e=None):
+        # Coalesce keystrokes: only the last one within the debounce window runs
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _current_query(self):
         query = self.search_var.get().strip().lower()
         if query in [self.t("search").lower(), ""] or not query:
-            self._show_tools()
-            self._show_guides()
-            return
+            return None
+        return query
+
+    def _run_search(self):
+        self._search_job = None
+        if not self.ready:
+            return  # the startup load shows the results for the current query
+        query = self._current_query()
+        if query == self._tools_query and query == self._guides_query:
+            return  # e.g. arrow keys or modifiers
         self._show_tools(query)
         self._show_guides(query)
 
+    def _render_in_chunks(self, channel, items, render_one, on_done=None):
+        """Render items a few at a time so the mainloop stays responsive.
+
+        Starting a new render on the same channel cancels the pending one.
+        """
+        self._cancel_render(channel)
+        pending = iter(enumerate(items))
+
+        def step():
+            for _ in range(RENDER_CHUNK):
+                nxt = next(pending, None)
+                if nxt is None:
+                    self._render_jobs.pop(channel, None)
+                    if on_done:
+                        on_done()
+                    return
+                render_one(*nxt)
+            self._render_jobs[channel] = self.root.after(1, step)
+
+        step()
+
+    def _cancel_render(self, channel):
+        job = self._render_jobs.pop(channel, None)
+        if job:
+            self.root.after_cancel(job)
+
     # ────────────────────────────────────────────────────────
     # MAIN AREA
     # ────────────────────────────────────────────────────────
@@ -820,7 +1025,17 @@ class ModdingHub:
         self.notebook.add(self.guides_outer, text=f"  \U0001f4d6 {self.t('guides')}  ")
 
         self._build_tools_tab()
-        self._build_guides_tab()
+        # The guides tab is only built the first time it is selected
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, e=None):
+        if self.notebook.index("current") == 1:
+            self._ensure_guides_tab()
+
+    def _ensure_guides_tab(self):
+        if not self.guides_built:
+            self.guides_built = True
+            self._build_guides_tab()
 
     # ────────────────────────────────────────────────────────
     # TOOLS TAB
@@ -832,11 +1047,17 @@ class ModdingHub:
 
         self.tools_inner.bind("<Configure>", lambda e: self.tools_canvas.configure(scrollregion=self.tools_canvas.bbox("all")))
         self._tools_win_id = self.tools_canvas.create_window((0, 0), window=self.tools_inner, anchor="nw")
-        self.tools_canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Every scroll or resize re-materializes the visible rows
+        def _on_tools_scroll(*args):
+            scrollbar.set(*args)
+            self.tools_view.schedule_sync()
+        self.tools_canvas.configure(yscrollcommand=_on_tools_scroll)
 
         # Keep inner frame width = canvas width (so cards fill the space)
         def _on_canvas_resize(e):
             self.tools_canvas.itemconfig(self._tools_win_id, width=e.width)
+            self.tools_view.schedule_sync()
         self.tools_canvas.bind("<Configure>", _on_canvas_resize)
 
         self.tools_canvas.pack(side="left", fill="both", expand=True)
@@ -846,168 +1067,72 @@ class ModdingHub:
             self.tools_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
         self.tools_canvas.bind_all("<MouseWheel>", _on_mousewheel, add="+")
 
-        self._show_tools()
+        # Cards are placed into fixed-size cells; only visible rows exist
+        self.tools_grid = tk.Frame(self.tools_inner, bg=BG, height=1)
+        self.tools_grid.pack(fill="x", padx=10, pady=4)
+        self.tools_empty = tk.Label(self.tools_inner, font=("Segoe UI", 12), bg=BG, fg=FG_DIM)
+        self.add_tool_btn = self._add_tool_button(self.tools_inner)
+        self.tools_view = VirtualGrid(self, "tools", self.tools_canvas, self.tools_grid,
+                                      self._render_tool_card)
 
+    @PROFILER.timed("_show_tools")
     def _show_tools(self, query=None):
-        for w in self.tools_inner.winfo_children():
-            w.destroy()
+        if not self.ready:
+            return
+        self._cancel_render("tools")
+        if query != self._tools_query:
+            self.tools_canvas.yview_moveto(0)  # new result set starts at the top
+        self._tools_query = query
 
         all_tools = self._get_all_tools()
+        self.tools_view.prune(all_tools)
 
         if query:
-            filtered = []
-            for tool in all_tools:
-                searchable = f"{tool['name']} {tool.get('desc_'+self.lang, tool.get('desc_en',''))} {' '.join(tool.get('formats',[]))}".lower()
-                if query in searchable:
-                    filtered.append(tool)
-            for fmt, desc in FILE_FORMATS.items():
-                if query in fmt.lower() or query in desc.get(self.lang, desc.get("en", "")).lower():
-                    for tool in all_tools:
-                        if fmt in tool.get("formats", []) and tool not in filtered:
-                            filtered.append(tool)
-            all_tools = filtered
-
-        if not all_tools:
-            tk.Label(self.tools_inner, text=self.t("no_results"), font=("Segoe UI", 12),
-                     bg=BG, fg=FG_DIM).pack(pady=40)
-            self._add_tool_button(self.tools_inner)
-            return
-
-        if self.view_mode == "grid":
-            self._show_tools_grid(all_tools)
-        else:
-            self._show_tools_list(all_tools)
-
-        self._add_tool_button(self.tools_inner)
-
-    def _show_tools_grid(self, tools):
-        cols = 4
-        self._grid_cols = cols
-
-        # Use a grid container for uniform card sizes
-        grid_frame = tk.Frame(self.tools_inner, bg=BG)
-        grid_frame.pack(fill="x", padx=10, pady=4)
-        for c in range(cols):
-            grid_frame.columnconfigure(c, weight=1, uniform="toolcard")
+            all_tools = self._ranked_search(query, "tool")
+        elif self.cfg.get("sort_by_usage"):
+            all_tools = self.usage.by_frequency(all_tools)
 
-        for i, tool in enumerate(tools):
-            row = i // cols
-            col = i % cols
-            self._create_tool_card(grid_frame, tool, grid=True, grid_row=row, grid_col=col)
-
-    def _show_tools_list(self, tools):
-        for tool in tools:
-            self._create_tool_card(self.tools_inner, tool, grid=False)
-
-    def _create_tool_card(self, parent, tool, grid=True, grid_row=0, grid_col=0):
-        found = self._find_tool_path(tool)
-        status_color = GREEN if found else RED
-        status_text = self.t("found") if found else self.t("not_found")
-
-        CARD_SIZE = 180 + (self.font_size - 8) * 10  # scales from ~180 to ~280
-
-        card = tk.Frame(parent, bg=CARD_BG, highlightbackground=BORDER,
-                        highlightthickness=1, width=CARD_SIZE, height=CARD_SIZE)
-        card.pack_propagate(False)  # enforce fixed size
-
-        if grid:
-            card.grid(row=grid_row, column=grid_col, padx=4, pady=4, sticky="nsew")
-            parent.rowconfigure(grid_row, weight=0)
+        if all_tools:
+            self.tools_empty.pack_forget()
         else:
-            card.pack(fill="x", padx=10, pady=3)
-            card.pack_propagate(True)  # list view can flex
+            self.tools_empty.config(text=self.t("no_results"))
+            self.tools_empty.pack(pady=40, before=self.add_tool_btn)
+        self.add_tool_btn.config(text=self.t("add_tool"))
 
-        inner = tk.Frame(card, bg=CARD_BG, padx=10, pady=8)
-        inner.pack(fill="both", expand=True)
-
-        # Font sizes relative to setting (base=10)
-        fs = self.font_size
-        fs_icon = fs + 4
-        fs_status = max(fs - 3, 6)
-        fs_name = fs
-        fs_desc = max(fs - 2, 7)
-        fs_tag = max(fs - 3, 6)
-        fs_btn = max(fs - 1, 8)
-
-        # Header
-        hdr = tk.Frame(inner, bg=CARD_BG)
-        hdr.pack(fill="x")
-        icon = tool.get("icon", "\U0001f527")
-        tk.Label(hdr, text=icon, font=("Segoe UI", fs_icon), bg=CARD_BG, fg=FG).pack(side="left")
-        tk.Label(hdr, text=f"\u25cf {status_text}", font=("Segoe UI", fs_status), bg=CARD_BG, fg=status_color).pack(side="right")
-
-        # Tool name
-        wrap_card = CARD_SIZE - 25
-        tk.Label(inner, text=tool["name"], font=("Segoe UI", fs_name, "bold"), bg=CARD_BG, fg=FG,
-                 anchor="w", wraplength=wrap_card).pack(fill="x", pady=(2, 0))
-
-        # Description (short in grid, full in list)
-        desc_key = f"desc_{self.lang}"
-        desc = tool.get(desc_key, tool.get("desc_en", ""))
-        if grid:
-            if len(desc) > 80:
-                desc = desc[:77] + "..."
-            wrap = wrap_card
+        if self.view_mode == "grid":
+            self.tools_view.set_items(all_tools, 4, card_size(self.font_size) + 8)
         else:
-            wrap = 900
-        tk.Label(inner, text=desc, font=("Segoe UI", fs_desc), bg=CARD_BG, fg=FG_DIM,
-                 wraplength=wrap, justify="left", anchor="nw").pack(fill="x", pady=(2, 0))
-
-        # Format tags
-        formats = tool.get("formats", [])
-        if formats:
-            fmt_frame = tk.Frame(inner, bg=CARD_BG)
-            fmt_frame.pack(fill="x", pady=(3, 0))
-            for fmt in formats[:4]:  # max 4 tags in square card
-                tk.Label(fmt_frame, text=fmt, font=("Consolas", fs_tag), bg=BG3, fg=CYAN,
-                         padx=3, pady=0).pack(side="left", padx=(0, 2))
-
-        # Related guides (list view only)
-        if not grid:
-            guide_ids = tool.get("guide_ids", [])
-            if guide_ids:
-                gf = tk.Frame(inner, bg=CARD_BG)
-                gf.pack(fill="x", pady=(3, 0))
-                all_guides = self._get_all_guides()
-                for gid in guide_ids:
-                    guide = next((g for g in all_guides if g.get("id") == gid), None)
-                    if guide:
-                        title_key = f"title_{self.lang}"
-                        gtitle = guide.get(title_key, guide.get("title_en", gid))
-                        lbl = tk.Label(gf, text=f"\U0001f4d6 {gtitle}", font=("Segoe UI", fs_desc),
-                                       bg=CARD_BG, fg=BLUE, cursor="hand2")
-                        lbl.pack(side="left", padx=(0, 8))
-                        lbl.bind("<Button-1>", lambda e, g=guide: self._show_guide_preview(g))
-
-        # Spacer to push buttons to bottom
-        spacer = tk.Frame(inner, bg=CARD_BG)
-        spacer.pack(fill="both", expand=True)
-
-        # Action buttons (anchored at bottom)
-        btn_frame = tk.Frame(inner, bg=CARD_BG)
-        btn_frame.pack(fill="x", side="bottom")
-
-        if found:
-            # FOUND: only Launch button
-            tk.Button(btn_frame, text=f"\u25b6 {self.t('launch')}", font=("Segoe UI", fs_btn, "bold"),
-                      bg=GREEN, fg="#111", relief="flat", padx=10, pady=3, cursor="hand2",
-                      command=lambda t=tool: self._launch_tool(t)).pack(side="left")
+            self.tools_view.set_items(all_tools, 1, list_row_height(self.font_size))
+
+    def _search_engine(self, kind):
+        """Tool or guide search engine, rebuilt when its catalog changed."""
+        if kind == "tool":
+            engine, key = self.tool_search, self.catalog.tools_version
+            if engine.key != key:
+                engine.build(self._get_all_tools(), key)
         else:
-            # NOT FOUND: Download + Browse side by side
-            dl = tool.get("download")
-            if dl:
-                tk.Button(btn_frame, text=f"\u2B07 {self.t('download')}", font=("Segoe UI", fs_btn),
-                          bg=ORANGE, fg="#111", relief="flat", padx=10, pady=3, cursor="hand2",
-                          command=lambda u=dl: webbrowser.open(u)).pack(side="left", padx=(0, 4))
-
-            tk.Button(btn_frame, text=f"\U0001f4c2 {self.t('set_path')}", font=("Segoe UI", fs_btn),
-                      bg=BG3, fg=FG, relief="flat", padx=10, pady=3, cursor="hand2",
-                      command=lambda t=tool: self._browse_tool_path(t)).pack(side="left")
-
-        # Custom indicator
-        if tool.get("custom"):
-            tk.Label(btn_frame, text=self.t("custom"), font=("Segoe UI", fs_desc),
-                     bg=CARD_BG, fg=PURPLE).pack(side="right")
+            engine, key = self.guide_search, self.catalog.guides_version
+            if engine.key != key:
+                engine.build(self._get_all_guides(), key)
+        return engine
+
+    def _ranked_search(self, query, kind):
+        return self._search_engine(kind).search(query)
+
+    @PROFILER.timed("_render_tool_card")
+    def _render_tool_card(self, tool, card):
+        if card is None or card.font_size != self.font_size or card.tool != tool:
+            if card:
+                card.destroy()
+            with PROFILER.span("_create_tool_card"):
+                card = ToolCard(self, self.tools_grid, tool)
+        card.tool = tool
+        card.update(self._find_tool_path(tool), self.view_mode == "grid")
+        return card
+
+    @staticmethod
+    def _item_key(item):
+        return item.get("id") or item.get("name")
 
     def _browse_tool_path(self, tool):
         """Let user pick the tool path manually."""
@@ -1019,14 +1144,17 @@ class ModdingHub:
         if path:
             tool_id = tool.get("id") or tool.get("name")
             self.cfg.setdefault("tool_paths", {})[tool_id] = path
-            save_config(self.cfg)
+            self.store.save()
+            self.locator.invalidate(tool_id)
             self._show_tools()
+            self._update_statusbar()
 
     def _add_tool_button(self, parent):
         btn = tk.Button(parent, text=self.t("add_tool"), font=("Segoe UI", 11),
                         bg=BG2, fg=GREEN, relief="flat", padx=16, pady=8, cursor="hand2",
-                        command=self._add_tool_dialog)
+                        command=self._add_tool_dialog, state="normal" if self.ready else "disabled")
         btn.pack(pady=12)
+        return btn
 
     # ────────────────────────────────────────────────────────
     # GUIDES TAB
@@ -1042,108 +1170,168 @@ class ModdingHub:
         self.guide_preview = tk.Frame(pane, bg=BG)
         pane.add(self.guide_preview, minsize=400)
 
-        list_canvas = tk.Canvas(left, bg=BG, highlightthickness=0)
+        self.guides_canvas = list_canvas = tk.Canvas(left, bg=BG, highlightthickness=0)
         list_sb = tk.Scrollbar(left, orient="vertical", command=list_canvas.yview)
         self.guides_list_inner = tk.Frame(list_canvas, bg=BG)
         self.guides_list_inner.bind("<Configure>",
             lambda e: list_canvas.configure(scrollregion=list_canvas.bbox("all")))
-        list_canvas.create_window((0, 0), window=self.guides_list_inner, anchor="nw")
-        list_canvas.configure(yscrollcommand=list_sb.set)
+        list_win_id = list_canvas.create_window((0, 0), window=self.guides_list_inner, anchor="nw")
+
+        def _on_list_scroll(*args):
+            list_sb.set(*args)
+            self.guides_view.schedule_sync()
+        list_canvas.configure(yscrollcommand=_on_list_scroll)
+
+        def _on_list_resize(e):
+            list_canvas.itemconfig(list_win_id, width=e.width)
+            self.guides_view.schedule_sync()
+        list_canvas.bind("<Configure>", _on_list_resize)
+
         list_canvas.pack(side="left", fill="both", expand=True)
         list_sb.pack(side="right", fill="y")
 
         tk.Label(self.guide_preview, text="\U0001f4d6", font=("Segoe UI", 48), bg=BG, fg=BG3).pack(pady=(80, 10))
         tk.Label(self.guide_preview, text=self.t("preview"), font=("Segoe UI", 14), bg=BG, fg=FG_DIM).pack()
 
-        self._show_guides()
+        self.guides_items = tk.Frame(self.guides_list_inner, bg=BG, height=1)
+        self.guides_items.pack(fill="x")
+        self.guides_empty = tk.Label(self.guides_list_inner, font=("Segoe UI", 11), bg=BG, fg=FG_DIM)
+        self.add_guide_btn = tk.Button(self.guides_list_inner, text=self.t("add_guide"),
+                                       font=("Segoe UI", 10), bg=BG2, fg=GREEN, relief="flat",
+                                       padx=12, pady=6, cursor="hand2", command=self._add_guide_dialog,
+                                       state="normal" if self.ready else "disabled")
+        self.add_guide_btn.pack(pady=10)
+        self.guides_view = VirtualGrid(self, "guides", list_canvas, self.guides_items,
+                                       self._render_guide_item)
+
+        self._show_guides(self._current_query())
 
+    @PROFILER.timed("_show_guides")
     def _show_guides(self, query=None):
-        for w in self.guides_list_inner.winfo_children():
-            w.destroy()
+        if not (self.ready and self.guides_built):
+            return
+        self._cancel_render("guides")
+        if query != self._guides_query:
+            self.guides_canvas.yview_moveto(0)
+        self._guides_query = query
 
+        self.catalog.refresh()
         all_guides = self._get_all_guides()
+        self.guides_view.prune(all_guides)
 
         if query:
-            filtered = []
-            for g in all_guides:
-                title = g.get(f"title_{self.lang}", g.get("title_en", ""))
-                tags = " ".join(g.get("tags", []))
-                searchable = f"{title} {tags}".lower()
-                if query in searchable:
-                    filtered.append(g)
-            all_guides = filtered
-
-        if not all_guides:
-            tk.Label(self.guides_list_inner, text=self.t("no_results"),
-                     font=("Segoe UI", 11), bg=BG, fg=FG_DIM).pack(pady=20)
-
-        for guide in all_guides:
-            self._create_guide_item(guide)
-
-        tk.Button(self.guides_list_inner, text=self.t("add_guide"),
-                  font=("Segoe UI", 10), bg=BG2, fg=GREEN, relief="flat",
-                  padx=12, pady=6, cursor="hand2",
-                  command=self._add_guide_dialog).pack(pady=10)
-
-    def _create_guide_item(self, guide):
-        title_key = f"title_{self.lang}"
-        title = guide.get(title_key, guide.get("title_en", ""))
-        icon = guide.get("icon", "\U0001f4d6")
-
-        item = tk.Frame(self.guides_list_inner, bg=CARD_BG, highlightbackground=BORDER,
-                         highlightthickness=1, padx=10, pady=8, cursor="hand2")
-        item.pack(fill="x", padx=6, pady=3)
-
-        tk.Label(item, text=f"{icon}  {title}", font=("Segoe UI", 10, "bold"),
-                 bg=CARD_BG, fg=FG, anchor="w").pack(fill="x")
+            all_guides = search_guides(self._search_engine("guide"), self.guide_index, all_guides, query)
 
-        tags = guide.get("tags", [])
-        if tags:
-            tag_text = " ".join(f"#{t}" for t in tags[:5])
-            tk.Label(item, text=tag_text, font=("Segoe UI", 8), bg=CARD_BG, fg=FG_DIM,
-                     anchor="w").pack(fill="x")
-
-        if guide.get("auto_discovered"):
-            tk.Label(item, text="\U0001f4c2 Auto", font=("Segoe UI", 8),
-                     bg=CARD_BG, fg=GREEN, anchor="w").pack(fill="x")
-        elif guide.get("custom"):
-            tk.Label(item, text=self.t("custom"), font=("Segoe UI", 8),
-                     bg=CARD_BG, fg=PURPLE, anchor="w").pack(fill="x")
-
-        for widget in [item] + item.winfo_children():
-            widget.bind("<Button-1>", lambda e, g=guide: self._show_guide_preview(g))
-            widget.bind("<Double-Button-1>", lambda e, g=guide: self._show_guide_popup(g))
+        if all_guides:
+            self.guides_empty.pack_forget()
+        else:
+            self.guides_empty.config(text=self.t("no_results"))
+            self.guides_empty.pack(pady=20, before=self.add_guide_btn)
+        self.add_guide_btn.config(text=self.t("add_guide"))
+
+        self.guides_view.set_items(all_guides, 1, GUIDE_ROW_HEIGHT)
+        self._guides_shown = all_guides
+        self.guide_cache.prefetch([(g, self.lang) for g in all_guides[:GUIDE_PREFETCH]],
+                                  self.guides_dir)
+
+    def _render_guide_item(self, guide, item):
+        if item is None or item.guide != guide:
+            if item:
+                item.destroy()
+            item = GuideItem(self, self.guides_items, guide)
+        item.guide = guide
+        item.update()
+        return item
 
     def _show_guide_preview(self, guide):
-        for w in self.guide_preview.winfo_children():
-            w.destroy()
+        self._ensure_guides_tab()
+        if self.preview_stream is None:
+            self._build_preview_pane()
 
         title_key = f"title_{self.lang}"
         title = guide.get(title_key, guide.get("title_en", ""))
         icon = guide.get("icon", "\U0001f4d6")
-        content = load_guide_content(guide, self.lang, self.guides_dir)
+        self.preview_title.config(text=f"{icon}  {title}")
+        self.preview_open_btn.config(text=self.t("open_full"),
+                                     command=lambda: self._show_guide_popup(guide))
+        self.preview_find_btn.config(text="\U0001f50d " + self.t("find"))
+        self.preview_text.config(font=("Consolas", self.font_size))
+        self._stream_guide(self.preview_stream, guide)
+        self.preview_find.reset()
+        self.preview_text.yview_moveto(0)
+        self._set_outline(self.preview_outline, guide)
+        self.preview_guide = guide
+        self._prefetch_around(guide)
+
+        self.notebook.select(1)
+
+    def _build_preview_pane(self):
+        """Create the preview header and Text once; later selections reuse them."""
+        for w in self.guide_preview.winfo_children():
+            w.destroy()
 
         hdr = tk.Frame(self.guide_preview, bg=BG2, padx=12, pady=8)
         hdr.pack(fill="x")
-        tk.Label(hdr, text=f"{icon}  {title}", font=("Segoe UI", 13, "bold"),
-                 bg=BG2, fg=FG).pack(side="left")
-        tk.Button(hdr, text=self.t("open_full"), font=("Segoe UI", 9),
-                  bg=BG3, fg=ACCENT, relief="flat", padx=8, pady=2, cursor="hand2",
-                  command=lambda: self._show_guide_popup(guide)).pack(side="right")
-
-        text = tk.Text(self.guide_preview, font=("Consolas", self.font_size), bg=BG, fg=FG,
-                       wrap="word", relief="flat", padx=12, pady=8, insertbackground=FG,
-                       selectbackground=BG3)
-        text.pack(fill="both", expand=True)
-        text.insert("1.0", content)
-        text.config(state="disabled")
-
-        self.notebook.select(1)
+        self.preview_title = tk.Label(hdr, font=("Segoe UI", 13, "bold"), bg=BG2, fg=FG)
+        self.preview_title.pack(side="left")
+        self.preview_open_btn = tk.Button(hdr, font=("Segoe UI", 9),
+                                          bg=BG3, fg=ACCENT, relief="flat", padx=8, pady=2, cursor="hand2")
+        self.preview_open_btn.pack(side="right")
+        self.preview_find_btn = tk.Button(hdr, text="\U0001f50d " + self.t("find"), font=("Segoe UI", 9),
+                                          bg=BG3, fg=FG, relief="flat", padx=8, pady=2, cursor="hand2")
+        self.preview_find_btn.pack(side="right", padx=6)
+
+        self.preview_text = tk.Text(self.guide_preview, font=("Consolas", self.font_size), bg=BG, fg=FG,
+                                    wrap="word", relief="flat", padx=12, pady=8, insertbackground=FG,
+                                    selectbackground=BG3)
+        self.preview_stream = GuideStream(self.preview_text)
+        self.preview_outline = GuideOutline(self.guide_preview, self.preview_text, self.preview_stream)
+        self.preview_find = FindBar(self, self.guide_preview, self.preview_text, self.preview_stream)
+        self.preview_find_btn.config(command=self.preview_find.show)
+        self.preview_text.pack(side="right", fill="both", expand=True)
+
+    def _set_outline(self, outline, guide):
+        """Fill an outline with the guide's cached sections; hide it if there are none."""
+        outline.set(self.guide_cache.sections(guide, self.lang, self.guides_dir))
+        if outline.sections:
+            outline.listbox.pack(side="left", fill="y", before=outline.text)
+        else:
+            outline.listbox.pack_forget()
+
+    def _reload_preview_lang(self, old_lang):
+        """Re-show the previewed guide in the current language at the same section."""
+        guide = self.preview_guide
+        index = self.preview_outline.current()
+        self._show_guide_preview(guide)
+        if index is None or not self.preview_outline.sections:
+            return
+        old = self.guide_cache.sections(guide, old_lang, self.guides_dir)
+        target = align_section(old, index, self.preview_outline.sections)
+        if target is not None:
+            self.preview_outline.jump(target)
+
+    def _stream_guide(self, stream, guide):
+        """Load a guide into a stream: huge files are paged, the rest comes from the cache."""
+        path = guide_file(guide, self.lang, self.guides_dir)
+        if path and os.path.getsize(path) > MMAP_THRESHOLD:
+            stream.load(path=path)
+        else:
+            stream.load(self.guide_cache.get(guide, self.lang, self.guides_dir))
+
+    def _prefetch_around(self, guide):
+        """Warm the cache for what the user is likely to open next:
+        this guide in the other language, then its neighbours in the list."""
+        other = "de" if self.lang == "en" else "en"
+        likely = [(guide, other)]
+        shown = self._guides_shown
+        if guide in shown:
+            i = shown.index(guide)
+            likely += [(g, self.lang) for g in shown[i + 1:i + 3] + shown[max(i - 1, 0):i]]
+        self.guide_cache.prefetch(likely, self.guides_dir)
 
     def _show_guide_popup(self, guide):
         title_key = f"title_{self.lang}"
         title = guide.get(title_key, guide.get("title_en", ""))
-        content = load_guide_content(guide, self.lang, self.guides_dir)
 
         popup = tk.Toplevel(self.root)
         popup.title(title)
@@ -1162,144 +1350,202 @@ class ModdingHub:
                        wrap="word", relief="flat", padx=16, pady=12,
                        selectbackground=BG3)
         sb = tk.Scrollbar(popup, command=text.yview)
-        text.configure(yscrollcommand=sb.set)
         sb.pack(side="right", fill="y")
-        text.pack(fill="both", expand=True)
-        text.insert("1.0", content)
-        text.config(state="disabled")
+        text.pack(side="right", fill="both", expand=True)
+        stream = GuideStream(text, sb)
+        self._stream_guide(stream, guide)
+        self._set_outline(GuideOutline(popup, text, stream), guide)
+        find = FindBar(self, popup, text, stream)
+        popup.bind("<Control-f>", lambda e: find.show())
+        popup.bind("<Destroy>", lambda e: stream.cancel() if e.widget is popup else None)
 
     # ────────────────────────────────────────────────────────
     # TOOL MANAGEMENT
     # ────────────────────────────────────────────────────────
     def _get_all_tools(self):
-        tools = list(BUILTIN_TOOLS)
-        for ut in self.cfg.get("user_tools", []):
-            ut["custom"] = True
-            tools.append(ut)
-        return tools
+        return self.catalog.tools
 
     def _get_all_guides(self):
-        guides = list(BUILTIN_GUIDES)
-        for ug in self.cfg.get("user_guides", []):
-            ug["custom"] = True
-            guides.append(ug)
-        # Auto-discover new guides from folder
-        discovered = self._scan_guides_folder(guides)
-        guides.extend(discovered)
-        return guides
-
-    def _scan_guides_folder(self, existing_guides):
-        """Scan guides folder for .txt/.md files not yet registered."""
-        if not os.path.isdir(self.guides_dir):
-            return []
-
-        # Collect all filenames already known by built-in/user guides
-        known_files = set()
-        for g in existing_guides:
-            for key in ("file_en", "file_de"):
-                if key in g and g[key]:
-                    known_files.add(g[key].lower())
-
-        # Scan folder
-        found_files = {}
-        for fname in os.listdir(self.guides_dir):
-            if not fname.lower().endswith((".txt", ".md")):
-                continue
-            if fname.lower() in known_files:
-                continue
-            # Group by base name (strip _en/_de suffix)
-            base = fname
-            lang_suffix = None
-            name_no_ext = os.path.splitext(fname)[0]
-            if name_no_ext.endswith("_en"):
-                base = name_no_ext[:-3]
-                lang_suffix = "en"
-            elif name_no_ext.endswith("_de"):
-                base = name_no_ext[:-3]
-                lang_suffix = "de"
-            else:
-                base = name_no_ext
-                lang_suffix = "en"  # default: treat as English
-
-            if base not in found_files:
-                found_files[base] = {"en": None, "de": None}
-            found_files[base][lang_suffix] = fname
-
-        # Create guide entries
-        discovered = []
-        for base, files in found_files.items():
-            # Make a readable title from the filename
-            title = base.replace("_", " ").replace("-", " ").strip()
-            title = " ".join(w.capitalize() for w in title.split())
-
-            guide = {
-                "id": f"auto_{base.lower()}",
-                "title_en": title,
-                "title_de": title,
-                "icon": "\U0001f4c4",
-                "tags": [t.lower() for t in base.replace("-", "_").split("_") if len(t) > 2],
-                "tool_ids": [],
-                "custom": True,
-                "auto_discovered": True,
-            }
-
-            if files["en"]:
-                guide["file_en"] = files["en"]
-            if files["de"]:
-                guide["file_de"] = files["de"]
-
-            # If only one language exists, use it for both
-            if files["en"] and not files["de"]:
-                guide["file_de"] = files["en"]
-            elif files["de"] and not files["en"]:
-                guide["file_en"] = files["de"]
-
-            discovered.append(guide)
-
-        return discovered
+        return self.catalog.guides
 
+    @PROFILER.timed("_find_tool_path")
     def _find_tool_path(self, tool):
-        saved = self.cfg.get("tool_paths", {}).get(tool.get("id") or tool.get("name"))
-        if saved and os.path.exists(saved):
-            return saved
-
-        filename = tool.get("filename", "")
-        if not filename:
-            return None
-
-        local = os.path.join(SCRIPT_DIR, filename)
-        if os.path.exists(local):
-            return local
-
-        for sp in tool.get("search_paths", []):
-            check = os.path.normpath(os.path.join(SCRIPT_DIR, sp, filename))
-            if os.path.exists(check):
-                return check
-
-        cp = tool.get("tool_path")
-        if cp and os.path.exists(cp):
-            return cp
+        return self.locator.find(tool, self.cfg.get("tool_paths", {}))
 
-        return None
+    def _rescan_tools(self):
+        """Re-probe tools whose folders changed since they were last located."""
+        if not self.ready:
+            return
+        if self.locator.revalidate():
+            self._show_tools(self._tools_query)
+            self._update_statusbar()
+        self._start_discovery()
+
+    def _start_discovery(self):
+        self.scanner.start(workspace_roots(self.cfg), self._get_all_tools(),
+                           max_depth=self.cfg.get("discovery_depth", DEFAULT_DISCOVERY_DEPTH),
+                           ignore=self.cfg.get("discovery_ignore", []))
+        self._poll_discovery()
+
+    def _poll_discovery(self):
+        """Stream scan hits into the cards and status bar as they arrive."""
+        if self._discovery_job is not None:
+            # A rescan restarts polling: replace the pending tick, never add a second chain
+            self.root.after_cancel(self._discovery_job)
+            self._discovery_job = None
+        changed = False
+        for tool_id, path, depth in self.scanner.drain():
+            changed |= self.locator.add_discovered(tool_id, path, depth)
+        if changed:
+            self._show_tools(self._tools_query)
+            self._update_statusbar()
+        if not self.scanner.done:
+            self._discovery_job = self.root.after(DISCOVERY_POLL_MS, self._poll_discovery)
 
     def _launch_tool(self, tool):
         path = self._find_tool_path(tool)
+        if path and not os.path.exists(path):
+            # Moved or deleted since it was cached: look again before giving up
+            self.locator.invalidate(tool.get("id") or tool.get("name"))
+            path = self._find_tool_path(tool)
+            self._show_tools(self._tools_query)
+            self._update_statusbar()
         if not path:
             messagebox.showerror("Error", f"Tool not found: {tool.get('filename', '?')}")
             return
 
         try:
-            if tool.get("type") == "python" or path.endswith(".py"):
-                subprocess.Popen([sys.executable, path], cwd=os.path.dirname(path))
-            else:
-                subprocess.Popen([path], cwd=os.path.dirname(path))
+            self.supervisor.launch(tool, path)
+        except LaunchLimitError as e:
+            messagebox.showwarning(self.t("limit_reached"),
+                                   f"{tool.get('name', '?')}: {self.t('limit_reached')} ({e.limit}x)")
+            return
         except Exception as e:
             messagebox.showerror("Launch Error", str(e))
+            return
+        self._supervise()
+
+    # ────────────────────────────────────────────────────────
+    # RUNNING TOOLS
+    # ────────────────────────────────────────────────────────
+    def _supervise(self):
+        """Reap and sample launched tools; re-arms itself only while any are running."""
+        if self._supervise_job is not None:
+            # Called directly after a launch/kill: replace the pending tick, never add a second chain
+            self.root.after_cancel(self._supervise_job)
+            self._supervise_job = None
+        finished = self.supervisor.poll()
+        count = len(self.supervisor.running)
+        self.running_btn.config(text=f"\u25b6 {self.t('running')}: {count}")
+        if self._running_win is not None and self._running_win.winfo_exists():
+            self._refresh_running()
+            if finished:
+                self._refresh_usage()
+        if count:
+            self._supervise_job = self.root.after(SUPERVISOR_POLL_MS, self._supervise)
+
+    def _show_running(self):
+        if self._running_win is not None and self._running_win.winfo_exists():
+            self._running_win.lift()
+            return
+        win = self._running_win = tk.Toplevel(self.root)
+        win.title(self.t("running"))
+        win.geometry("720x520")
+        win.configure(bg=BG)
+
+        style = ttk.Style()
+        style.configure("Diag.Treeview", background=BG2, fieldbackground=BG2, foreground=FG,
+                        font=("Consolas", 9), rowheight=20, borderwidth=0)
+        style.configure("Diag.Treeview.Heading", background=BG3, foreground=FG,
+                        font=("Segoe UI", 9, "bold"))
+
+        columns = ("pid", "uptime", "cpu", "memory", "window")
+        tree = self._running_tree = ttk.Treeview(win, columns=columns, style="Diag.Treeview",
+                                                 selectmode="browse")
+        tree.heading("#0", text="Tool", anchor="w")
+        tree.column("#0", width=220, anchor="w")
+        for col, title in zip(columns, ("PID", self.t("uptime"), "CPU %", self.t("memory"),
+                                        self.t("first_window"))):
+            tree.heading(col, text=title, anchor="e")
+            tree.column(col, width=75, anchor="e")
+        tree.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+        btns = tk.Frame(win, bg=BG)
+        btns.pack(fill="x", padx=10, pady=8)
+
+        # Per-tool history from the usage log
+        tk.Label(win, text=self.t("usage_stats"), font=("Segoe UI", 10, "bold"), bg=BG, fg=ACCENT,
+                 anchor="w").pack(fill="x", padx=10)
+        columns = ("launches", "start50", "start95", "run50", "run95", "peak", "failed")
+        stats = self._usage_tree = ttk.Treeview(win, columns=columns, style="Diag.Treeview")
+        stats.heading("#0", text="Tool", anchor="w")
+        stats.column("#0", width=200, anchor="w")
+        for col, title in zip(columns, (self.t("launches"), "Start p50", "Start p95", "Run p50", "Run p95",
+                                        self.t("memory"), self.t("failed"))):
+            stats.heading(col, text=title, anchor="e")
+            stats.column(col, width=68, anchor="e")
+        stats.pack(fill="both", expand=True, padx=10, pady=(4, 10))
+
+        def selected():
+            sel = tree.selection()
+            return next((rt for rt in self.supervisor.running if str(rt.pid) in sel), None)
+
+        def kill():
+            rt = selected()
+            if rt:
+                self.supervisor.kill(rt)
+                self._supervise()
+
+        def restart():
+            rt = selected()
+            if not rt:
+                return
+            try:
+                self.supervisor.restart(rt)
+            except Exception as e:
+                messagebox.showerror("Launch Error", str(e), parent=win)
+            self._supervise()
+
+        for key, command in (("kill", kill), ("restart", restart)):
+            tk.Button(btns, text=self.t(key), font=("Segoe UI", 9), bg=BG3, fg=FG,
+                      relief="flat", padx=8, pady=2, cursor="hand2",
+                      command=command).pack(side="left", padx=(0, 6))
+        self._refresh_usage()
+        self._supervise()
+
+    def _refresh_running(self):
+        tree = self._running_tree
+        keep = tree.selection()
+        tree.delete(*tree.get_children())
+        for rt in self.supervisor.running:
+            minutes, seconds = divmod(int(rt.uptime), 60)
+            cpu = "-" if rt.cpu_percent is None else f"{rt.cpu_percent:.0f}"
+            mem = "-" if rt.rss is None else f"{rt.rss / 1048576:,.0f} MB"
+            shown = "-" if rt.first_window is None else f"{rt.first_window * 1000:.0f} ms"
+            tree.insert("", "end", iid=str(rt.pid), text=f"{rt.tool.get('icon', '')} {rt.tool.get('name', '?')}",
+                        values=(rt.pid, f"{minutes}:{seconds:02d}", cpu, mem, shown))
+        tree.selection_set([iid for iid in keep if tree.exists(iid)])
+
+    def _refresh_usage(self):
+        tree = self._usage_tree
+        tree.delete(*tree.get_children())
+        names = {tool.get("id") or tool.get("name"): tool.get("name") for tool in self._get_all_tools()}
+
+        def fmt(value, pattern):
+            return "-" if value is None else pattern.format(value)
+
+        for tool_id, st in sorted(self.usage.stats().items(), key=lambda kv: -kv[1]["launches"]):
+            tree.insert("", "end", text=names.get(tool_id, tool_id),
+                        values=(st["launches"], fmt(st["start_p50_ms"], "{:,.0f} ms"),
+                                fmt(st["start_p95_ms"], "{:,.0f} ms"), fmt(st["run_p50_s"], "{:,.1f} s"),
+                                fmt(st["run_p95_s"], "{:,.1f} s"), fmt(st["peak_mb"], "{:,.0f} MB"),
+                                st["failed"]))
 
     # ────────────────────────────────────────────────────────
     # ADD TOOL DIALOG
     # ────────────────────────────────────────────────────────
     def _add_tool_dialog(self):
+        if not self.ready:
+            return  # the startup load is still filling the catalog and locator
         dlg = tk.Toplevel(self.root)
         dlg.title(self.t("add_tool"))
         dlg.geometry("550x520")
@@ -1340,7 +1586,7 @@ class ModdingHub:
                 messagebox.showwarning("Warning", "Name required")
                 return
 
-            tool = {
+            tool = self.catalog.add_tool({
                 "id": name.lower().replace(" ", "_"),
                 "name": name,
                 "icon": "\U0001f527",
@@ -1353,13 +1599,14 @@ class ModdingHub:
                 "download": fields["download"].get().strip() or None,
                 "guide_ids": [],
                 "custom": True,
-            }
-            self.cfg.setdefault("user_tools", []).append(tool)
+            })
             if path:
                 self.cfg.setdefault("tool_paths", {})[tool["id"]] = path
-            save_config(self.cfg)
+            self.store.save()
+            self.locator.invalidate(tool["id"])
             dlg.destroy()
             self._show_tools()
+            self._update_statusbar()
 
         tk.Button(dlg, text=self.t("save"), font=("Segoe UI", 11, "bold"),
                   bg=GREEN, fg="#111", relief="flat", padx=16, pady=6, cursor="hand2",
@@ -1369,6 +1616,8 @@ class ModdingHub:
     # ADD GUIDE DIALOG
     # ────────────────────────────────────────────────────────
     def _add_guide_dialog(self):
+        if not self.ready:
+            return  # the startup load is still filling the catalog
         dlg = tk.Toplevel(self.root)
         dlg.title(self.t("add_guide"))
         dlg.geometry("650x650")
@@ -1438,7 +1687,7 @@ class ModdingHub:
                 return
             content_en = fields["content_en"].get("1.0", "end").strip()
             content_de = fields["content_de"].get("1.0", "end").strip()
-            guide = {
+            self.catalog.add_guide({
                 "id": title_en.lower().replace(" ", "_"),
                 "title_en": title_en,
                 "title_de": fields["title_de"].get().strip() or title_en,
@@ -1448,10 +1697,10 @@ class ModdingHub:
                 "content_en": content_en or title_en,
                 "content_de": content_de or content_en or title_en,
                 "custom": True,
-            }
-            self.cfg.setdefault("user_guides", []).append(guide)
-            save_config(self.cfg)
+            })
+            self.store.save()
             dlg.destroy()
+            self._refresh_guide_index()
             self._show_guides()
 
         tk.Button(dlg, text=self.t("save"), font=("Segoe UI", 11, "bold"),
@@ -1523,6 +1772,26 @@ class ModdingHub:
                   padx=6, cursor="hand2",
                   command=lambda: guides_var.set(filedialog.askdirectory() or guides_var.get())).pack(side="left")
 
+        # Workspace folders searched in the background (";"-separated)
+        row5 = tk.Frame(gen_frame, bg=BG)
+        row5.pack(fill="x", pady=4)
+        tk.Label(row5, text=self.t("workspace_roots"), font=("Segoe UI", 10), bg=BG, fg=FG, width=20, anchor="w").pack(side="left")
+        roots_var = tk.StringVar(value="; ".join(self.cfg.get("workspace_roots", DEFAULT_WORKSPACE_ROOTS)))
+        tk.Entry(row5, textvariable=roots_var, font=("Segoe UI", 9), bg=BG2, fg=FG,
+                 insertbackground=FG, relief="flat", width=35).pack(side="left", padx=8)
+        tk.Button(row5, text="+", font=("Segoe UI", 9), bg=BG3, fg=FG, relief="flat",
+                  padx=6, cursor="hand2",
+                  command=lambda: roots_var.set("; ".join(
+                      r for r in (roots_var.get().strip(), filedialog.askdirectory()) if r))).pack(side="left")
+
+        # Keep a pre-started interpreter for Python tools; most used tools first
+        warm_var = tk.BooleanVar(value=self.cfg.get("warm_launch", False))
+        usage_var = tk.BooleanVar(value=self.cfg.get("sort_by_usage", False))
+        for key, var in (("warm_launch", warm_var), ("sort_by_usage", usage_var)):
+            tk.Checkbutton(gen_frame, text=self.t(key), variable=var, font=("Segoe UI", 10),
+                           bg=BG, fg=FG, selectcolor=BG2, activebackground=BG, activeforeground=FG,
+                           anchor="w").pack(fill="x", pady=4)
+
         # ─── Tool Paths ───
         tk.Label(dlg, text=f"\U0001f527  {self.t('tool_paths_mgmt')}", font=("Segoe UI", 13, "bold"),
                  bg=BG, fg=ACCENT).pack(anchor="w", padx=16, pady=(16, 8))
@@ -1572,6 +1841,10 @@ class ModdingHub:
             self.cfg["font_size"] = self.font_size
             self.cfg["view_mode"] = self.view_mode
             self.cfg["guides_dir"] = self.guides_dir
+            self.cfg["workspace_roots"] = [r.strip() for r in roots_var.get().split(";") if r.strip()]
+            self.cfg["warm_launch"] = warm_var.get()
+            self.cfg["sort_by_usage"] = usage_var.get()
+            self.supervisor.set_warm(warm_var.get())
 
             # Save tool paths
             for tool_id, pv in path_vars.items():
@@ -1581,8 +1854,13 @@ class ModdingHub:
                 else:
                     self.cfg.get("tool_paths", {}).pop(tool_id, None)
 
-            save_config(self.cfg)
+            self.store.save()
+            self.locator.invalidate()
+            self.catalog.set_guides_dir(self.guides_dir)
             dlg.destroy()
+            self._refresh_guide_index()
+            self._update_statusbar()
+            self._start_discovery()
             self.lang_btn.config(text="DE" if self.lang == "en" else "EN")
             self._refresh_ui()
 
@@ -1605,20 +1883,433 @@ class ModdingHub:
         text.insert("1.0", CREDITS.get(self.lang, CREDITS["en"]))
         text.config(state="disabled")
 
+    # ────────────────────────────────────────────────────────
+    # DIAGNOSTICS
+    # ────────────────────────────────────────────────────────
+    def _show_diagnostics(self):
+        if self._diag_win is not None and self._diag_win.winfo_exists():
+            self._diag_win.lift()
+            return
+        win = self._diag_win = tk.Toplevel(self.root)
+        win.title(self.t("diagnostics"))
+        win.geometry("620x460")
+        win.configure(bg=BG)
+
+        style = ttk.Style()
+        style.configure("Diag.Treeview", background=BG2, fieldbackground=BG2, foreground=FG,
+                        font=("Consolas", 9), rowheight=20, borderwidth=0)
+        style.configure("Diag.Treeview.Heading", background=BG3, foreground=FG,
+                        font=("Segoe UI", 9, "bold"))
+
+        counters = tk.Label(win, font=("Consolas", 9), bg=BG, fg=CYAN, anchor="w", justify="left")
+        counters.pack(fill="x", padx=10, pady=(10, 4))
+
+        columns = ("calls", "p50", "p95", "max", "total")
+        tree = ttk.Treeview(win, columns=columns, style="Diag.Treeview")
+        tree.heading("#0", text=self.t("diag_span"), anchor="w")
+        tree.column("#0", width=200, anchor="w")
+        for col, title in zip(columns, (self.t("diag_calls"), "p50 ms", "p95 ms", "max ms", "total ms")):
+            tree.heading(col, text=title, anchor="e")
+            tree.column(col, width=80, anchor="e")
+        tree.pack(fill="both", expand=True, padx=10)
+
+        btns = tk.Frame(win, bg=BG)
+        btns.pack(fill="x", padx=10, pady=8)
+        status = tk.Label(btns, font=("Segoe UI", 8), bg=BG, fg=FG_DIM, anchor="w")
+
+        def export(kind):
+            if kind == "json":
+                path = filedialog.asksaveasfilename(parent=win, defaultextension=".json",
+                                                    initialfile="tw1hub_profile.json",
+                                                    filetypes=[("JSON", "*.json")])
+            else:
+                path = filedialog.asksaveasfilename(parent=win, defaultextension=".prof",
+                                                    initialfile="tw1hub_profile.prof",
+                                                    filetypes=[("cProfile", "*.prof"), ("All", "*.*")])
+            if not path:
+                return
+            try:
+                if kind == "json":
+                    PROFILER.export_json(path)
+                else:
+                    PROFILER.export_cprofile(path)
+                status.config(text=f"{self.t('diag_saved')} {path}")
+            except Exception as e:
+                messagebox.showerror("Error", str(e), parent=win)
+
+        for key, command in (("export_json", lambda: export("json")),
+                             ("export_profile", lambda: export("prof")),
+                             ("diag_reset", PROFILER.reset)):
+            btn = tk.Button(btns, text=self.t(key), font=("Segoe UI", 9), bg=BG3, fg=FG,
+                            relief="flat", padx=8, pady=2, cursor="hand2", command=command)
+            btn.pack(side="left", padx=(0, 6))
+            if key == "export_profile" and not PROFILER.cprofile_running:
+                btn.config(state="disabled")
+        status.pack(side="left", fill="x", expand=True, padx=6)
+
+        def refresh():
+            if not win.winfo_exists():
+                return
+            snap = PROFILER.snapshot()
+            parts = [f"{self.t('diag_widgets')}: {self._count_widgets()}"]
+            parts += [f"{name}: {value:,}" for name, value in sorted(snap["counters"].items())]
+            counters.config(text="   ".join(parts))
+            tree.delete(*tree.get_children())
+            for name, st in sorted(snap["spans"].items(), key=lambda kv: -kv[1]["p95_ms"]):
+                tree.insert("", "end", text=name, values=(st["calls"], st["p50_ms"], st["p95_ms"],
+                                                          st["max_ms"], st["total_ms"]))
+            win.after(DIAG_REFRESH_MS, refresh)
+
+        refresh()
+
+    def _count_widgets(self):
+        count, stack = 0, [self.root]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
+
+    # ────────────────────────────────────────────────────────
+    # WORKFLOWS
+    # ────────────────────────────────────────────────────────
+    def _show_workflows(self):
+        if self._workflow_win is not None and self._workflow_win.winfo_exists():
+            self._workflow_win.lift()
+            return
+        from tw1_hub_workflow import WorkflowRunner, WorkflowError, builtin_workflows, workflow_vars
+
+        try:
+            workflows = {w.id: w for w in builtin_workflows()}
+        except WorkflowError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        win = self._workflow_win = tk.Toplevel(self.root)
+        win.title(self.t("workflows"))
+        win.geometry("640x560")
+        win.configure(bg=BG)
+        state = {"runner": None, "waiting": None}
+        events = queue.Queue()
+
+        head = tk.Frame(win, bg=BG)
+        head.pack(fill="x", padx=10, pady=(10, 4))
+        names = {w.title(self.lang): w for w in workflows.values()}
+        choice = tk.StringVar(value=next(iter(names), ""))
+        ttk.Combobox(head, textvariable=choice, values=list(names), state="readonly",
+                     width=30).pack(side="left")
+
+        # Folders and names the steps refer to, saved per workflow in the config
+        vars_frame = tk.Frame(win, bg=BG)
+        vars_frame.pack(fill="x", padx=10, pady=4)
+        var_entries = {}
+
+        style = ttk.Style()
+        style.configure("Diag.Treeview", background=BG2, fieldbackground=BG2, foreground=FG,
+                        font=("Consolas", 9), rowheight=20, borderwidth=0)
+        style.configure("Diag.Treeview.Heading", background=BG3, foreground=FG,
+                        font=("Segoe UI", 9, "bold"))
+        columns = ("kind", "state", "time")
+        tree = ttk.Treeview(win, columns=columns, style="Diag.Treeview", selectmode="none")
+        tree.heading("#0", text=self.t("workflow_step"), anchor="w")
+        tree.column("#0", width=300, anchor="w")
+        for col, title, width in zip(columns, ("", self.t("workflow_state"), "s"), (70, 110, 70)):
+            tree.heading(col, text=title, anchor="e")
+            tree.column(col, width=width, anchor="e")
+        tree.pack(fill="both", expand=True, padx=10, pady=4)
+
+        # Manual steps: what to do, the tool to do it with, and "done"
+        manual = tk.Label(win, font=("Consolas", 9), bg=BG2, fg=CYAN, anchor="w", justify="left")
+        manual_btns = tk.Frame(win, bg=BG)
+        btns = tk.Frame(win, bg=BG)
+        btns.pack(fill="x", padx=10, pady=8, side="bottom")
+
+        def workflow():
+            return names[choice.get()]
+
+        def show(*_):
+            for child in vars_frame.winfo_children():
+                child.destroy()
+            var_entries.clear()
+            wf = workflow()
+            saved = self.cfg.get("workflow_vars", {}).get(wf.id, {})
+            for row, (key, default) in enumerate(wf.vars.items()):
+                tk.Label(vars_frame, text=key, font=("Segoe UI", 9), bg=BG, fg=FG_DIM,
+                         anchor="w", width=8).grid(row=row, column=0, sticky="w")
+                var = var_entries[key] = tk.StringVar(value=saved.get(key, default))
+                tk.Entry(vars_frame, textvariable=var, font=("Segoe UI", 9), bg=BG2, fg=FG,
+                         insertbackground=FG, relief="flat", width=60).grid(row=row, column=1, sticky="we", pady=1)
+            tree.delete(*tree.get_children())
+            for step in wf.order():
+                tree.insert("", "end", iid=step.id, text=step.name(self.lang), values=(step.kind, "", ""))
+
+        def on_event(step_id, step_state, seconds, message):
+            events.put((step_id, step_state, seconds, message))   # worker thread: hand over to Tk
+
+        def poll():
+            if not win.winfo_exists():
+                return
+            while True:
+                try:
+                    item = events.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    state["runner"] = None
+                    run_btn.config(state="normal")
+                    continue
+                step_id, step_state, seconds, message = item
+                tree.set(step_id, "state", self.t(f"wf_{step_state}"))
+                if seconds is not None:
+                    tree.set(step_id, "time", f"{seconds:.2f}")
+                if step_state == "waiting":
+                    state["waiting"] = workflow().by_id[step_id]
+                    manual.config(text=message)
+                    manual.pack(fill="x", padx=10, pady=(4, 0))
+                    manual_btns.pack(fill="x", padx=10, pady=4)
+                elif state["waiting"] is not None and state["waiting"].id == step_id:
+                    state["waiting"] = None
+                    manual.pack_forget()
+                    manual_btns.pack_forget()
+                if step_state == "failed" and message:
+                    messagebox.showerror(self.t("wf_failed"), f"{workflow().by_id[step_id].name(self.lang)}\n\n{message}",
+                                         parent=win)
+            if state["runner"] is not None:
+                win.after(WORKFLOW_POLL_MS, poll)
+
+        def run():
+            wf = workflow()
+            entered = {key: var.get().strip() for key, var in var_entries.items()}
+            self.cfg.setdefault("workflow_vars", {})[wf.id] = entered
+            self.store.save()
+            for step in wf.steps:
+                tree.set(step.id, "state", "")
+                tree.set(step.id, "time", "")
+            runner = state["runner"] = WorkflowRunner(wf, workflow_vars(wf, self.cfg), on_event=on_event)
+
+            def work():
+                try:
+                    runner.run()
+                except WorkflowError as e:
+                    print(f"Workflow error: {e}")
+                finally:
+                    events.put(None)       # always end the poll loop and re-enable Run
+
+            run_btn.config(state="disabled")
+            threading.Thread(target=work, name="tw1hub-workflow", daemon=True).start()
+            win.after(WORKFLOW_POLL_MS, poll)
+
+        def open_tool():
+            step = state["waiting"]
+            tool = self.catalog.tool(step.tool) if step and step.tool else None
+            if tool is not None:
+                self._launch_tool(tool)
+
+        def confirm():
+            if state["runner"] is not None and state["waiting"] is not None:
+                state["runner"].confirm(state["waiting"].id)
+
+        def cancel():
+            if state["runner"] is not None:
+                state["runner"].cancel()
+
+        self._run_cancels["workflow"] = cancel
+
+        for key, command in (("open_tool", open_tool), ("wf_confirm", confirm)):
+            tk.Button(manual_btns, text=self.t(key), font=("Segoe UI", 9), bg=BG3, fg=FG,
+                      relief="flat", padx=8, pady=2, cursor="hand2",
+                      command=command).pack(side="left", padx=(0, 6))
+        run_btn = tk.Button(btns, text="\u25b6 " + self.t("wf_run"), font=("Segoe UI", 9, "bold"), bg=GREEN,
+                            fg="#111", relief="flat", padx=10, pady=2, cursor="hand2", command=run)
+        run_btn.pack(side="left", padx=(0, 6))
+        tk.Button(btns, text=self.t("cancel"), font=("Segoe UI", 9), bg=BG3, fg=FG, relief="flat",
+                  padx=8, pady=2, cursor="hand2", command=cancel).pack(side="left")
+        choice.trace_add("write", show)
+        show()
+
+        def close():
+            cancel()   # a manual step may be waiting on this window
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", close)
+
+    # ────────────────────────────────────────────────────────
+    # BATCH RUNS
+    # ────────────────────────────────────────────────────────
+    def _show_batch(self):
+        if self._batch_win is not None and self._batch_win.winfo_exists():
+            self._batch_win.lift()
+            return
+        from tw1_hub_batch import BATCH_WORKERS, BATCH_TIMEOUT_S, BATCH_RETRIES, BatchRun, batch_inputs
+
+        tools = {t["name"]: t for t in self._get_all_tools() if batch_inputs(t) and self._find_tool_path(t)}
+        if not tools:
+            messagebox.showinfo(self.t("batch"), self.t("batch_none"))
+            return
+        win = self._batch_win = tk.Toplevel(self.root)
+        win.title(self.t("batch"))
+        win.geometry("560x340")
+        win.configure(bg=BG)
+        state = {"run": None}
+        progress = queue.Queue()
+
+        form = tk.Frame(win, bg=BG)
+        form.pack(fill="x", padx=12, pady=(12, 4))
+        saved = self.cfg.get("batch", {})
+        tool_var = tk.StringVar(value=saved.get("tool") if saved.get("tool") in tools else next(iter(tools)))
+        folder_var = tk.StringVar(value=saved.get("folder", ""))
+        glob_var = tk.StringVar(value=saved.get("glob", "**/*"))
+        jobs_var = tk.IntVar(value=saved.get("jobs", BATCH_WORKERS))
+        timeout_var = tk.IntVar(value=saved.get("timeout", int(BATCH_TIMEOUT_S)))
+        retries_var = tk.IntVar(value=saved.get("retries", BATCH_RETRIES))
+        fresh_var = tk.BooleanVar(value=False)
+
+        def row(key, widget, r):
+            tk.Label(form, text=self.t(key), font=("Segoe UI", 9), bg=BG, fg=FG_DIM,
+                     anchor="w", width=14).grid(row=r, column=0, sticky="w", pady=2)
+            widget.grid(row=r, column=1, sticky="w", pady=2)
+
+        row("batch_tool", ttk.Combobox(form, textvariable=tool_var, values=list(tools),
+                                       state="readonly", width=36), 0)
+        folder_row = tk.Frame(form, bg=BG)
+        tk.Entry(folder_row, textvariable=folder_var, font=("Segoe UI", 9), bg=BG2, fg=FG,
+                 insertbackground=FG, relief="flat", width=40).pack(side="left")
+        tk.Button(folder_row, text="...", font=("Segoe UI", 9), bg=BG3, fg=FG, relief="flat", padx=6,
+                  cursor="hand2", command=lambda: folder_var.set(
+                      filedialog.askdirectory(parent=win) or folder_var.get())).pack(side="left", padx=4)
+        row("batch_folder", folder_row, 1)
+        row("batch_glob", tk.Entry(form, textvariable=glob_var, font=("Segoe UI", 9), bg=BG2, fg=FG,
+                                   insertbackground=FG, relief="flat", width=20), 2)
+        for r, (key, var, top) in enumerate((("batch_jobs", jobs_var, 32), ("batch_timeout", timeout_var, 86400),
+                                             ("batch_retries", retries_var, 10)), start=3):
+            row(key, tk.Spinbox(form, from_=0 if key == "batch_retries" else 1, to=top, textvariable=var,
+                                width=7, font=("Segoe UI", 9), bg=BG2, fg=FG, insertbackground=FG,
+                                relief="flat"), r)
+        row("batch_fresh", tk.Checkbutton(form, variable=fresh_var, bg=BG, selectcolor=BG2,
+                                          activebackground=BG), 6)
+
+        bar = ttk.Progressbar(win, mode="determinate")
+        bar.pack(fill="x", padx=12, pady=(8, 2))
+        status = tk.Label(win, font=("Segoe UI", 9), bg=BG, fg=FG_DIM, anchor="w")
+        status.pack(fill="x", padx=12)
+        btns = tk.Frame(win, bg=BG)
+        btns.pack(fill="x", padx=12, pady=10, side="bottom")
+
+        def show(counts):
+            finished = counts["done"] + counts["skipped"] + counts["failed"]
+            bar.config(maximum=max(counts["total"], 1), value=finished)
+            status.config(text=f"{finished}/{counts['total']}  \u2714 {counts['done']}  "
+                               f"\u21b7 {counts['skipped']}  \u2716 {counts['failed']}")
+
+        def poll():
+            if not win.winfo_exists():
+                return
+            latest = None
+            while True:
+                try:
+                    counts = progress.get_nowait()
+                except queue.Empty:
+                    break
+                if counts is None:
+                    state["run"] = None
+                    start_btn.config(state="normal")
+                    break
+                latest = counts
+            if latest:
+                show(latest)
+            if state["run"] is not None:
+                win.after(WORKFLOW_POLL_MS, poll)
+
+        def number(key, var, low):
+            # An empty or non-numeric Spinbox makes IntVar.get() raise TclError
+            try:
+                value = var.get()
+            except tk.TclError:
+                value = None
+            if value is None or value < low:
+                messagebox.showwarning("Warning", f"{self.t(key)}: {self.t('batch_number').format(min=low)}",
+                                       parent=win)
+                return None
+            return value
+
+        def start():
+            folder = folder_var.get().strip()
+            if not os.path.isdir(folder):
+                messagebox.showerror("Error", f"{self.t('batch_folder')}: {folder}", parent=win)
+                return
+            values = []
+            for key, var, low in (("batch_jobs", jobs_var, 1), ("batch_timeout", timeout_var, 1),
+                                  ("batch_retries", retries_var, 0)):
+                values.append(number(key, var, low))
+                if values[-1] is None:
+                    return
+            jobs, timeout, retries = values
+            tool = tools[tool_var.get()]
+            self.cfg["batch"] = {"tool": tool_var.get(), "folder": folder, "glob": glob_var.get(),
+                                 "jobs": jobs, "timeout": timeout, "retries": retries}
+            self.store.save()
+            run = state["run"] = BatchRun(tool, self._find_tool_path(tool), folder, glob_var.get() or "**/*",
+                                          workers=jobs, timeout=timeout,
+                                          retries=retries, fresh=fresh_var.get(),
+                                          on_progress=lambda job, counts: progress.put(counts))
+            state["log"] = run.log_path
+            show(run.counts)
+
+            def work():
+                try:
+                    run.run()
+                except OSError as e:
+                    print(f"Batch error: {e}")
+                finally:
+                    progress.put(dict(run.counts))
+                    progress.put(None)
+
+            start_btn.config(state="disabled")
+            threading.Thread(target=work, name="tw1hub-batch", daemon=True).start()
+            win.after(WORKFLOW_POLL_MS, poll)
+
+        def cancel():
+            if state["run"] is not None:
+                state["run"].cancel()
+
+        self._run_cancels["batch"] = cancel
+
+        def open_log():
+            path = state.get("log")
+            if not path or not os.path.exists(path):
+                return
+            if hasattr(os, "startfile"):
+                os.startfile(path)
+            else:
+                webbrowser.open("file://" + path)
+
+        def close():
+            cancel()
+            win.destroy()
+
+        start_btn = tk.Button(btns, text="\u25b6 " + self.t("batch_start"), font=("Segoe UI", 9, "bold"),
+                              bg=GREEN, fg="#111", relief="flat", padx=10, pady=2, cursor="hand2", command=start)
+        start_btn.pack(side="left", padx=(0, 6))
+        for key, command in (("cancel", cancel), ("batch_log", open_log)):
+            tk.Button(btns, text=self.t(key), font=("Segoe UI", 9), bg=BG3, fg=FG, relief="flat",
+                      padx=8, pady=2, cursor="hand2", command=command).pack(side="left", padx=(0, 6))
+        win.protocol("WM_DELETE_WINDOW", close)
+
     # ────────────────────────────────────────────────────────
     # TOGGLE ACTIONS
     # ────────────────────────────────────────────────────────
     def _toggle_lang(self):
         self.lang = "de" if self.lang == "en" else "en"
         self.cfg["lang"] = self.lang
-        save_config(self.cfg)
+        self.store.save()
         self.lang_btn.config(text="DE" if self.lang == "en" else "EN")
         self._refresh_ui()
+        if self.preview_guide is not None:
+            self._reload_preview_lang("de" if self.lang == "en" else "en")
 
     def _toggle_view(self):
         self.view_mode = "list" if self.view_mode == "grid" else "grid"
         self.cfg["view_mode"] = self.view_mode
-        save_config(self.cfg)
+        self.store.save()
         self.view_btn.config(text=self.t("list_view") if self.view_mode == "grid" else self.t("grid_view"))
         self._show_tools()
 
@@ -1641,6 +2332,22 @@ class ModdingHub:
         sb = tk.Frame(self.root, bg=BG2, padx=10, pady=4)
         sb.pack(fill="x", side="bottom")
 
+        self.status_lbl = tk.Label(sb, font=("Segoe UI", 9), bg=BG2, fg=FG_DIM)
+        self.status_lbl.pack(side="left")
+        tk.Label(sb, text=f"v{VERSION}", font=("Segoe UI", 9), bg=BG2, fg=FG_DIM).pack(side="right")
+        tk.Button(sb, text="\u27f3 " + self.t("rescan"), font=("Segoe UI", 8), bg=BG3, fg=FG,
+                  relief="flat", padx=6, pady=0, cursor="hand2",
+                  command=self._rescan_tools).pack(side="right", padx=8)
+        self.running_btn = tk.Button(sb, text=f"\u25b6 {self.t('running')}: 0", font=("Segoe UI", 8),
+                                     bg=BG3, fg=FG, relief="flat", padx=6, pady=0, cursor="hand2",
+                                     command=self._show_running)
+        self.running_btn.pack(side="right")
+        self._update_statusbar()
+
+    def _update_statusbar(self):
+        if not self.ready:
+            self.status_lbl.config(text=self.t("loading"))
+            return
         all_tools = self._get_all_tools()
         found_count = sum(1 for t in all_tools if self._find_tool_path(t))
         total = len(all_tools)
@@ -1648,11 +2355,18 @@ class ModdingHub:
         formats_count = len(FILE_FORMATS)
 
         info = f"{found_count}/{total} tools found  |  {guides_count} guides  |  {formats_count} file formats documented"
-        tk.Label(sb, text=info, font=("Segoe UI", 9), bg=BG2, fg=FG_DIM).pack(side="left")
-        tk.Label(sb, text=f"v{VERSION}", font=("Segoe UI", 9), bg=BG2, fg=FG_DIM).pack(side="right")
+        self.status_lbl.config(text=info)
 
     def _on_close(self):
-        save_config(self.cfg)
+        for job in (self._supervise_job, self._discovery_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        for cancel in self._run_cancels.values():
+            cancel()   # kill their child processes: the worker threads die with the hub
+        self.scanner.cancel()
+        self.supervisor.close()
+        self.guide_cache.close()
+        self.store.close()
         self.root.destroy()
 
 
@@ -1660,6 +2374,10 @@ class ModdingHub:
 # ENTRY POINT
 # ============================================================
 if __name__ == "__main__":
+    if "--profile" in sys.argv[1:]:
+        PROFILER.enable()
+    if PROFILER.enabled:
+        PROFILER.start_cprofile()
     root = tk.Tk()
     app = ModdingHub(root)
     root.mainloop()